@@ -0,0 +1,936 @@
+#!/usr/bin/env python3
+"""
+Self-check for the QA guide tooling against a local PostgREST stub.
+
+No Supabase project or credentials needed: StubPostgREST serves a synthetic
+qa_scenarios table over HTTP with the behaviour the client has to cope with
+(Range paging, Content-Range counts, a max-rows cap, gzip, transient 503s,
+slow responses, the qa_scenario_category_counts view or its absence), and
+each check drives qa_scenarios_client.py or the qa_guide package against it.
+The guide is built with fixture accounts (FIXTURE_ACCOUNTS), not the local
+docs/qa-system/TEST_ACCOUNTS.md, so every check runs in any checkout.
+
+--bench-tables N times create_branded_table against the per-cell
+create_branded_table_cells on an N-row table and prints rows/sec for each.
+--bench-guide N builds the whole guide from N synthetic scenarios and prints
+build time, save time and the size of the .docx and its document.xml.
+--bench-import N prints the median time to import the qa_guide modules, and
+python-docx and requests for comparison, over N fresh interpreters.
+--bench-seed N reads a synthetic N-scenario seed file (escaped quotes,
+comments, parentheses inside literals) with qa_seed_sql and through both
+migration generators, and prints scenarios/sec and MB/sec.
+
+Usage:
+    python3 scripts/check-qa-guide.py
+    python3 scripts/check-qa-guide.py --bench-tables 5000
+    python3 scripts/check-qa-guide.py --bench-guide 620
+    python3 scripts/check-qa-guide.py --bench-import 20
+    python3 scripts/check-qa-guide.py --bench-seed 10000
+Exits 1 if any check fails.
+"""
+
+import argparse
+import contextlib
+import gzip
+import io
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import traceback
+import zipfile
+from datetime import datetime, timedelta, timezone
+from html.parser import HTMLParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import qa_scenarios_client
+from qa_guide import accounts
+from qa_guide.branding import ROLE_DISPLAY
+from qa_guide.scenarios import group_scenarios_by_role, role_data_from_counts
+from qa_guide.sections import render_guide
+from qa_guide.sources import fetch_role_data
+from qa_guide.stream_render import HtmlRenderer, MarkdownRenderer
+
+ROLES = ['admin', 'docente', 'community_manager', 'equipo_directivo',
+         'lider_generacion', 'consultor', 'supervisor_de_red', 'lider_comunidad']
+PREFIXES = ['CA', 'PB', 'SV', 'SNV', 'EC', 'CRUD', 'RLS', 'XX']
+ORIGIN = datetime(2026, 1, 1, tzinfo=timezone.utc)
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# lider_comunidad has no account (the guide prints N/A) and docente has two, of
+# which the first must win.
+FIXTURE_ACCOUNTS = """# Cuentas QA (fixture)
+
+**All accounts use the same password:** `fixture-pass`
+
+| Email | Role | School | Notes |
+|-------|------|--------|-------|
+""" + ''.join(f'| {role}.qa@example.cl | {role} | Escuela QA | fixture |\n' for role in ROLES[:-1]) + \
+    '| otro.docente.qa@example.cl | docente | Escuela QA | duplicate |\n'
+
+
+def synthetic_scenarios(count):
+    """Deterministic rows shaped like the qa_scenarios select used by the guide"""
+    rows = []
+    for i in range(count):
+        rows.append({
+            'id': f'00000000-0000-0000-0000-{i:012d}',
+            # Every tenth name has no '-' at all, which must count as OTHER.
+            'name': f'{PREFIXES[i % len(PREFIXES)]}-{i:02d}: Escenario {i}' if i % 10 else f'Escenario {i}',
+            'role_required': ROLES[(i * 7) % len(ROLES)],
+            'priority': 1 + i % 3,
+            'estimated_duration_minutes': 5,
+            'description': f'Verificar el escenario {i}',
+            'feature_area': 'user_management',
+            'preconditions': [{'type': 'role', 'description': f'Iniciar sesión como {ROLES[(i * 7) % len(ROLES)]}'}],
+            'steps': [
+                {'index': step, 'instruction': f'Paso {step} del escenario {i}', 'expectedOutcome': 'Se muestra & funciona'}
+                for step in range(1, 2 + i % 4)
+            ],
+            'is_active': i % 11 != 0,
+            'automated_only': i % 13 == 0,
+            'updated_at': stamp(i),
+        })
+    return rows
+
+
+def stamp(n):
+    """A PostgREST-style timestamptz, n seconds after a fixed origin"""
+    return (ORIGIN + timedelta(seconds=n, microseconds=n % 1000)).isoformat()
+
+
+class StubPostgREST:
+    """Threaded HTTP server imitating the parts of PostgREST the client relies on"""
+
+    def __init__(self, rows, max_rows=None, fail_first=0, fail_always=False, delay=0.0, views=True):
+        self.rows = rows
+        self.views = views
+        self.max_rows = max_rows
+        self.fail_first = fail_first
+        self.fail_always = fail_always
+        self.delay = delay
+        self.requests = []
+        self.lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):  # noqa: A002 - keep the check output clean
+                pass
+
+            def do_GET(self):
+                # The timeout checks hang up on purpose; a write to the closed socket is expected.
+                with contextlib.suppress(BrokenPipeError, ConnectionResetError):
+                    stub.handle(self)
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}'
+
+    def __enter__(self):
+        serve = threading.Thread(target=self.server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+        serve.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def filtered(self, query):
+        rows = self.rows
+        for column, (condition,) in query.items():
+            if column in ('select', 'order'):
+                continue
+            operator, operand = condition.split('.', 1)
+            if operator == 'eq':
+                rows = [r for r in rows if str(r[column]).lower() == operand]
+            elif operator == 'gte':
+                # ISO strings in one format; NULL matches nothing, as in SQL
+                rows = [r for r in rows if r[column] is not None and r[column] >= operand]
+            elif operator == 'in':
+                wanted = set(operand.strip('()').split(','))
+                rows = [r for r in rows if str(r[column]) in wanted]
+            else:
+                raise ValueError(f'stub does not implement {operator}')
+        if 'order' in query:
+            keys = query['order'][0].split(',')
+            rows = sorted(rows, key=lambda r: tuple(r[k] for k in keys))
+        columns = query.get('select', ['*'])[0]
+        if columns != '*':
+            keep = columns.split(',')
+            rows = [{k: r[k] for k in keep} for r in rows]
+        return rows
+
+    def category_counts(self):
+        """What the view in 20260814120000_qa_scenario_category_counts.sql returns"""
+        counts = {}
+        for row in self.rows:
+            if not row['is_active'] or row['automated_only']:
+                continue
+            prefix = row['name'].split('-', 1)[0].strip() if '-' in row['name'] else None
+            key = (row['role_required'], prefix)
+            counts[key] = counts.get(key, 0) + 1
+        return [
+            {'role_required': role, 'category_prefix': prefix, 'scenario_count': count}
+            for (role, prefix), count in sorted(counts.items(), key=lambda item: (item[0][0], item[0][1] or ''))
+        ]
+
+    def handle(self, request):
+        with self.lock:
+            self.requests.append((request.path, dict(request.headers)))
+            attempt = len(self.requests)
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail_always or attempt <= self.fail_first:
+            self.send(request, 503, b'{"message":"stub unavailable"}', {})
+            return
+
+        parsed = urlparse(request.path)
+        if parsed.path == '/rest/v1/qa_scenarios':
+            rows = self.filtered(parse_qs(parsed.query))
+        elif parsed.path == '/rest/v1/qa_scenario_category_counts' and self.views:
+            rows = self.category_counts()
+        else:
+            body = b'{"code":"PGRST205","message":"Could not find the table in the schema cache"}'
+            self.send(request, 404, body, {})
+            return
+        total = len(rows)
+
+        start, end = 0, total - 1
+        if request.headers.get('Range'):
+            first, last = request.headers['Range'].split('-')
+            start, end = int(first), int(last)
+        if self.max_rows:
+            end = min(end, start + self.max_rows - 1)
+        page = rows[start:end + 1]
+
+        counted = 'count=exact' in (request.headers.get('Prefer') or '')
+        shown = f'{start}-{start + len(page) - 1}' if page else '*'
+        headers = {'Content-Range': f'{shown}/{total if counted else "*"}'}
+        status = 206 if len(page) < total else 200
+        self.send(request, status, json.dumps(page).encode('utf-8'), headers)
+
+    def send(self, request, status, body, headers):
+        if 'gzip' in (request.headers.get('Accept-Encoding') or ''):
+            body = gzip.compress(body)
+            headers = {**headers, 'Content-Encoding': 'gzip'}
+        request.send_response(status)
+        request.send_header('Content-Type', 'application/json')
+        request.send_header('Content-Length', str(len(body)))
+        for key, value in headers.items():
+            request.send_header(key, value)
+        request.end_headers()
+        request.wfile.write(body)
+
+
+def expected_rows(rows):
+    with StubPostgREST(rows) as stub:
+        return stub.filtered({
+            'select': [qa_scenarios_client.SCENARIO_COLUMNS],
+            'order': ['id'],
+            **{k: [v] for k, v in qa_scenarios_client.SCENARIO_FILTERS.items()},
+        })
+
+
+# ---------------------------------------------------------------- checks
+
+def check_paged_fetch_returns_every_row():
+    rows = synthetic_scenarios(5000)
+    with StubPostgREST(rows) as stub:
+        got = qa_scenarios_client.fetch_scenarios(stub.url, 'key', page_size=500)
+    assert got == expected_rows(rows), 'paged rows differ from the filtered table'
+    assert len(stub.requests) == -(-len(got) // 500), f'{len(stub.requests)} requests'
+
+
+def check_concurrent_fetch_matches_serial():
+    rows = synthetic_scenarios(5000)
+    with StubPostgREST(rows) as stub:
+        serial = qa_scenarios_client.fetch_scenarios(stub.url, 'key', page_size=250)
+        concurrent = qa_scenarios_client.fetch_scenarios(stub.url, 'key', page_size=250, concurrency=6)
+    assert concurrent == serial, 'concurrent pages were reassembled out of order'
+
+
+def check_server_row_cap_is_followed():
+    rows = synthetic_scenarios(3000)
+    with StubPostgREST(rows, max_rows=300) as stub:
+        got = qa_scenarios_client.fetch_scenarios(stub.url, 'key', page_size=1000, concurrency=3)
+    assert got == expected_rows(rows), 'rows beyond the server cap were lost'
+
+
+def check_gzip_and_auth_headers():
+    with StubPostgREST(synthetic_scenarios(10)) as stub:
+        qa_scenarios_client.fetch_scenarios(stub.url, 'secret-key')
+    _path, headers = stub.requests[0]
+    assert 'gzip' in headers.get('Accept-Encoding', ''), 'gzip not requested'
+    assert headers.get('apikey') == 'secret-key'
+    assert headers.get('Authorization') == 'Bearer secret-key'
+
+
+def check_transient_errors_are_retried():
+    rows = synthetic_scenarios(100)
+    with StubPostgREST(rows, fail_first=2) as stub:
+        url = f'{stub.url}/rest/v1/qa_scenarios'
+        with qa_scenarios_client.create_session('key', backoff=0.01) as session:
+            got = qa_scenarios_client.fetch_all(session, url, {'order': 'id'})
+    assert len(got) == 100 and len(stub.requests) == 3, f'{len(stub.requests)} requests'
+
+
+def check_persistent_errors_raise():
+    with StubPostgREST(synthetic_scenarios(10), fail_always=True) as stub:
+        url = f'{stub.url}/rest/v1/qa_scenarios'
+        with qa_scenarios_client.create_session('key', retries=2, backoff=0.01) as session:
+            try:
+                qa_scenarios_client.fetch_all(session, url, {})
+            except qa_scenarios_client.FetchError as e:
+                assert '503' in str(e)
+            else:
+                raise AssertionError('a permanently failing server did not raise FetchError')
+    assert len(stub.requests) == 3, f'{len(stub.requests)} requests for 2 retries'
+
+
+def check_timeouts_raise():
+    with StubPostgREST(synthetic_scenarios(10), delay=1.0) as stub:
+        url = f'{stub.url}/rest/v1/qa_scenarios'
+        with qa_scenarios_client.create_session('key', retries=0) as session:
+            started = time.perf_counter()
+            try:
+                qa_scenarios_client.fetch_all(session, url, {}, timeout=(1, 0.2))
+            except qa_scenarios_client.FetchError:
+                pass
+            else:
+                raise AssertionError('a slow server did not time out')
+    assert time.perf_counter() - started < 1.0, 'the read timeout was not applied'
+
+
+def comparable(role_data):
+    return {
+        role: (data['total'], dict(data['categories']))
+        for role, data in role_data.items()
+    }
+
+
+def check_account_registry_indexes_by_role():
+    registry = accounts.get_accounts()
+    assert registry.password == 'fixture-pass', registry.password
+    assert len(registry.accounts) == len(ROLES), registry.accounts
+    for role_key in ROLES:
+        # What the per-section linear scans used to return
+        expected = next((email for rk, email, _ in registry.accounts if rk == role_key), 'N/A')
+        assert registry.email_for(role_key) == expected, role_key
+    assert registry.email_for('lider_comunidad') == 'N/A'
+
+
+def check_package_import_is_side_effect_free():
+    # A fresh interpreter: this one has imported python-docx and requests already.
+    code = (
+        'import sys\n'
+        'import qa_guide.cli, qa_guide.sections, qa_guide.stream_render, qa_guide.sources\n'
+        'from qa_guide import accounts\n'
+        'loaded = [m for m in ("docx", "requests", "lxml") if m in sys.modules]\n'
+        'print(loaded, accounts._registry)\n'
+    )
+    result = subprocess.run([sys.executable, '-c', code], cwd=SCRIPTS_DIR, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == '[] None', f'import side effects: {result.stdout.strip()}'
+
+
+def check_counts_view_matches_full_grouping():
+    rows = synthetic_scenarios(4000)
+    # The view trims all whitespace around the prefix, as str.strip() does, not just spaces.
+    for row, pad in zip(rows[1:4], (' ', '\t', '\n ')):
+        row['name'] = f"{pad}{row['name'].replace('-', f'{pad}-', 1)}"
+    with StubPostgREST(rows) as stub:
+        counts = qa_scenarios_client.fetch_category_counts(stub.url, 'key')
+        full = group_scenarios_by_role(qa_scenarios_client.fetch_scenarios(stub.url, 'key'))
+    assert comparable(role_data_from_counts(counts)) == comparable(full), 'aggregated counts differ'
+    assert len(counts) <= len(ROLES) * (len(PREFIXES) + 1), f'{len(counts)} count rows'
+
+
+def check_aggregate_falls_back_without_view():
+    rows = synthetic_scenarios(1500)
+    with StubPostgREST(rows, views=False) as stub:
+        with tempfile.TemporaryDirectory() as scratch:
+            snapshot_path = os.path.join(scratch, 'snapshot.json')
+            role_data = fetch_role_data(stub.url, 'key', True, snapshot_path, 500, 1)
+        full = group_scenarios_by_role(qa_scenarios_client.fetch_scenarios(stub.url, 'key'))
+    assert comparable(role_data) == comparable(full), 'fallback did not produce the full grouping'
+    paths = [urlparse(path).path for path, _headers in stub.requests]
+    assert paths[0].endswith('/qa_scenario_category_counts'), 'the view was not tried first'
+
+
+def check_snapshot_refresh_is_incremental():
+    rows = synthetic_scenarios(3000)
+    with StubPostgREST(rows) as stub:
+        snapshot, stats = qa_scenarios_client.refresh_snapshot(stub.url, 'key', None, page_size=1000)
+        assert stats['mode'] == 'full' and stats['changed'] == 3000, stats
+
+        before = len(stub.requests)
+        snapshot, stats = qa_scenarios_client.refresh_snapshot(stub.url, 'key', snapshot, page_size=1000)
+        assert stats['changed'] <= 1 and not stats['idScan'], f'unchanged table moved rows: {stats}'
+        assert len(stub.requests) - before == 2, 'an unchanged refresh should be one delta + one count'
+
+        # Edit three rows, deactivate one, insert two, delete four.
+        for i in (5, 6, 7):
+            rows[i] = {**rows[i], 'name': f'CA-{i}: editado', 'updated_at': stamp(90000 + i)}
+        rows[8] = {**rows[8], 'is_active': False, 'updated_at': stamp(90008)}
+        rows.extend(synthetic_scenarios(3002)[3000:])
+        rows[3000]['updated_at'] = stamp(90100)
+        rows[3001]['updated_at'] = stamp(90101)
+        del rows[100:104]
+
+        snapshot, stats = qa_scenarios_client.refresh_snapshot(stub.url, 'key', snapshot, page_size=1000)
+        # Six edited/inserted rows plus the previous lastSync row, re-read by gte.
+        assert stats['changed'] == 7 and stats['deleted'] == 4, stats
+        fresh = qa_scenarios_client.fetch_scenarios(stub.url, 'key')
+    assert qa_scenarios_client.snapshot_scenarios(snapshot) == fresh, 'snapshot drifted from the table'
+
+
+def check_snapshot_refresh_finds_rows_older_than_last_sync():
+    rows = synthetic_scenarios(1500)
+    with StubPostgREST(rows) as stub:
+        snapshot, _stats = qa_scenarios_client.refresh_snapshot(stub.url, 'key', None, page_size=500)
+
+        # Committed after the sync by a transaction that started before it, and
+        # one with no updated_at at all: neither passes the updated_at filter.
+        late, undated = synthetic_scenarios(1502)[1500:]
+        rows.extend([{**late, 'updated_at': stamp(5)}, {**undated, 'updated_at': None}])
+
+        snapshot, stats = qa_scenarios_client.refresh_snapshot(stub.url, 'key', snapshot, page_size=500)
+        assert stats['idScan'] and stats['missed'] == 2 and stats['deleted'] == 0, stats
+        ids = {r['id'] for r in snapshot['rows']}
+        assert late['id'] in ids and undated['id'] in ids, 'late rows missing from the snapshot'
+        assert len(snapshot['rows']) == len(rows)
+
+        snapshot, stats = qa_scenarios_client.refresh_snapshot(stub.url, 'key', snapshot, page_size=500)
+        assert not stats['idScan'], f'the snapshot should be complete now: {stats}'
+
+
+def check_snapshot_round_trip_is_deterministic():
+    rows = synthetic_scenarios(500)
+    with StubPostgREST(rows) as stub:
+        snapshot, _stats = qa_scenarios_client.refresh_snapshot(stub.url, 'key', None)
+        fresh = qa_scenarios_client.fetch_scenarios(stub.url, 'key')
+    with tempfile.TemporaryDirectory() as scratch:
+        path = os.path.join(scratch, 'snapshot.json')
+        qa_scenarios_client.save_snapshot(path, snapshot)
+        first = open(path, 'rb').read()
+        qa_scenarios_client.save_snapshot(path, qa_scenarios_client.load_snapshot(path))
+        assert open(path, 'rb').read() == first, 'saving a loaded snapshot changed its bytes'
+        offline = qa_scenarios_client.snapshot_scenarios(qa_scenarios_client.load_snapshot(path))
+    assert offline == fresh, 'offline scenarios differ from a live fetch'
+    assert qa_scenarios_client.load_snapshot(os.path.join(scratch, 'missing.json')) is None
+
+
+def check_role_volumes_cover_every_scenario():
+    import docx
+    from qa_guide import volumes
+    snapshot = {'rows': synthetic_scenarios(400)}
+    scenarios = qa_scenarios_client.snapshot_scenarios(snapshot, qa_scenarios_client.SCENARIO_DETAIL_COLUMNS)
+    with tempfile.TemporaryDirectory() as scratch:
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = volumes.build_volumes(scenarios, scratch, jobs=1)
+        assert sum(count for _role, count, _seconds in results) == len(scenarios), results
+
+        for role_key, count, _seconds in results:
+            volume = docx.Document(os.path.join(scratch, volumes.volume_file_name(role_key)))
+            names = [p.text for p in volume.paragraphs if p.style.name == 'Heading 2']
+            expected = sorted(s['name'] for s in scenarios if s['role_required'] == role_key)
+            assert sorted(names) == expected, f'{role_key}: scenarios missing from its volume'
+            steps = sum(len(s['steps']) for s in scenarios if s['role_required'] == role_key)
+            step_tables = [t for t in volume.tables if t.cell(0, 0).text == '#']
+            assert sum(len(t.rows) - 1 for t in step_tables) == steps, f'{role_key}: steps missing'
+
+        index = docx.Document(os.path.join(scratch, volumes.VOLUME_INDEX_NAME))
+        targets = sorted(rel.target_ref for rel in index.part.rels.values() if rel.is_external)
+    assert targets == sorted(volumes.volume_file_name(r[0]) for r in results), targets
+
+
+def check_template_build_matches_full_build():
+    import docx
+    from qa_guide import build
+    from lxml import etree
+    role_data = group_scenarios_by_role(synthetic_scenarios(620))
+    with tempfile.TemporaryDirectory() as scratch:
+        template_path = os.path.join(scratch, 'template.docx')
+        with contextlib.redirect_stdout(io.StringIO()) as log:
+            full = build.build_document(role_data)
+            first = build.build_document(role_data, template_path)   # builds the template
+            second = build.build_document(role_data, template_path)  # reuses it
+        assert log.getvalue().count('Building template') == 1, 'template not reused'
+        # Any other fingerprint (script or accounts changed) must trigger a rebuild
+        stale = docx.Document(template_path)
+        stale.core_properties.identifier = 'stale'
+        stale.save(template_path)
+        with contextlib.redirect_stdout(io.StringIO()) as log:
+            build.build_document(role_data, template_path)
+        assert 'Building template' in log.getvalue(), 'stale template was used'
+
+    body = etree.tostring(full.element.body)
+    assert etree.tostring(first.element.body) == body, 'template build differs from the full build'
+    assert etree.tostring(second.element.body) == body, 'reused template differs from the full build'
+
+
+def check_incremental_build_rebuilds_only_changed_sections():
+    import docx
+    from qa_guide import build
+    from lxml import etree
+    scenarios = qa_scenarios_client.snapshot_scenarios({'rows': synthetic_scenarios(620)})
+    with tempfile.TemporaryDirectory() as scratch:
+        paths = [os.path.join(scratch, name) for name in ('template.docx', 'manifest.json', 'guide.docx')]
+
+        def rebuild(rows, force=False):
+            with contextlib.redirect_stdout(io.StringIO()):
+                return build.build_guide_incremental(group_scenarios_by_role(rows), *paths, force=force)
+
+        rebuilt, reused = rebuild(scenarios)
+        assert len(rebuilt) == 9 and not reused, (rebuilt, reused)
+        assert rebuild(scenarios) is None, 'unchanged inputs regenerated the guide'
+
+        # Move one scenario to another category: same totals, so only its role changes.
+        index = next(i for i, s in enumerate(scenarios) if s['name'].startswith('CA-'))
+        moved = [dict(s) for s in scenarios]
+        moved[index]['name'] = moved[index]['name'].replace('CA-', 'PB-', 1)
+        role = ROLE_DISPLAY[moved[index]['role_required']]
+        rebuilt, reused = rebuild(moved)
+        assert len(rebuilt) == 1 and role in rebuilt[0] and len(reused) == 8, (rebuilt, reused)
+
+        incremental = docx.Document(paths[2])
+        with contextlib.redirect_stdout(io.StringIO()):
+            full = build.build_document(group_scenarios_by_role(moved))
+        assert etree.tostring(incremental.element.body) == etree.tostring(full.element.body), \
+            'incremental guide differs from a full build'
+
+        os.remove(paths[2])
+        rebuilt, reused = rebuild(moved)
+        assert not rebuilt and len(reused) == 9, 'a missing output should be reassembled from the cache'
+        rebuilt, reused = rebuild(moved, force=True)
+        assert len(rebuilt) == 9, '--force should rebuild every section'
+
+
+class BlockCollector(HTMLParser):
+    """Text of every heading and paragraph, and the cell texts of every table, in order"""
+
+    def __init__(self):
+        super().__init__()
+        self.blocks, self.tables = [], []
+        self.text = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('h1', 'h2', 'h3', 'p', 'th', 'td'):
+            self.text = []
+        elif tag == 'table':
+            self.tables.append([])
+        elif tag == 'tr':
+            self.tables[-1].append([])
+
+    def handle_endtag(self, tag):
+        if tag in ('h1', 'h2', 'h3', 'p') and self.text is not None:
+            self.blocks.append(''.join(self.text))
+        elif tag in ('th', 'td'):
+            self.tables[-1][-1].append(''.join(self.text))
+        self.text = None if tag in ('h1', 'h2', 'h3', 'p', 'th', 'td') else self.text
+
+    def handle_data(self, data):
+        if self.text is not None:
+            self.text.append(data)
+
+
+def check_html_and_markdown_match_docx():
+    from qa_guide import build
+    role_data = group_scenarios_by_role(synthetic_scenarios(620))
+    html_out, markdown_out = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(io.StringIO()):
+        doc = build.build_document(role_data)
+        render_guide(HtmlRenderer(html_out), role_data)
+        render_guide(MarkdownRenderer(markdown_out), role_data)
+
+    parsed = BlockCollector()
+    parsed.feed(html_out.getvalue())
+    docx_blocks = [p.text for p in doc.paragraphs if p.text]
+    docx_tables = [
+        [[cell.text for cell in row.cells] for row in table.rows]
+        for table in doc.tables if len(table.columns) > 1  # skip the 1x1 accent lines
+    ]
+    assert [b for b in parsed.blocks if b] == docx_blocks, 'HTML paragraphs differ from the DOCX'
+    assert parsed.tables == docx_tables, 'HTML tables differ from the DOCX'
+
+    markdown = markdown_out.getvalue()
+    headings = [line.lstrip('#').strip() for line in markdown.splitlines() if line.startswith('#')]
+    assert headings == [p.text for p in doc.paragraphs if p.style.name.startswith('Heading')], 'Markdown headings'
+    table_rows = [line for line in markdown.splitlines() if line.startswith('| ')]
+    assert len(table_rows) == sum(len(t) for t in docx_tables), 'Markdown table rows'
+
+
+def check_profile_stages_cover_every_section():
+    from qa_guide import build
+    from qa_guide.profiling import profile
+    role_data = group_scenarios_by_role(synthetic_scenarios(620))
+    with tempfile.TemporaryDirectory() as scratch:
+        template_path = os.path.join(scratch, 'template.docx')
+        with contextlib.redirect_stdout(io.StringIO()) as log, profile() as profiler:
+            build.build_document(role_data, template_path)  # builds the template inside 'load template'
+    labels = [line.strip() for line in log.getvalue().splitlines() if line.startswith('  ') and 'template' not in line]
+    assert set(labels) | {'load template'} == set(profiler.stages), sorted(profiler.stages)
+    own = sum(seconds for seconds, _blocks, _calls in profiler.stages.values())
+    assert all(seconds >= 0 for seconds, _blocks, _calls in profiler.stages.values()), profiler.stages
+    assert own <= profiler.elapsed, f'stages add up to {own:.3f}s of {profiler.elapsed:.3f}s'
+    assert 'outside any stage' in profiler.summary()
+
+
+def check_watch_rebuilds_only_dependents():
+    from qa_guide.watch import Watcher
+    previous_accounts = accounts._accounts_path
+    with tempfile.TemporaryDirectory() as scratch:
+        docs_dir = os.path.join(scratch, 'qa-system')
+        shutil.copytree(os.path.join(os.path.dirname(SCRIPTS_DIR), 'docs', 'qa-system'), docs_dir,
+                        ignore=shutil.ignore_patterns('*.docx', '*.json', '*.pdf', 'TEST_ACCOUNTS.md'))
+        accounts_path = os.path.join(docs_dir, 'TEST_ACCOUNTS.md')
+        with open(accounts_path, 'w', encoding='utf-8') as f:
+            f.write(FIXTURE_ACCOUNTS)
+        snapshot_path = os.path.join(docs_dir, 'snapshot.json')
+        rows = synthetic_scenarios(620)
+        qa_scenarios_client.save_snapshot(snapshot_path, {'schema': qa_scenarios_client.SNAPSHOT_SCHEMA,
+                                                          'lastSync': rows[-1]['updated_at'], 'rows': rows})
+        migration_path = os.path.join(scratch, 'migration.sql')
+        watcher = Watcher(docs_dir, accounts_path, snapshot_path,
+                          *[os.path.join(scratch, name) for name in ('template.docx', 'manifest.json', 'guide.docx')],
+                          migration_path)
+
+        def save(path, edit):
+            with open(path, encoding='utf-8') as f:
+                content = f.read()
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(edit(content))
+            changed = watcher.poll()
+            assert path in changed, f'{path} not seen as changed'
+            with contextlib.redirect_stdout(io.StringIO()):
+                return watcher.rebuild(changed)
+
+        try:
+            watcher.prime()
+            seed = os.path.join(docs_dir, 'seed-consultor-scenarios.sql')
+            assert save(seed, lambda sql: sql) == [], 'a save without changes rebuilt something'
+            assert save(seed, lambda sql: sql.replace("'CA-", "'CA-X", 1)) == ['seed rewrite', 'migration']
+            with open(migration_path, encoding='utf-8') as f:
+                assert "'CA-X" in f.read(), 'the migration does not have the edited scenario'
+            assert not watcher.poll(), "the rewriter's own write was seen as a save"
+
+            unrelated = os.path.join(docs_dir, 'seed-admin-sessions-scenarios.sql')  # not in SEED_FILES
+            assert save(unrelated, lambda sql: sql + '-- edited\n') == []
+
+            assert save(accounts_path, lambda md: md.replace('fixture-pass', 'otra-pass')) == ['guide']
+            assert os.path.exists(os.path.join(scratch, 'guide.docx'))
+            assert save(accounts_path, lambda md: md.replace('**All accounts', 'All accounts')) == [], \
+                'a broken TEST_ACCOUNTS.md should report an error, not rebuild'
+        finally:
+            accounts.use_accounts_file(previous_accounts)
+
+
+SEED_COLUMNS = ['role_required', 'name', 'description', 'feature_area', 'preconditions', 'steps',
+                'priority', 'estimated_duration_minutes', 'is_active', 'automated_only', 'is_multi_user']
+SEED_PREFIXES = PREFIXES + ['HT-A', 'CS-PB', 'LIC-WF']  # newer prefixes the old split list missed
+
+
+def sql_literal(text):
+    return "'" + text.replace("'", "''") + "'"
+
+
+def synthetic_seed(count, per_insert=100):
+    """A seed file of `count` scenarios, with the SQL a regex scan trips over, and the expected rows"""
+    lines = ['-- Seed (synthetic): \'quoted\' (parens) and ; in comments', '/* block comment with a \' quote */', 'BEGIN;']
+    expected = []
+    for i in range(count):
+        if i % per_insert == 0:
+            if i:
+                lines[-1] = lines[-1][:-1] + ';'
+            lines += ['', 'INSERT INTO qa_scenarios (', '  ' + ', '.join(SEED_COLUMNS), ') VALUES']
+        role = ROLES[i % len(ROLES)]
+        name = f"{SEED_PREFIXES[i % len(SEED_PREFIXES)]}-{i}: Botón ''Guardar'' -- no es comentario"
+        steps = json.dumps([
+            {'index': 1, 'instruction': f"Hacer clic en 'Nueva ({i})'", 'expectedOutcome': 'Se abre el formulario); '},
+            {'index': 2, 'instruction': 'Verificar /* esto */ y ::jsonb', 'expectedOutcome': 'Todo bien'},
+        ], ensure_ascii=False)
+        expected.append({'role': role, 'name': name.replace("''", "'"), 'steps': steps})
+        lines += [
+            f'-- {name}: (escenario {i}',
+            '(',
+            f'  {sql_literal(role)},',
+            f"  '{name}',",
+            f"  {sql_literal(f'Descripción con (paréntesis), comas; y un apóstrofe d{chr(39)}Artagnan {i}')},",
+            "  'user_management',",
+            f"  {sql_literal(json.dumps([{'type': 'role', 'description': f'Iniciar sesión como {role}'}]))}::jsonb,",
+            f'  {sql_literal(steps)}::jsonb,',
+            f'  {1 + i % 4}, 5, true, /* automated_only */ false, false',
+            '),',
+        ]
+    lines[-1] = lines[-1][:-1] + ';'
+    lines += ['', 'COMMIT;', '']
+    return '\n'.join(lines), expected
+
+
+def check_seed_tokenizer_reads_tricky_sql():
+    import qa_seed_sql
+    text, expected = synthetic_seed(250)
+    rows = list(qa_seed_sql.iter_rows(text))
+    assert [{'role': r['role_required'], 'name': r['name'], 'steps': r['steps']} for r in rows] == expected
+    assert rows[0]['priority'] == '1' and rows[0]['automated_only'] == 'false', rows[0]
+    assert list(qa_seed_sql.iter_rows(text, table='other_table')) == []
+
+    broken = text + "INSERT INTO qa_scenarios (name) VALUES ('sin cerrar);\n"
+    try:
+        list(qa_seed_sql.iter_rows(broken))
+    except qa_seed_sql.SeedSyntaxError as e:
+        assert str(e).startswith(f'line {text.count(chr(10)) + 1}:'), e
+    else:
+        raise AssertionError('an unterminated literal was accepted')
+
+    casts = ("INSERT INTO qa_scenarios (a, b, c) VALUES "
+             "('x'::character varying, 'y'::numeric(10, 2)[], 'z'::timestamp(3) WITH TIME ZONE);")
+    assert list(qa_seed_sql.iter_rows(casts)) == [{'a': 'x', 'b': 'y', 'c': 'z'}], 'multi-word casts misread'
+    for values, error in (("('x',)", 'empty field'), ("(E'it\\'s')", "E'...' literals"),
+                          ("($$it's$$)", '$$...$$ literals'), ("($q$it's$q$)", '$q$...$q$ literals')):
+        try:
+            list(qa_seed_sql.iter_rows(f'INSERT INTO qa_scenarios (a) VALUES {values};'))
+        except qa_seed_sql.SeedSyntaxError as e:
+            assert error in str(e), (values, e)
+        else:
+            raise AssertionError(f'{values} was accepted')
+
+
+def check_migration_generators_read_every_seed_row():
+    import qa_seed_sql
+    from qa_guide.watch import load_script
+    v1, v2 = load_script('generate-migration.py'), load_script('generate-migration-v2.py')
+    for file_name in qa_seed_sql.SEED_FILES:
+        path = v2.QA_DOCS_DIR / file_name
+        rows = list(qa_seed_sql.iter_rows(path.read_text(encoding='utf-8')))
+        first, second = v1.extract_scenarios(path), v2.parse_seed_file(path)
+        assert len(first) == len(second) == len(rows) > 0, (file_name, len(first), len(second), len(rows))
+        assert [(s['role'], s['name']) for s in first] == [(s['role'], s['name']) for s in second], file_name
+        for scenario in second:
+            json.loads(scenario['steps'])
+
+
+TABLE_HEADERS = ['Código', 'Escenario', 'Prioridad', 'Minutos']
+
+
+def synthetic_table_rows(count):
+    """Rows for the table builders, with the text python-docx escapes or splits"""
+    awkward = ['A & B <ok>', '  sangría', 'final ', 'col\tcol', 'línea\nlínea', 'cr\r\nlf', '"\'', '']
+    return [
+        [f'CA-{i:05d}', f'{awkward[i % len(awkward)]} #{i}', i % 5, awkward[(i * 3) % len(awkward)]]
+        for i in range(count)
+    ]
+
+
+def table_xml(table):
+    from lxml import etree
+    return etree.tostring(table._tbl)
+
+
+def check_bulk_table_matches_cell_builder():
+    from qa_guide import docx_render
+    import docx
+    rows = synthetic_table_rows(64)
+    cases = [
+        (TABLE_HEADERS, rows, [1.0, 3.0, 0.8, 0.8]),
+        (TABLE_HEADERS, rows, None),
+        (['Uno', ' dos '], [['a'], ['b', 'c'], []], [2.0, 2.0]),
+        (TABLE_HEADERS, [], None),
+    ]
+    for headers, table_rows, widths in cases:
+        cells_doc, bulk_doc = docx.Document(), docx.Document()
+        docx_render.apply_brand_styles(cells_doc)
+        docx_render.apply_brand_styles(bulk_doc)
+        cells = docx_render.create_branded_table_cells(cells_doc, headers, table_rows, widths)
+        bulk = docx_render.create_branded_table(bulk_doc, headers, iter(table_rows), widths)
+        assert table_xml(bulk) == table_xml(cells), f'XML differs for {headers!r}, widths {widths!r}'
+
+
+CHECKS = [
+    check_paged_fetch_returns_every_row,
+    check_concurrent_fetch_matches_serial,
+    check_server_row_cap_is_followed,
+    check_gzip_and_auth_headers,
+    check_transient_errors_are_retried,
+    check_persistent_errors_raise,
+    check_timeouts_raise,
+    check_account_registry_indexes_by_role,
+    check_package_import_is_side_effect_free,
+    check_counts_view_matches_full_grouping,
+    check_aggregate_falls_back_without_view,
+    check_snapshot_refresh_is_incremental,
+    check_snapshot_refresh_finds_rows_older_than_last_sync,
+    check_snapshot_round_trip_is_deterministic,
+    check_bulk_table_matches_cell_builder,
+    check_role_volumes_cover_every_scenario,
+    check_template_build_matches_full_build,
+    check_incremental_build_rebuilds_only_changed_sections,
+    check_html_and_markdown_match_docx,
+    check_profile_stages_cover_every_section,
+    check_watch_rebuilds_only_dependents,
+    check_seed_tokenizer_reads_tricky_sql,
+    check_migration_generators_read_every_seed_row,
+]
+
+
+def bench_tables(count):
+    """Rows/sec of both table builders on one `count`-row table, best of three"""
+    from qa_guide import docx_render
+    import docx
+    rows = synthetic_table_rows(count)
+    print(f'| Builder | {count} rows | rows/s |')
+    print('|---|---|---|')
+    for builder in (docx_render.create_branded_table_cells, docx_render.create_branded_table):
+        best = None
+        for _ in range(3):
+            doc = docx.Document()
+            docx_render.apply_brand_styles(doc)
+            started = time.perf_counter()
+            builder(doc, TABLE_HEADERS, rows, [1.0, 3.0, 0.8, 0.8])
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        print(f'| {builder.__name__} | {best:.3f} s | {count / best:,.0f} |')
+
+
+def bench_guide(count):
+    """Build and save time of the guide from `count` synthetic scenarios, best of three"""
+    from qa_guide import build
+    role_data = group_scenarios_by_role(synthetic_scenarios(count))
+    print(f'| {count} scenarios, best of 3 | build | save | .docx | document.xml |')
+    print('|---|---|---|---|---|')
+    with tempfile.TemporaryDirectory() as scratch:
+        template_path = os.path.join(scratch, 'template.docx')
+        with contextlib.redirect_stdout(io.StringIO()):
+            build.build_template(template_path)
+        for label, template in (('from scratch', None), ('from template', template_path)):
+            build_time = save = None
+            for _ in range(3):
+                started = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    doc = build.build_document(role_data, template)
+                built = time.perf_counter()
+                out = io.BytesIO()
+                doc.save(out)
+                saved = time.perf_counter()
+                build_time = min(build_time or built - started, built - started)
+                save = min(save or saved - built, saved - built)
+            with zipfile.ZipFile(out) as docx_zip:
+                document_xml = docx_zip.getinfo('word/document.xml').file_size
+            print(f'| {label} | {build_time:.3f} s | {save:.3f} s | {len(out.getvalue()):,} B | {document_xml:,} B |')
+
+    for label, renderer in (('HTML, streamed', HtmlRenderer), ('Markdown, streamed', MarkdownRenderer)):
+        best = None
+        for _ in range(3):
+            out = io.StringIO()
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                render_guide(renderer(out), role_data)
+            best = min(best or time.perf_counter() - started, time.perf_counter() - started)
+        size = len(out.getvalue().encode('utf-8'))
+        print(f'| {label} | {best:.3f} s | — | {size:,} B | — |')
+
+
+def bench_seed(count):
+    """Time to read a synthetic seed of `count` scenarios with the tokenizer and both generators, best of three"""
+    import qa_seed_sql
+    from qa_guide.watch import load_script
+    text, _expected = synthetic_seed(count)
+    v1, v2 = load_script('generate-migration.py'), load_script('generate-migration-v2.py')
+    with tempfile.TemporaryDirectory() as scratch:
+        path = os.path.join(scratch, 'seed-synthetic-scenarios.sql')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        size = os.path.getsize(path)
+        print(f'| {count} scenarios, {size / 1e6:.1f} MB, best of 3 | time | scenarios/s | MB/s |')
+        print('|---|---|---|---|')
+        for label, read in (('qa_seed_sql.read_scenarios', qa_seed_sql.read_scenarios),
+                            ('generate-migration.py extract_scenarios', v1.extract_scenarios),
+                            ('generate-migration-v2.py parse_seed_file', v2.parse_seed_file)):
+            best = None
+            for _ in range(3):
+                started = time.perf_counter()
+                scenarios = read(path)
+                best = min(best or time.perf_counter() - started, time.perf_counter() - started)
+            assert len(scenarios) == count, (label, len(scenarios))
+            print(f'| {label} | {best:.3f} s | {count / best:,.0f} | {size / 1e6 / best:.1f} |')
+
+
+IMPORT_TARGETS = [
+    'qa_guide.sections',
+    'qa_guide.cli',
+    'qa_guide.stream_render',
+    'qa_guide.build',
+    'docx',
+    'requests',
+]
+
+
+def bench_import(count):
+    """Median wall time of `import X` in `count` fresh interpreters, less an empty one"""
+    def median_run(code):
+        times = []
+        for _ in range(count):
+            started = time.perf_counter()
+            subprocess.run([sys.executable, '-c', code], cwd=SCRIPTS_DIR, check=True)
+            times.append(time.perf_counter() - started)
+        return statistics.median(times)
+
+    baseline = median_run('pass')
+    print(f'| Import, median of {count} | ms |')
+    print('|---|---|')
+    for target in IMPORT_TARGETS:
+        print(f'| {target} | {(median_run(f"import {target}") - baseline) * 1000:.1f} |')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Self-check for the QA guide tooling')
+    parser.add_argument('--bench-tables', type=int, metavar='N',
+                        help='time both table builders on an N-row table instead of running the checks')
+    parser.add_argument('--bench-guide', type=int, metavar='N',
+                        help='time building and saving the whole guide from N synthetic scenarios')
+    parser.add_argument('--bench-import', type=int, metavar='N',
+                        help='median import time of the qa_guide modules over N interpreters')
+    parser.add_argument('--bench-seed', type=int, metavar='N',
+                        help='time reading a synthetic N-scenario seed file with the seed tokenizer')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        accounts_path = os.path.join(scratch, 'TEST_ACCOUNTS.md')
+        with open(accounts_path, 'w', encoding='utf-8') as f:
+            f.write(FIXTURE_ACCOUNTS)
+        accounts.use_accounts_file(accounts_path)
+
+        if args.bench_tables or args.bench_guide or args.bench_import or args.bench_seed:
+            if args.bench_tables:
+                bench_tables(args.bench_tables)
+            if args.bench_guide:
+                bench_guide(args.bench_guide)
+            if args.bench_import:
+                bench_import(args.bench_import)
+            if args.bench_seed:
+                bench_seed(args.bench_seed)
+            return
+
+        failures = 0
+        for check in CHECKS:
+            started = time.perf_counter()
+            try:
+                check()
+            except Exception:
+                failures += 1
+                print(f'FAIL {check.__name__}')
+                traceback.print_exc()
+            else:
+                print(f'ok   {check.__name__} ({time.perf_counter() - started:.2f}s)')
+    print()
+    print(f'{len(CHECKS) - failures}/{len(CHECKS)} checks passed')
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -7,57 +7,16 @@ Produces UPDATE statements matching on name + role_required.
 import re
 from pathlib import Path
 
+from qa_seed_sql import SEED_FILES, read_scenarios
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
 def extract_scenarios(filepath):
     """Extract scenario name, role, and steps JSON from a seed SQL file."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    scenarios = []
-
-    # Strategy: find each value tuple by matching the opening ( after a comment
-    # and extracting the role, name, and steps fields
-
-    # Split content into individual scenario blocks
-    # Each block starts with a comment like "-- PB-1:" followed by "("
-    blocks = re.split(r'\n--\s+(?:PB|CA|SV|SNV|CRUD|RG|GS|EC|SS|CMS|RLS|NS|CS)\s*-\s*\d+', content)
-
-    for block in blocks:
-        # Find the value tuple: starts with ( on its own line
-        # Extract role (first quoted string), name (second quoted string)
-        # and steps (the JSON array before the last ::jsonb)
-
-        # Find role
-        role_match = re.search(r"^\s*\(\s*\n\s*'([^']+)',", block, re.MULTILINE)
-        if not role_match:
-            continue
-        role = role_match.group(1)
-
-        # Find name (second quoted field)
-        name_match = re.search(r"^\s*\(\s*\n\s*'[^']+',\s*\n\s*'([^']+)',", block, re.MULTILINE)
-        if not name_match:
-            continue
-        name = name_match.group(1)
-
-        # Find steps JSON - it's the content between the SECOND '::jsonb pattern
-        # Strategy: find all '...'::jsonb patterns. The last one before the numeric fields is steps.
-        # Actually: preconditions is the 5th field, steps is the 6th field
-        # Both end with '::jsonb
-
-        # Find all jsonb blocks
-        jsonb_pattern = re.compile(r"'(\[[\s\S]*?\])'::jsonb", re.MULTILINE)
-        jsonb_matches = list(jsonb_pattern.finditer(block))
-
-        if len(jsonb_matches) >= 2:
-            # First is preconditions, second is steps
-            steps_json = jsonb_matches[1].group(1)
-            # Normalize whitespace in multi-line JSON
-            steps_json = re.sub(r'\n\s*', '', steps_json)
-            scenarios.append({
-                'role': role,
-                'name': name,
-                'steps': steps_json
-            })
-
+    scenarios = read_scenarios(filepath)
+    for scenario in scenarios:
+        # Normalize whitespace in multi-line JSON
+        scenario['steps'] = re.sub(r'\n\s*', '', scenario['steps'])
     return scenarios
 
 def escape_sql_string(s):
@@ -73,19 +32,10 @@ def generate_update(scenario):
     return f"UPDATE qa_scenarios SET steps = '{steps}'::jsonb WHERE name = '{name}' AND role_required = '{role}';"
 
 def main():
-    base_path = Path('/Users/brentcurtis76/Documents/fne-lms-working/docs/qa-system')
-    seed_files = [
-        'seed-admin-scenarios.sql',
-        'seed-community_manager-scenarios.sql',
-        'seed-consultor-scenarios.sql',
-        'seed-equipo_directivo-scenarios.sql',
-        'seed-lider_comunidad-scenarios.sql',
-        'seed-lider_generacion-scenarios.sql',
-        'seed-supervisor_de_red-scenarios.sql',
-    ]
+    base_path = REPO_ROOT / 'docs' / 'qa-system'
 
     all_scenarios = []
-    for filename in seed_files:
+    for filename in SEED_FILES:
         filepath = base_path / filename
         if filepath.exists():
             scenarios = extract_scenarios(filepath)
@@ -122,7 +72,7 @@ def main():
         migration_lines.append("")
 
     # Write migration file
-    migration_path = Path('/Users/brentcurtis76/Documents/fne-lms-working/supabase/migrations/20260210_rewrite_qa_steps_tester_friendly.sql')
+    migration_path = REPO_ROOT / 'supabase' / 'migrations' / '20260210_rewrite_qa_steps_tester_friendly.sql'
     with open(migration_path, 'w', encoding='utf-8') as f:
         f.write('\n'.join(migration_lines))
 
@@ -0,0 +1,35 @@
+"""
+GENERA QA guide library, behind scripts/generate-qa-guide.py.
+
+Importing the package or any module in it has no side effects and stays
+cheap: TEST_ACCOUNTS.md is read on first use (accounts.get_accounts()), and
+python-docx and requests are only imported by the modules that need them.
+
+- branding:      colors, paragraph style names, role and category labels
+- accounts:      the test accounts, indexed by role
+- scenarios:     grouping scenarios into per-role statistics
+- sources:       scenarios from Supabase or the local snapshot
+- sections:      the guide's sections, written through any renderer
+- stream_render: HtmlRenderer and MarkdownRenderer (no python-docx)
+- docx_render:   DocxRenderer and the python-docx helpers
+- build:         template, incremental (manifest) and full DOCX builds
+- volumes:       per-role detailed volumes, built in a process pool
+- profiling:     per-stage timings for --profile
+- watch:         --watch, rebuilding the guide and migration on save
+- cli:           the command line of generate-qa-guide.py
+"""
+
+import os
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(os.path.dirname(PACKAGE_DIR))
+QA_DOCS_DIR = os.path.join(REPO_ROOT, 'docs', 'qa-system')
+
+DEFAULT_ACCOUNTS_PATH = os.path.join(QA_DOCS_DIR, 'TEST_ACCOUNTS.md')
+DEFAULT_SNAPSHOT_PATH = os.path.join(QA_DOCS_DIR, 'qa-scenarios-snapshot.json')
+DEFAULT_TEMPLATE_PATH = os.path.join(QA_DOCS_DIR, 'GUIA_QA_TESTER.template.docx')
+DEFAULT_MANIFEST_PATH = os.path.join(QA_DOCS_DIR, 'GUIA_QA_TESTER.manifest.json')
+DEFAULT_OUTPUT_PATH = os.path.join(QA_DOCS_DIR, 'GUIA_QA_TESTER.docx')
+DEFAULT_VOLUMES_DIR = os.path.join(QA_DOCS_DIR, 'volumenes')
+# Not under supabase/migrations, where `supabase db push` would pick it up
+DEFAULT_MIGRATION_PREVIEW_PATH = os.path.join(QA_DOCS_DIR, 'qa-steps-migration.preview.sql')
@@ -0,0 +1,103 @@
+"""
+QA test accounts, from docs/qa-system/TEST_ACCOUNTS.md — do not hardcode them here.
+
+The file is parsed on the first get_accounts() call, not at import, so the
+rest of the package can be imported (and its helpers used) without it.
+AccountRegistry indexes the table by role once; every section used to scan
+the whole account list for its role.
+"""
+
+import os
+import re
+
+from . import DEFAULT_ACCOUNTS_PATH
+
+
+class AccountsError(Exception):
+    """TEST_ACCOUNTS.md is missing or could not be parsed; the message says what to fix."""
+
+
+def parse_test_accounts_md(md_path=DEFAULT_ACCOUNTS_PATH):
+    """Parse TEST_ACCOUNTS.md to extract account data and password.
+
+    Returns:
+        tuple: (accounts_list, password) where accounts_list is [(role, email, notes), ...]
+    """
+    if not os.path.exists(md_path):
+        raise AccountsError(f'TEST_ACCOUNTS.md not found at {md_path}\n'
+                            'This file is the single source of truth for QA test accounts.')
+
+    try:
+        with open(md_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except Exception as e:
+        raise AccountsError(f'Failed to read TEST_ACCOUNTS.md: {e}') from e
+
+    # Extract password from line like: **All accounts use the same password:** `QAtester2026!`
+    pw_match = re.search(r'\*\*All accounts use the same password:\*\*\s*`([^`]+)`', content)
+    if not pw_match:
+        raise AccountsError('Could not parse password from TEST_ACCOUNTS.md\n'
+                            'Expected format: **All accounts use the same password:** `<password>`')
+    password = pw_match.group(1)
+
+    # Parse the markdown table (| Email | Role | School | Notes |)
+    accounts = []
+    in_table = False
+    for line in content.split('\n'):
+        line = line.strip()
+        if not line.startswith('|'):
+            if in_table:
+                break  # End of table
+            continue
+
+        # Skip header and separator rows
+        cells = [c.strip() for c in line.split('|')[1:-1]]  # Remove empty first/last from split
+        if len(cells) < 4:
+            continue
+        if cells[0] == 'Email' or set(cells[0]) <= {'-', ' '}:
+            in_table = True
+            continue
+
+        if in_table:
+            email, role, _school, notes = cells[0], cells[1], cells[2], cells[3]
+            accounts.append((role, email, notes))
+
+    if not accounts:
+        raise AccountsError('No accounts parsed from TEST_ACCOUNTS.md table\n'
+                            'Expected table format: | Email | Role | School | Notes |')
+
+    return accounts, password
+
+
+class AccountRegistry:
+    """The parsed accounts, in table order, with the shared password and an index by role"""
+
+    def __init__(self, accounts, password):
+        self.accounts = accounts
+        self.password = password
+        self._email_by_role = {}
+        for role_key, email, _notes in accounts:
+            self._email_by_role.setdefault(role_key, email)  # first row wins
+
+    def email_for(self, role_key):
+        """Test account email for a role, 'N/A' if TEST_ACCOUNTS.md has none"""
+        return self._email_by_role.get(role_key, 'N/A')
+
+
+_accounts_path = DEFAULT_ACCOUNTS_PATH
+_registry = None
+
+
+def get_accounts():
+    """The AccountRegistry, parsed on first use. Raises AccountsError."""
+    global _registry
+    if _registry is None:
+        _registry = AccountRegistry(*parse_test_accounts_md(_accounts_path))
+    return _registry
+
+
+def use_accounts_file(md_path=DEFAULT_ACCOUNTS_PATH):
+    """Read the accounts from `md_path` on the next get_accounts(), dropping any parsed ones"""
+    global _accounts_path, _registry
+    _accounts_path = md_path
+    _registry = None
@@ -0,0 +1,100 @@
+"""
+GENERA brand and the guide's labels: colors, the named paragraph styles
+every renderer understands, role and category names.
+"""
+
+# GENERA Brand Colors (from brand-guidelines.md)
+COLOR_PRIMARY = '0a0a0a'      # Near-black for text
+COLOR_ACCENT = 'fbbf24'       # Yellow for headers/accents
+COLOR_ACCENT_HOVER = 'f59e0b' # Darker yellow
+COLOR_LIGHT = 'ffffff'         # White
+COLOR_GRAY_DARK = '1f1f1f'    # Dark gray
+COLOR_GRAY_MEDIUM = '6b7280'  # Medium gray for secondary text
+COLOR_GRAY_LIGHT = 'f9fafb'   # Light gray for alt rows
+COLOR_BORDER = 'e5e7eb'       # Border color
+
+# Font
+FONT_NAME = 'Calibri'  # python-docx compatible; Inter specified in styles
+
+# Paragraph styles, defined once per document by apply_brand_styles(); every
+# generator refers to them by name instead of formatting its runs.
+STYLE_BODY = 'Normal'
+STYLE_LABEL = 'GENERA Label'
+STYLE_IMPORTANT = 'GENERA Important'
+STYLE_MUTED = 'GENERA Muted'
+STYLE_TABLE_HEADER = 'GENERA Table Header'
+STYLE_TABLE_CELL = 'GENERA Table Cell'
+STYLE_COVER_BRAND = 'GENERA Cover Brand'
+STYLE_COVER_TITLE = 'GENERA Cover Title'
+STYLE_COVER_SUBTITLE = 'GENERA Cover Subtitle'
+STYLE_COVER_NOTE = 'GENERA Cover Note'
+STYLE_COVER_FOOTER = 'GENERA Cover Footer'
+TABLE_STYLE = 'Table Grid'  # built into the default template; borders only
+STYLE_LINK = 'GENERA Link'  # character style, for add_hyperlink
+
+# name: (size in pt, bold, color, centered)
+BRAND_STYLES = {
+    STYLE_BODY: (11, False, COLOR_PRIMARY, False),
+    'Heading 1': (24, True, COLOR_PRIMARY, False),
+    'Heading 2': (16, True, COLOR_GRAY_DARK, False),
+    'Heading 3': (12, True, COLOR_GRAY_DARK, False),
+    STYLE_LABEL: (11, True, COLOR_PRIMARY, False),
+    STYLE_IMPORTANT: (11, True, COLOR_ACCENT_HOVER, False),
+    STYLE_MUTED: (11, False, COLOR_GRAY_MEDIUM, False),
+    STYLE_TABLE_HEADER: (10, True, COLOR_PRIMARY, True),
+    STYLE_TABLE_CELL: (9, False, COLOR_PRIMARY, False),
+    STYLE_COVER_BRAND: (18, True, COLOR_PRIMARY, True),
+    STYLE_COVER_TITLE: (24, True, COLOR_PRIMARY, True),
+    STYLE_COVER_SUBTITLE: (14, False, COLOR_GRAY_MEDIUM, True),
+    STYLE_COVER_NOTE: (12, False, COLOR_GRAY_MEDIUM, True),
+    STYLE_COVER_FOOTER: (11, False, COLOR_GRAY_MEDIUM, True),
+}
+
+
+# Role Display Names (Spanish)
+ROLE_DISPLAY = {
+    'admin': 'Administrador',
+    'docente': 'Docente',
+    'community_manager': 'Community Manager',
+    'equipo_directivo': 'Equipo Directivo',
+    'lider_generacion': 'L\u00edder de Generaci\u00f3n',
+    'consultor': 'Consultor',
+    'supervisor_de_red': 'Supervisor de Red',
+    'lider_comunidad': 'Líder de Comunidad'
+}
+
+# Role Descriptions (Spanish, 1-2 sentences)
+ROLE_DESCRIPTIONS = {
+    'admin': 'El administrador tiene acceso completo a todas las funciones del sistema, incluyendo gestión de usuarios, cursos, escuelas y configuración global. No tiene límites de permisos (no hay escenarios PB).',
+    'docente': 'El docente puede tomar cursos, responder quizzes, entregar tareas y participar en el espacio colaborativo. No puede crear cursos, gestionar usuarios ni acceder a funciones de administrador.',
+    'community_manager': 'El community manager gestiona contenido y comunidades dentro de su alcance asignado. No puede acceder a funciones de administrador ni gestionar usuarios.',
+    'equipo_directivo': 'El equipo directivo tiene acceso a reportes y datos de su propia escuela. No puede crear cursos, gestionar usuarios globales ni acceder a funciones de administrador.',
+    'lider_generacion': 'El líder de generación supervisa el progreso de su generación asignada. No puede acceder a funciones de administrador ni a datos fuera de su generación.',
+    'consultor': 'El consultor externo puede ver evaluaciones, reportes y datos de su escuela asignada. No puede crear cursos, gestionar usuarios ni acceder a funciones de administrador.',
+    'supervisor_de_red': 'El supervisor de red tiene visibilidad sobre múltiples escuelas dentro de su red asignada. Puede ver reportes a nivel de red pero no puede gestionar usuarios ni crear cursos.',
+    'lider_comunidad': 'El líder de comunidad gestiona su comunidad asignada, incluyendo miembros y actividades. No puede acceder a funciones de administrador ni a datos fuera de su comunidad.'
+}
+
+# Category Code Labels (Spanish)
+CATEGORY_LABELS = {
+    'PB': ('Límites de Permisos', 'Que el rol NO pueda acceder a funciones restringidas'),
+    'CA': ('Acceso Correcto', 'Que el rol SÍ pueda acceder a sus funciones permitidas'),
+    'SV': ('Sidebar Visible', 'Que el menú lateral muestre las opciones correctas'),
+    'SNV': ('Sidebar No Visible', 'Que el menú lateral oculte opciones no permitidas'),
+    'SA': ('Alcance de Evaluaciones', 'Que solo se vean datos del propio colegio'),
+    'SS': ('Alcance de Escuela', 'Que solo se vean datos de la escuela asignada'),
+    'NS': ('Alcance de Red', 'Que se vean datos de toda la red asignada'),
+    'CS': ('Alcance de Comunidad', 'Que se gestionen solo las comunidades asignadas'),
+    'GS': ('Alcance Global/Generacional', 'Verificar el alcance de datos global o generacional'),
+    'EC': ('Casos Especiales', 'Situaciones atípicas: sin escuela, roles múltiples, sesión expirada'),
+    'CP': ('Participación en Cursos', 'Inscripción, navegación y progreso en cursos'),
+    'QT': ('Quizzes y Evaluaciones', 'Responder evaluaciones y preguntas abiertas'),
+    'TS': ('Entrega de Tareas', 'Subir archivos y enviar tareas'),
+    'CW': ('Espacio Colaborativo', 'Funciones del espacio de comunidad'),
+    'PN': ('Perfil y Notificaciones', 'Edición de perfil y notificaciones'),
+    'BUG': ('Verificación de Error', 'Confirmar si un error reportado sigue presente'),
+    'CRUD': ('Operaciones CRUD', 'Crear, leer, actualizar y eliminar recursos'),
+    'RG': ('Pruebas de Regresión', 'Verificar que funcionalidades existentes no se rompieron'),
+    'CMS': ('Gestión de Contenido', 'Funciones de gestión de contenido del community manager'),
+    'RLS': ('Seguridad de Datos', 'Verificar que las políticas de seguridad filtran datos correctamente')
+}
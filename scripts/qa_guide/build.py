@@ -0,0 +1,196 @@
+"""
+DOCX builds of the guide: from scratch, from the prebuilt template of its
+static parts, and incremental against the build manifest.
+
+Everything that does not depend on the scenarios (cover, sections 1-3, 12,
+13, glossary) is rendered once into a template with a marker paragraph per
+TEMPLATE_SLOTS entry; the template rebuilds itself when the package source
+or the accounts change. The manifest keeps a content hash of each generated
+section's inputs with the section's XML, so unchanged sections are copied
+from it and an up-to-date output is not regenerated at all.
+"""
+
+import functools
+import hashlib
+import json
+import os
+
+from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import qn
+from lxml import etree
+
+from . import PACKAGE_DIR
+from .accounts import get_accounts
+from .docx_render import DocxRenderer, apply_brand_styles
+from .profiling import stage
+from .sections import (
+    TEMPLATE_SLOTS, dynamic_sections, generate_dynamic_part, generate_static_parts, render_guide, run_section,
+)
+
+MANIFEST_SCHEMA = 1
+
+
+def slot_marker(slot):
+    return f'{{{{{slot}}}}}'
+
+
+def template_fingerprint():
+    """Changes whenever the static parts could: the package source, the accounts or the password"""
+    accounts = get_accounts()
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(PACKAGE_DIR)):
+        if name.endswith('.py'):
+            with open(os.path.join(PACKAGE_DIR, name), 'rb') as f:
+                digest.update(f.read())
+    digest.update(json.dumps([accounts.accounts, accounts.password]).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def build_template(template_path):
+    """Render the static parts once, with a marker paragraph per slot"""
+    out = DocxRenderer()
+    generate_static_parts(out, lambda slot: out.paragraph(slot_marker(slot)))
+    out.doc.core_properties.identifier = template_fingerprint()
+    out.doc.save(template_path)
+
+
+def load_template(template_path):
+    """The template, rebuilt first if it is missing or was built from other inputs"""
+    with stage('load template'):
+        if os.path.exists(template_path):
+            doc = Document(template_path)
+            if doc.core_properties.identifier == template_fingerprint():
+                apply_brand_styles(doc)  # the styles are there already; this fills STYLE_IDS
+                return doc
+
+        print(f'  Building template {template_path}')
+        build_template(template_path)
+        doc = Document(template_path)
+        apply_brand_styles(doc)
+        return doc
+
+
+def fill_template_slot(doc, slot, generate):
+    """Replace the slot's marker paragraph with what generate() appends to the document"""
+    body = doc.element.body
+    marker = next(p for p in body.iterchildren(qn('w:p')) if p.xpath('string(.)') == slot_marker(slot))
+
+    # python-docx inserts new blocks before the final w:sectPr
+    first_new = len(body) - 1
+    generate()
+    for element in body[first_new:len(body) - 1]:
+        marker.addprevious(element)
+    body.remove(marker)
+
+
+def content_hash(inputs):
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+def file_hash(path):
+    """sha256 of the file at `path`, None if there is none"""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def load_manifest(manifest_path):
+    """The build manifest, or None if missing, unreadable or from another schema"""
+    try:
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get('schema') == MANIFEST_SCHEMA else None
+
+
+def save_manifest(manifest_path, manifest):
+    tmp_path = f'{manifest_path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp_path, manifest_path)
+
+
+def build_guide_incremental(role_data, template_path, manifest_path, output_path, force=False):
+    """Write output_path, regenerating only sections whose inputs changed since the manifest.
+
+    Returns (rebuilt, reused) section labels, or None when nothing changed and
+    the output was left untouched.
+    """
+    with stage('manifest'):
+        fingerprint = template_fingerprint()
+        sections = dynamic_sections(role_data)
+        hashes = {key: content_hash(inputs) for _slot, key, _label, inputs, _generate in sections}
+
+        manifest = None if force else load_manifest(manifest_path)
+        if manifest is None or manifest['template'] != fingerprint:
+            cached = {}  # fragments from another package version or other accounts
+        else:
+            cached = manifest['sections']
+            unchanged = {key: entry['hash'] for key, entry in cached.items()} == hashes
+            if unchanged and file_hash(output_path) == manifest['output']:
+                return None
+
+    doc = load_template(template_path)
+    out = DocxRenderer(doc)
+    body = doc.element.body
+    fragments = {}
+    rebuilt, reused = [], []
+
+    def generate_slot(slot):
+        for section_slot, key, label, _inputs, generate in sections:
+            if section_slot != slot:
+                continue
+            entry = cached.get(key)
+            if entry and entry['hash'] == hashes[key]:
+                with stage('reused sections'):
+                    for xml in entry['xml']:
+                        body.sectPr.addprevious(parse_xml(xml))
+                fragments[key] = entry
+                reused.append(label)
+                continue
+
+            first_new = len(body) - 1
+            run_section(out, label, generate)
+            fragments[key] = {
+                'hash': hashes[key],
+                'xml': [etree.tostring(el, encoding='unicode') for el in body[first_new:len(body) - 1]],
+            }
+            rebuilt.append(label)
+
+    for slot in TEMPLATE_SLOTS:
+        fill_template_slot(doc, slot, functools.partial(generate_slot, slot))
+    doc.core_properties.identifier = ''
+    with stage('save'):
+        doc.save(output_path)
+
+    with stage('manifest'):
+        save_manifest(manifest_path, {
+            'schema': MANIFEST_SCHEMA,
+            'template': fingerprint,
+            'output': file_hash(output_path),
+            'sections': fragments,
+        })
+    return rebuilt, reused
+
+
+def build_document(role_data, template_path=None):
+    """The whole guide as a python-docx Document, printing each section as it is generated.
+
+    With template_path, only the TEMPLATE_SLOTS parts are generated, into the template.
+    """
+    if template_path is None:
+        with stage('new document'):
+            out = DocxRenderer()
+        render_guide(out, role_data)
+        return out.doc
+
+    out = DocxRenderer(load_template(template_path))
+    for slot in TEMPLATE_SLOTS:
+        fill_template_slot(out.doc, slot, lambda: generate_dynamic_part(out, slot, role_data))
+    out.doc.core_properties.identifier = ''
+    return out.doc
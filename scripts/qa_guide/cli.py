@@ -0,0 +1,228 @@
+"""
+Command line of scripts/generate-qa-guide.py (see its docstring for usage).
+
+python-docx is imported only when DOCX is written (build, volumes) and
+requests only for an online fetch; --offline --format html|markdown needs
+neither.
+"""
+
+import argparse
+import os
+import sys
+
+import qa_scenarios_client
+
+from . import (
+    DEFAULT_MANIFEST_PATH, DEFAULT_MIGRATION_PREVIEW_PATH, DEFAULT_OUTPUT_PATH, DEFAULT_SNAPSHOT_PATH,
+    DEFAULT_TEMPLATE_PATH, DEFAULT_VOLUMES_DIR,
+)
+from .accounts import AccountsError, get_accounts
+from .branding import ROLE_DISPLAY
+from .profiling import profile, stage
+from .scenarios import group_scenarios_by_role
+from .sections import render_guide
+from .sources import fetch_role_data, load_credentials, load_offline_scenarios, sync_scenarios
+
+OUTPUT_EXTENSIONS = {'docx': '.docx', 'html': '.html', 'markdown': '.md'}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Generate the GENERA QA tester guide (DOCX).')
+    parser.add_argument('--aggregate', action='store_true',
+                        help='read role x category counts from the qa_scenario_category_counts view '
+                             '(falls back to the full fetch if it is missing)')
+    parser.add_argument('--page-size', type=int, default=qa_scenarios_client.PAGE_SIZE,
+                        help='scenarios per Range request')
+    parser.add_argument('--concurrency', type=int, default=1,
+                        help='pages fetched in parallel after the first')
+    parser.add_argument('--snapshot', default=DEFAULT_SNAPSHOT_PATH,
+                        help='local scenario snapshot, refreshed incrementally on every online run')
+    parser.add_argument('--offline', action='store_true',
+                        help='build from the snapshot only: no .env.local, no network')
+    parser.add_argument('--template', default=DEFAULT_TEMPLATE_PATH,
+                        help='prebuilt static parts; rebuilt automatically when stale')
+    parser.add_argument('--no-template', action='store_true',
+                        help='build every section from scratch')
+    parser.add_argument('--build-template', action='store_true',
+                        help='(re)build the template and exit')
+    parser.add_argument('--manifest', default=DEFAULT_MANIFEST_PATH,
+                        help='per-section content hashes and fragments of the last template build')
+    parser.add_argument('--force', action='store_true',
+                        help='regenerate every section even if its inputs did not change')
+    parser.add_argument('--format', choices=sorted(OUTPUT_EXTENSIONS), default='docx',
+                        help='html and markdown are streamed straight to the output file')
+    parser.add_argument('--output',
+                        help='default: docs/qa-system/GUIA_QA_TESTER with the extension of --format')
+    parser.add_argument('--volumes', action='store_true',
+                        help='write one detailed DOCX per role plus an index, instead of the guide')
+    parser.add_argument('--volumes-dir', default=DEFAULT_VOLUMES_DIR,
+                        help='output directory for --volumes')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='processes building volumes in parallel')
+    parser.add_argument('--profile', action='store_true',
+                        help='print wall time and net allocated blocks per stage (fetch, grouping, '
+                             'each section, save), slowest first')
+    parser.add_argument('--profile-out', metavar='PATH',
+                        help='with --profile, also run under cProfile and dump its stats to PATH '
+                             '(the timings then include cProfile overhead)')
+    parser.add_argument('--watch', action='store_true',
+                        help='keep running: rebuild the guide (offline) and the steps migration whenever '
+                             'TEST_ACCOUNTS.md, the snapshot or a seed file is saved; the migration goes to '
+                             '--migration-out, not supabase/migrations')
+    parser.add_argument('--migration-out', metavar='PATH',
+                        help='with --watch, where the steps migration is written (default: '
+                             'docs/qa-system/qa-steps-migration.preview.sql; run generate-migration-v2.py '
+                             'to update the real one)')
+    args = parser.parse_args(argv)
+
+    if args.volumes and args.aggregate:
+        parser.error('--volumes needs every scenario row; it cannot use --aggregate')
+    if args.volumes and args.format != 'docx':
+        parser.error('--volumes only writes DOCX; it cannot be combined with --format html or markdown')
+    if args.offline and args.aggregate:
+        parser.error('--aggregate reads a view over the network; it cannot be combined with --offline')
+    if args.profile_out and not args.profile:
+        parser.error('--profile-out needs --profile')
+    if args.migration_out and not args.watch:
+        parser.error('--migration-out needs --watch')
+    if args.watch and (args.volumes or args.no_template or args.profile or args.format != 'docx'):
+        parser.error('--watch rebuilds the DOCX guide from its template; it cannot be combined with '
+                     '--volumes, --no-template, --profile or --format')
+    return args
+
+
+def main():
+    """Main execution"""
+    args = parse_args()
+    if args.watch:
+        watch(args)
+        return
+    if not args.profile:
+        generate(args)
+        return
+
+    with profile(args.profile_out) as profiler:
+        generate(args)
+    print()
+    print(profiler.summary())
+    if args.profile_out:
+        print(f'cProfile stats written to {args.profile_out}')
+
+
+def watch(args):
+    """--watch: rebuild what depends on each saved input until Ctrl-C"""
+    from .watch import Watcher
+
+    watcher = Watcher(snapshot_path=args.snapshot, template_path=args.template, manifest_path=args.manifest,
+                      output_path=args.output or DEFAULT_OUTPUT_PATH,
+                      migration_path=args.migration_out or DEFAULT_MIGRATION_PREVIEW_PATH)
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        print()
+        print('Stopped.')
+
+
+def generate(args):
+    """Everything main() does once the options are parsed"""
+    try:
+        get_accounts()
+    except AccountsError as e:
+        print(f'ERROR: {e}')
+        sys.exit(1)
+
+    if args.build_template:
+        with stage('import python-docx'):
+            from .build import build_template
+
+        print(f'Building template {args.template}...')
+        build_template(args.template)
+        print('Done!')
+        return
+
+    print('GENERA QA Guide Generator')
+    print('=' * 50)
+
+    if args.volumes:
+        columns = qa_scenarios_client.SCENARIO_DETAIL_COLUMNS
+        if args.offline:
+            print('Loading scenarios from the local snapshot...')
+            scenarios = load_offline_scenarios(args.snapshot, columns)
+        else:
+            supabase_url, service_key = load_credentials()
+            print('Fetching scenarios from Supabase...')
+            scenarios = sync_scenarios(supabase_url, service_key, args.snapshot, args.page_size,
+                                       args.concurrency, columns)
+
+        with stage('import python-docx'):
+            from .volumes import build_volumes
+
+        print(f'Generating {args.volumes_dir} ({len(scenarios)} scenarios)...')
+        with stage('volumes'):
+            build_volumes(scenarios, args.volumes_dir, args.jobs)
+        print('Done!')
+        return
+
+    if args.offline:
+        print('Loading scenarios from the local snapshot...')
+        scenarios = load_offline_scenarios(args.snapshot)
+        with stage('group'):
+            role_data = group_scenarios_by_role(scenarios)
+    else:
+        supabase_url, service_key = load_credentials()
+
+        # Fetch scenarios
+        print('Fetching scenarios from Supabase...')
+        role_data = fetch_role_data(supabase_url, service_key, args.aggregate, args.snapshot,
+                                    args.page_size, args.concurrency)
+
+    # Print summary
+    total = 0
+    ordered_roles = sorted(role_data.items(),
+                          key=lambda x: x[1]['total'],
+                          reverse=True)
+
+    for role_key, data in ordered_roles:
+        count = data['total']
+        total += count
+        print(f'  {ROLE_DISPLAY[role_key]}: {count} scenarios')
+
+    print(f'Total: {total} scenarios')
+    print()
+
+    output_path = args.output or os.path.splitext(DEFAULT_OUTPUT_PATH)[0] + OUTPUT_EXTENSIONS[args.format]
+    if args.format != 'docx':
+        from .stream_render import HtmlRenderer, MarkdownRenderer
+
+        print(f'Generating {args.format.upper()}...')
+        renderer = HtmlRenderer if args.format == 'html' else MarkdownRenderer
+        with open(output_path, 'w', encoding='utf-8') as f:
+            render_guide(renderer(f), role_data)
+        print()
+        print(f'Document saved to {output_path}')
+        print('Done!')
+        return
+
+    # Generate DOCX
+    with stage('import python-docx'):
+        from .build import build_document, build_guide_incremental
+
+    print('Generating DOCX...')
+    if args.no_template:
+        doc = build_document(role_data)
+        with stage('save'):
+            doc.save(output_path)
+    else:
+        result = build_guide_incremental(role_data, args.template, args.manifest, output_path, args.force)
+        if result is None:
+            print('  No section inputs changed; nothing to rebuild')
+            print()
+            print(f'Document is up to date: {output_path}')
+            print('Done!')
+            return
+        rebuilt, reused = result
+        print(f'  {len(rebuilt)} sections rebuilt, {len(reused)} reused from {args.manifest}')
+
+    print()
+    print(f'Document saved to {output_path}')
+    print('Done!')
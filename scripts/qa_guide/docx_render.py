@@ -0,0 +1,291 @@
+"""
+The guide as a python-docx Document: brand styles, tables, links and
+DocxRenderer. The only module here that imports python-docx at the top;
+import it on the paths that write DOCX.
+"""
+
+import re
+from xml.sax.saxutils import escape
+
+from docx import Document
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.shared import Pt, Inches, RGBColor
+from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+from docx.oxml.ns import qn, nsdecls
+from docx.oxml import OxmlElement, parse_xml
+
+from .branding import (
+    BRAND_STYLES, COLOR_ACCENT, COLOR_ACCENT_HOVER, COLOR_GRAY_LIGHT, COLOR_LIGHT, FONT_NAME,
+    STYLE_BODY, STYLE_LINK, STYLE_TABLE_CELL, STYLE_TABLE_HEADER, TABLE_STYLE,
+)
+
+# Style name -> styleId, filled by apply_brand_styles(). Paragraphs get their
+# w:pStyle from here: python-docx's own style setters scan the whole style part
+# on every call (Styles.default), ~3 ms per paragraph.
+STYLE_IDS = {}
+
+
+def apply_brand_styles(doc):
+    """Define BRAND_STYLES in the document's style part (headings and Normal are redefined)"""
+    for name, (size, bold, color, centered) in BRAND_STYLES.items():
+        try:
+            style = doc.styles[name]
+        except KeyError:
+            style = doc.styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+            style.base_style = doc.styles[STYLE_BODY]
+            style.quick_style = True
+
+        font = style.font
+        font.name = FONT_NAME
+        font.size = Pt(size)
+        font.bold = bold
+        font.color.rgb = RGBColor.from_string(color.upper())
+
+        # The built-in headings name theme fonts, which win over w:ascii.
+        rFonts = style.element.rPr.rFonts
+        for attr in ('w:asciiTheme', 'w:hAnsiTheme', 'w:eastAsiaTheme', 'w:cstheme'):
+            rFonts.attrib.pop(qn(attr), None)
+
+        if centered:
+            style.paragraph_format.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+
+        STYLE_IDS[name] = style.style_id
+
+    STYLE_IDS[TABLE_STYLE] = doc.styles[TABLE_STYLE].style_id
+
+    try:
+        link = doc.styles[STYLE_LINK]
+    except KeyError:
+        link = doc.styles.add_style(STYLE_LINK, WD_STYLE_TYPE.CHARACTER)
+        link.font.underline = True
+        link.font.color.rgb = RGBColor.from_string(COLOR_ACCENT_HOVER.upper())
+    STYLE_IDS[STYLE_LINK] = link.style_id
+
+
+def set_paragraph_style(paragraph, name):
+    """Point `paragraph` at one of BRAND_STYLES"""
+    paragraph._p.style = STYLE_IDS[name]
+
+
+def set_cell_background(cell, hex_color):
+    """Set cell background color"""
+    shading_elm = OxmlElement('w:shd')
+    shading_elm.set(qn('w:fill'), hex_color)
+    cell._element.get_or_add_tcPr().append(shading_elm)
+
+
+def add_yellow_accent_line(doc):
+    """Add a thin yellow accent line (GENERA brand style)"""
+    table = doc.add_table(rows=1, cols=1)
+    table.autofit = False
+    table.allow_autofit = False
+
+    cell = table.cell(0, 0)
+    set_cell_background(cell, COLOR_ACCENT)
+
+    # Set table width to 100%
+    tbl = table._element
+    tblPr = tbl.tblPr
+    tblW = OxmlElement('w:tblW')
+    tblW.set(qn('w:w'), '5000')
+    tblW.set(qn('w:type'), 'pct')
+    tblPr.append(tblW)
+
+    # Set row height
+    tr = table.rows[0]._element
+    trPr = tr.get_or_add_trPr()
+    trHeight = OxmlElement('w:trHeight')
+    trHeight.set(qn('w:val'), '72')  # 0.1 inch = 72 twips
+    trHeight.set(qn('w:hRule'), 'exact')
+    trPr.append(trHeight)
+
+
+def add_heading(doc, text, level=1):
+    """Add a heading with GENERA brand styling (Heading 1-3, see BRAND_STYLES)"""
+    add_paragraph(doc, text, f'Heading {level}')
+    if level == 1:
+        add_yellow_accent_line(doc)
+
+
+def add_hyperlink(paragraph, text, target):
+    """Append a link to `target` (a URL or a path relative to the document) to `paragraph`"""
+    r_id = paragraph.part.relate_to(target, RT.HYPERLINK, is_external=True)
+    hyperlink = OxmlElement('w:hyperlink')
+    hyperlink.set(qn('r:id'), r_id)
+    run = OxmlElement('w:r')
+    rPr = OxmlElement('w:rPr')
+    rStyle = OxmlElement('w:rStyle')
+    rStyle.set(qn('w:val'), STYLE_IDS[STYLE_LINK])
+    rPr.append(rStyle)
+    run.append(rPr)
+    run_text = OxmlElement('w:t')
+    run_text.text = text
+    run.append(run_text)
+    hyperlink.append(run)
+    paragraph._p.append(hyperlink)
+
+
+def add_paragraph(doc, text, style=STYLE_BODY, align=None):
+    """Add a paragraph in one of the GENERA paragraph styles"""
+    p = doc.add_paragraph(text)
+    if style != STYLE_BODY:
+        set_paragraph_style(p, style)
+    if align:
+        p.alignment = align
+
+
+def create_branded_table_cells(doc, headers, rows, col_widths=None):
+    """Create a table with GENERA brand styling, cell by cell through python-docx.
+
+    Reference implementation for create_branded_table, which must produce the
+    same XML; check-qa-guide.py compares the two and benchmarks them.
+    """
+    table = doc.add_table(rows=1, cols=len(headers))
+    table._tbl.tblPr.style = STYLE_IDS[TABLE_STYLE]
+
+    # Header row
+    header_cells = table.rows[0].cells
+    for i, header_text in enumerate(headers):
+        cell = header_cells[i]
+        set_cell_background(cell, COLOR_ACCENT)
+
+        # Add text
+        p = cell.paragraphs[0]
+        set_paragraph_style(p, STYLE_TABLE_HEADER)
+        p.add_run(header_text)
+
+    # Data rows
+    for i, row_data in enumerate(rows):
+        row_cells = table.add_row().cells
+
+        # Alternating row colors
+        bg_color = COLOR_LIGHT if i % 2 == 0 else COLOR_GRAY_LIGHT
+
+        for j, cell_text in enumerate(row_data):
+            cell = row_cells[j]
+            set_cell_background(cell, bg_color)
+
+            p = cell.paragraphs[0]
+            set_paragraph_style(p, STYLE_TABLE_CELL)
+            p.add_run(str(cell_text))
+
+    # Set column widths if provided
+    if col_widths:
+        for row in table.rows:
+            for i, width in enumerate(col_widths):
+                row.cells[i].width = Inches(width)
+
+    return table
+
+
+# Cell templates for create_branded_table; text formatting lives in the styles.
+_HEADER_CELL_XML = (
+    '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/><w:shd w:fill="%s"/></w:tcPr>'
+    '<w:p><w:pPr><w:pStyle w:val="{style}"/></w:pPr><w:r>{content}</w:r></w:p></w:tc>'
+) % COLOR_ACCENT
+_DATA_CELL_XML = (
+    '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/><w:shd w:fill="{fill}"/></w:tcPr>'
+    '<w:p><w:pPr><w:pStyle w:val="{style}"/></w:pPr><w:r>{content}</w:r></w:p></w:tc>'
+)
+# A row shorter than the headers leaves its last cells as add_row() made them.
+_EMPTY_CELL_XML = '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/></w:tcPr><w:p/></w:tc>'
+
+
+def _run_content_xml(text):
+    """Run content for `text` exactly as python-docx writes it: w:t, with w:tab / w:br for tabs and newlines"""
+    if '\t' not in text and '\n' not in text and '\r' not in text:
+        if not text:
+            return ''
+        space = ' xml:space="preserve"' if len(text.strip()) < len(text) else ''
+        return f'<w:t{space}>{escape(text)}</w:t>'
+
+    parts = []
+    for piece in re.split(r'([\t\r\n])', text):
+        if piece == '\t':
+            parts.append('<w:tab/>')
+        elif piece in ('\r', '\n'):
+            parts.append('<w:br/>')
+        elif piece:
+            parts.append(_run_content_xml(piece))
+    return ''.join(parts)
+
+
+def create_branded_table(doc, headers, rows, col_widths=None):
+    """Create a table with GENERA brand styling.
+
+    Same output as create_branded_table_cells, but every row after the header
+    is rendered from the templates above into one XML string and parsed once,
+    so `rows` can be any iterator and thousands of rows stay cheap.
+    """
+    table = doc.add_table(rows=0, cols=len(headers))
+    tbl = table._tbl
+    tbl.tblPr.style = STYLE_IDS[TABLE_STYLE]
+
+    if col_widths:
+        widths = [Inches(w).twips for w in col_widths]
+    else:
+        widths = [int(gridCol.get(qn('w:w'))) for gridCol in tbl.tblGrid.gridCol_lst]
+
+    header_style = STYLE_IDS[STYLE_TABLE_HEADER]
+    cell_style = STYLE_IDS[STYLE_TABLE_CELL]
+
+    xml = [f'<w:tbl {nsdecls("w")}><w:tr>']
+    for width, header_text in zip(widths, headers):
+        xml.append(_HEADER_CELL_XML.format(width=width, style=header_style,
+                                           content=_run_content_xml(header_text)))
+    xml.append('</w:tr>')
+
+    for i, row_data in enumerate(rows):
+        # Alternating row colors
+        fill = COLOR_LIGHT if i % 2 == 0 else COLOR_GRAY_LIGHT
+        xml.append('<w:tr>')
+        row_data = list(row_data)
+        for width, cell_text in zip(widths, row_data):
+            xml.append(_DATA_CELL_XML.format(width=width, fill=fill, style=cell_style,
+                                             content=_run_content_xml(str(cell_text))))
+        for width in widths[len(row_data):]:
+            xml.append(_EMPTY_CELL_XML.format(width=width))
+        xml.append('</w:tr>')
+    xml.append('</w:tbl>')
+
+    tbl.extend(list(parse_xml(''.join(xml))))
+    return table
+
+
+class DocxRenderer:
+    """Renders the guide's blocks into a python-docx Document (a new, brand-styled one by default)"""
+
+    def __init__(self, doc=None):
+        if doc is None:
+            doc = Document()
+            apply_brand_styles(doc)
+        self.doc = doc
+
+    def start(self, title):
+        pass
+
+    def finish(self):
+        pass
+
+    def heading(self, text, level=1):
+        add_heading(self.doc, text, level)
+
+    def paragraph(self, text='', style=STYLE_BODY):
+        add_paragraph(self.doc, text, style)
+
+    def link_paragraph(self, text, link_text, target):
+        p = self.doc.add_paragraph(text)
+        add_hyperlink(p, link_text, target)
+
+    def table(self, headers, rows, col_widths=None):
+        create_branded_table(self.doc, headers, rows, col_widths)
+
+    def spacer(self):
+        self.doc.add_paragraph()
+
+    def page_break(self):
+        self.doc.add_page_break()
+
+    def accent_line(self):
+        add_yellow_accent_line(self.doc)
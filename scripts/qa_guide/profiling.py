@@ -0,0 +1,87 @@
+"""
+Per-stage wall time and allocation counts for generate-qa-guide.py --profile.
+
+Code marks its stages with `with stage(name):`, a no-op unless a profile()
+is running, so normal runs pay nothing. Stages nest (a stale template is
+rebuilt, section generators included, inside 'load template'); each is
+charged only its own share, so the summary adds up to the profiled total.
+
+Allocations are the net change in sys.getallocatedblocks() over a stage:
+objects still alive at its end, not everything it ever allocated. That is
+free to read, where tracemalloc roughly triples the build time and would
+distort the timings it sits next to.
+"""
+
+import contextlib
+import cProfile
+import sys
+import time
+
+_active = None
+
+
+class Profiler:
+    """Own time, net allocated blocks and call count of every stage, by name"""
+
+    def __init__(self):
+        self.stages = {}  # name -> [seconds, blocks, calls]
+        self.elapsed = None
+        self._children = []  # [seconds, blocks] spent in nested stages, per open stage
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        self._children.append([0.0, 0])
+        blocks = sys.getallocatedblocks()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            blocks = sys.getallocatedblocks() - blocks
+            child_seconds, child_blocks = self._children.pop()
+            entry = self.stages.setdefault(name, [0.0, 0, 0])
+            entry[0] += seconds - child_seconds
+            entry[1] += blocks - child_blocks
+            entry[2] += 1
+            if self._children:
+                self._children[-1][0] += seconds
+                self._children[-1][1] += blocks
+
+    def summary(self):
+        """The stages as a table, slowest first, with the time outside any stage last"""
+        rows = sorted(self.stages.items(), key=lambda item: item[1][0], reverse=True)
+        other = self.elapsed - sum(seconds for seconds, _blocks, _calls in self.stages.values())
+        width = max([len(name) for name in self.stages] + [len('(outside any stage)')])
+
+        lines = [f'Profile: {self.elapsed:.3f}s wall',
+                 f'  {"Stage":<{width}}  {"Time":>8}  {"%":>6}  {"Net blocks":>11}  {"Calls":>5}']
+        for name, (seconds, blocks, calls) in rows:
+            lines.append(f'  {name:<{width}}  {seconds:>7.3f}s  {100 * seconds / self.elapsed:>5.1f}%  '
+                         f'{blocks:>+11,}  {calls:>5}')
+        lines.append(f'  {"(outside any stage)":<{width}}  {other:>7.3f}s  {100 * other / self.elapsed:>5.1f}%')
+        return '\n'.join(lines)
+
+
+def stage(name):
+    """Context manager timing `name` in the running profile, if any"""
+    return _active.stage(name) if _active else contextlib.nullcontext()
+
+
+@contextlib.contextmanager
+def profile(dump_path=None):
+    """Profile the block; with dump_path, also run it under cProfile and write the stats there"""
+    global _active
+    profiler = Profiler()
+    cprofile = cProfile.Profile() if dump_path else None
+    _active = profiler
+    started = time.perf_counter()
+    if cprofile:
+        cprofile.enable()
+    try:
+        yield profiler
+    finally:
+        if cprofile:
+            cprofile.disable()
+            cprofile.dump_stats(dump_path)
+        profiler.elapsed = time.perf_counter() - started
+        _active = None
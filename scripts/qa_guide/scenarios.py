@@ -0,0 +1,65 @@
+"""
+Per-role statistics from scenario rows or from the category counts view.
+"""
+
+import re
+from collections import defaultdict
+
+from .branding import CATEGORY_LABELS
+
+
+def extract_category_code(name):
+    """Extract category code from scenario name (e.g., 'CA-01' -> 'CA')"""
+    if '-' in name:
+        parts = name.split('-')
+        code = parts[0].strip()
+        if code in CATEGORY_LABELS:
+            return code
+    return 'OTHER'
+
+
+def group_scenarios_by_role(scenarios):
+    """Group scenarios by role and category"""
+
+    role_data = defaultdict(lambda: {
+        'scenarios': [],
+        'total': 0,
+        'categories': defaultdict(int)
+    })
+
+    for scenario in scenarios:
+        role = scenario['role_required']
+        role_data[role]['scenarios'].append(scenario)
+        role_data[role]['total'] += 1
+
+        # Extract category from scenario name
+        category = extract_category_code(scenario['name'])
+        role_data[role]['categories'][category] += 1
+
+    return role_data
+
+
+def role_data_from_counts(counts):
+    """Same shape as group_scenarios_by_role, built from qa_scenario_category_counts rows.
+
+    'scenarios' stays empty: only the totals and category counts are known.
+    """
+    role_data = defaultdict(lambda: {
+        'scenarios': [],
+        'total': 0,
+        'categories': defaultdict(int)
+    })
+
+    for row in counts:
+        data = role_data[row['role_required']]
+        prefix = row['category_prefix']
+        code = prefix if prefix in CATEGORY_LABELS else 'OTHER'
+        data['categories'][code] += row['scenario_count']
+        data['total'] += row['scenario_count']
+
+    return role_data
+
+
+def natural_key(name):
+    """Sort key that puts 'PB-2' before 'PB-10'"""
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', name)]
@@ -0,0 +1,416 @@
+"""
+The guide's sections. Every generator writes through a renderer (heading,
+paragraph in a BRAND_STYLES style, table, spacer, page break), so the same
+code produces the DOCX, HTML and Markdown versions.
+
+Sections that depend on the scenarios go in TEMPLATE_SLOTS; everything else
+is static and can be prebuilt once (see build.py).
+"""
+
+import functools
+
+from .accounts import get_accounts
+from .branding import (
+    CATEGORY_LABELS, ROLE_DESCRIPTIONS, ROLE_DISPLAY, STYLE_COVER_BRAND, STYLE_COVER_FOOTER,
+    STYLE_COVER_NOTE, STYLE_COVER_SUBTITLE, STYLE_COVER_TITLE, STYLE_IMPORTANT, STYLE_LABEL, STYLE_MUTED,
+)
+from .profiling import stage
+
+# Where the scenario-dependent parts go in the template, in document order
+TEMPLATE_SLOTS = ('ROLE_SECTIONS', 'QUICK_REFERENCE')
+
+
+def generate_cover_page(out):
+    """Generate the cover page"""
+    # GENERA logo (text with yellow accent)
+    out.paragraph('GENERA', STYLE_COVER_BRAND)
+
+    out.accent_line()
+    out.spacer()  # Spacing
+
+    out.paragraph('Guía del QA Tester', STYLE_COVER_TITLE)
+    out.paragraph('Manual de Pruebas — Sistema QA GENERA', STYLE_COVER_SUBTITLE)
+
+    out.spacer()  # Spacing
+
+    out.paragraph('Versión 2.0 — Febrero 2026', STYLE_COVER_NOTE)
+
+    # Add spacing
+    for _ in range(8):
+        out.spacer()
+
+    out.paragraph('Fundación Nativa Educación', STYLE_COVER_FOOTER)
+
+    out.page_break()
+
+
+def generate_introduction(out):
+    """Generate Section 1: Introducción"""
+    out.heading('Sección 1: Introducción', level=1)
+
+    out.paragraph(
+        'El Sistema QA de GENERA es una herramienta integral para asegurar la calidad '
+        'del Learning Management System (LMS). Este manual proporciona instrucciones '
+        'detalladas para realizar pruebas manuales de todas las funcionalidades del sistema.')
+
+    out.spacer()
+
+    out.paragraph(
+        'Un "escenario de prueba" es una secuencia de pasos que verifica que una '
+        'funcionalidad específica funciona correctamente. Cada escenario incluye '
+        'precondiciones, instrucciones paso a paso y resultados esperados.')
+
+    out.spacer()
+
+    out.paragraph('Los 8 Roles del Sistema:', STYLE_LABEL)
+
+    role_table_data = []
+    for role_key in ['admin', 'docente', 'community_manager', 'equipo_directivo',
+                     'lider_generacion', 'consultor', 'supervisor_de_red', 'lider_comunidad']:
+        role_table_data.append([
+            ROLE_DISPLAY[role_key],
+            ROLE_DESCRIPTIONS[role_key][:80] + '...'
+        ])
+
+    out.table(['Rol', 'Descripción'], role_table_data, [1.5, 5.0])
+
+    out.page_break()
+
+
+def generate_login_section(out):
+    """Generate Section 2: Cómo Iniciar Sesión"""
+    accounts = get_accounts()
+    out.heading('Sección 2: Cómo Iniciar Sesión', level=1)
+
+    out.paragraph('Pasos para Iniciar Sesión:', STYLE_LABEL)
+    out.paragraph('1. Navega a: https://fne-lms.vercel.app')
+    out.paragraph(f'2. Ingresa tu correo de prueba (ver tabla abajo)')
+    out.paragraph(f'3. Ingresa la contraseña: {accounts.password}')
+    out.paragraph('4. Haz clic en "Iniciar Sesión"')
+    out.paragraph('5. Serás redirigido al dashboard correspondiente')
+
+    out.spacer()
+
+    out.paragraph('Cuentas de Prueba:', STYLE_LABEL)
+
+    account_rows = []
+    for role_key, email, notes in accounts.accounts:
+        role_display = ROLE_DISPLAY.get(role_key, role_key.replace('_', ' ').title())
+        account_rows.append([role_display, email, notes])
+
+    out.table(['Rol', 'Email', 'Notas'], account_rows, [1.8, 2.8, 2.0])
+
+    out.spacer()
+
+    out.paragraph(f'IMPORTANTE: Todas las cuentas usan la misma contraseña: {accounts.password}',
+                  STYLE_IMPORTANT)
+
+    out.spacer()
+
+    out.paragraph('Cómo Acceder a la Página QA:', STYLE_LABEL)
+    out.paragraph('1. Después de iniciar sesión, navega a: /qa')
+    out.paragraph('2. Verás tus escenarios asignados')
+    out.paragraph('3. Haz clic en "Iniciar Prueba" para comenzar')
+
+    out.page_break()
+
+
+def generate_widget_section(out):
+    """Generate Section 3: Cómo Usar el Widget de QA"""
+    out.heading('Sección 3: Cómo Usar el Widget de QA', level=1)
+
+    out.paragraph('El widget flotante es tu herramienta principal para ejecutar pruebas.')
+
+    out.spacer()
+
+    out.paragraph('Iniciar una Prueba:', STYLE_LABEL)
+    out.paragraph('1. En la página /qa, busca tu escenario asignado')
+    out.paragraph('2. Haz clic en el botón "Iniciar Prueba"')
+    out.paragraph('3. El widget flotante aparecerá en la esquina inferior derecha')
+
+    out.spacer()
+
+    out.paragraph('Durante la Prueba:', STYLE_LABEL)
+    out.paragraph('1. Lee la instrucción del paso actual')
+    out.paragraph('2. Realiza la acción descrita')
+    out.paragraph('3. Verifica que el resultado esperado ocurra')
+    out.paragraph('4. Marca el resultado:')
+    out.paragraph('   - APROBAR: El resultado esperado ocurrió')
+    out.paragraph('   - REPROBAR: Algo salió mal (captura automática de pantalla)')
+    out.paragraph('   - OMITIR: El paso no es aplicable')
+    out.paragraph('5. Agrega notas opcionales para contexto')
+    out.paragraph('6. Haz clic en "Siguiente" para continuar')
+
+    out.spacer()
+
+    out.paragraph('Características del Widget:', STYLE_LABEL)
+    out.paragraph('• Arrastrable: Haz clic y arrastra para reposicionar')
+    out.paragraph('• Minimizable: Haz clic en el botón minimizar para colapsar')
+    out.paragraph('• Auto-guardado: Progreso se guarda cada 15 segundos')
+    out.paragraph('• Navegación: El widget persiste cuando navegas entre páginas')
+    out.paragraph('• Capturas: Automáticas en fallos, manuales con el icono de cámara')
+
+    out.spacer()
+
+    out.paragraph('Finalizar una Prueba:', STYLE_LABEL)
+    out.paragraph('1. Después del último paso, haz clic en "Finalizar Prueba"')
+    out.paragraph('2. Revisa el resumen de aprobados/reprobados')
+    out.paragraph('3. La prueba se guarda en la base de datos')
+    out.paragraph('4. Tu asignación se actualiza automáticamente')
+
+    out.page_break()
+
+
+def generate_role_section(out, role_key, role_data, section_num):
+    """Generate a role-specific section"""
+
+    role_display = ROLE_DISPLAY[role_key]
+    scenario_count = role_data['total']
+
+    # Section header
+    out.heading(f'Sección {section_num}: {role_display} — {scenario_count} Escenarios', level=1)
+
+    # Test account box
+    accounts = get_accounts()
+    out.paragraph('Cuenta de Prueba:', STYLE_LABEL)
+    out.table(['Email', 'Contraseña'], [[accounts.email_for(role_key), accounts.password]], [3.0, 2.0])
+
+    out.spacer()
+
+    # Category summary table
+    out.paragraph('Resumen de Categorías:', STYLE_LABEL)
+
+    category_rows = []
+    for code, count in sorted(role_data['categories'].items(), key=lambda x: x[1], reverse=True):
+        if code in CATEGORY_LABELS:
+            label, description = CATEGORY_LABELS[code]
+            category_rows.append([code, label, description, count])
+
+    out.table(['Código', 'Categoría', 'Qué se prueba', 'Cantidad'],
+                        category_rows, [0.8, 1.8, 2.8, 0.8])
+
+    out.spacer()
+
+    # Role description
+    out.paragraph('Descripción del Rol:', STYLE_LABEL)
+    out.paragraph(ROLE_DESCRIPTIONS[role_key])
+
+    out.spacer()
+
+    # Note about detailed scenarios
+    out.paragraph(
+        'Los escenarios detallados (pasos y resultados esperados) se encuentran en la '
+        'plataforma /qa. Inicia sesión con la cuenta indicada arriba para ver la lista '
+        'completa de escenarios asignados a este rol.',
+        STYLE_MUTED)
+
+    out.page_break()
+
+
+def generate_multi_user_section(out):
+    """Generate Section 12: Pruebas Multi-Usuario"""
+    out.heading('Sección 12: Cuentas de Prueba Multi-Usuario', level=1)
+
+    out.paragraph(
+        'Algunos escenarios requieren múltiples usuarios para probar sincronización en tiempo real.')
+
+    out.spacer()
+
+    out.paragraph('Configuración de Navegadores:', STYLE_LABEL)
+    out.paragraph('1. Chrome (ventana normal) → estudiante1.qa@fne.cl (Usuario A - Tab 1)')
+    out.paragraph('2. Chrome (incógnito) → estudiante2.qa@fne.cl (Usuario B - Tab 2)')
+    out.paragraph('3. Firefox (opcional) → estudiante3.qa@fne.cl (Usuario C - Tab 3)')
+
+    out.spacer()
+
+    out.paragraph('Ejecutar Pruebas Multi-Usuario:', STYLE_LABEL)
+    out.paragraph('1. Los escenarios incluyen campos "actor" y "tabIndicator"')
+    out.paragraph('2. Cada paso especifica qué usuario realiza la acción:')
+    out.paragraph('   - "Usuario A: Navegar al espacio colaborativo"')
+    out.paragraph('   - "Usuario B: Enviar un mensaje"')
+    out.paragraph('3. Los indicadores de tab (1, 2, 3) muestran qué sesión usar')
+    out.paragraph('4. Verifica sincronización: acciones en un tab aparecen en otros')
+
+    out.spacer()
+
+    out.paragraph('Ejemplo Multi-Usuario:', STYLE_LABEL)
+    out.paragraph('Paso 1 - Usuario A (Tab 1): Navegar al espacio colaborativo',
+                  STYLE_MUTED)
+    out.paragraph('Paso 2 - Usuario B (Tab 2): Navegar al mismo grupo',
+                  STYLE_MUTED)
+    out.paragraph('Paso 3 - Usuario A (Tab 1): Enviar un mensaje de prueba',
+                  STYLE_MUTED)
+    out.paragraph('Paso 4 - Usuario B (Tab 2): Verificar que el mensaje aparece SIN refrescar',
+                  STYLE_MUTED)
+
+    out.page_break()
+
+
+def generate_best_practices_section(out):
+    """Generate Section 13: Consejos y Buenas Prácticas"""
+    out.heading('Sección 13: Consejos y Buenas Prácticas', level=1)
+
+    out.paragraph('Consejos para Testers:', STYLE_LABEL)
+    out.paragraph('• Lee las instrucciones cuidadosamente antes de cada paso')
+    out.paragraph('• No te apresures — la precisión es más importante que la velocidad')
+    out.paragraph('• Escribe notas descriptivas cuando algo falla')
+    out.paragraph('• Si un paso no es claro, pregunta al equipo de desarrollo')
+    out.paragraph('• Captura pantallas adicionales si encuentras comportamiento inesperado')
+    out.paragraph('• Verifica que el resultado esperado ocurra ANTES de marcar "Aprobar"')
+
+    out.spacer()
+
+    out.paragraph('Solución de Problemas:', STYLE_LABEL)
+
+    troubleshooting_rows = [
+        ['Widget no aparece', 'Refresca la página, verifica que tengas permisos de QA'],
+        ['Progreso perdido', 'Verifica session storage, busca pruebas parciales en historial'],
+        ['Capturas no suben', 'Verifica conexión, intenta captura manual con icono de cámara'],
+        ['Sincronización multi-usuario', 'Verifica que ambos usuarios estén en el mismo grupo/canal']
+    ]
+
+    out.table(['Problema', 'Solución'], troubleshooting_rows, [2.0, 4.5])
+
+    out.page_break()
+
+
+def generate_quick_reference_section(out, role_data):
+    """Generate Section 14: Referencia Rápida"""
+    out.heading('Sección 14: Referencia Rápida', level=1)
+
+    # Order roles by scenario count
+    ordered_roles = sorted(role_data.items(),
+                          key=lambda x: x[1]['total'],
+                          reverse=True)
+
+    accounts = get_accounts()
+    ref_rows = []
+    for role_key, data in ordered_roles:
+        role_display = ROLE_DISPLAY[role_key]
+        scenario_count = data['total']
+
+        ref_rows.append([
+            role_display,
+            accounts.email_for(role_key),
+            scenario_count,
+            'https://fne-lms.vercel.app'
+        ])
+
+    out.table(['Rol', 'Cuenta', 'Escenarios', 'URL'],
+                        ref_rows, [1.5, 2.5, 1.0, 1.5])
+
+    out.page_break()
+
+
+def generate_glossary_section(out):
+    """Generate Appendix: Glosario de Códigos"""
+    out.heading('Apéndice: Glosario de Códigos de Categoría', level=1)
+
+    glossary_rows = []
+    for code in sorted(CATEGORY_LABELS.keys()):
+        label, description = CATEGORY_LABELS[code]
+        glossary_rows.append([code, label, description])
+
+    out.table(['Código', 'Categoría', 'Descripción'],
+                        glossary_rows, [0.8, 2.0, 3.7])
+
+
+def generate_scenario_detail(out, scenario):
+    """One scenario in full: metadata, description, preconditions and steps"""
+    out.heading(scenario['name'], level=2)
+
+    out.paragraph(
+        f"Área: {scenario.get('feature_area') or '—'} · Prioridad: {scenario.get('priority')} · "
+        f"Duración estimada: {scenario.get('estimated_duration_minutes')} min",
+        STYLE_MUTED)
+
+    if scenario.get('description'):
+        out.paragraph(scenario['description'])
+
+    preconditions = scenario.get('preconditions') or []
+    if preconditions:
+        out.paragraph('Precondiciones:', STYLE_LABEL)
+        for i, precondition in enumerate(preconditions, 1):
+            out.paragraph(f"{i}. {precondition.get('description', '')}")
+
+    out.paragraph('Pasos:', STYLE_LABEL)
+    steps = scenario.get('steps') or []
+    out.table(['#', 'Instrucción', 'Resultado esperado'],
+              ([step.get('index') or i, step.get('instruction', ''), step.get('expectedOutcome', '')]
+               for i, step in enumerate(steps, 1)),
+              [0.4, 3.2, 2.9])
+
+    out.spacer()
+
+
+def run_section(out, label, generate):
+    """Print the section's label and render it, as one --profile stage"""
+    print(f'  {label}')
+    with stage(label):
+        generate(out)
+
+
+def generate_static_parts(out, slot):
+    """Every part that does not depend on the scenarios, in order; calls slot(name) where one does"""
+    run_section(out, 'Cover page', generate_cover_page)
+    run_section(out, 'Sección 1: Introducción', generate_introduction)
+    run_section(out, 'Sección 2: Cómo Iniciar Sesión', generate_login_section)
+    run_section(out, 'Sección 3: Cómo Usar el Widget de QA', generate_widget_section)
+
+    slot('ROLE_SECTIONS')
+
+    run_section(out, 'Sección 12: Pruebas Multi-Usuario', generate_multi_user_section)
+    run_section(out, 'Sección 13: Consejos y Buenas Prácticas', generate_best_practices_section)
+
+    slot('QUICK_REFERENCE')
+
+    run_section(out, 'Apéndice: Glosario de Códigos', generate_glossary_section)
+
+
+def dynamic_sections(role_data):
+    """[(slot, key, label, inputs, generate)] for every scenario-dependent section, in document order.
+
+    `inputs` is everything the section's content depends on besides the package
+    source (whose hash is in the template fingerprint); generate(out) renders it.
+    """
+    accounts = get_accounts()
+    ordered_roles = sorted(role_data.items(),
+                          key=lambda x: x[1]['total'],
+                          reverse=True)
+
+    sections = []
+    # Role sections (4-11)
+    for section_num, (role_key, data) in enumerate(ordered_roles, 4):
+        inputs = {
+            'section': section_num,
+            'role': role_key,
+            'total': data['total'],
+            'categories': dict(data['categories']),
+            'account': accounts.email_for(role_key),
+            'password': accounts.password,
+        }
+        sections.append((
+            'ROLE_SECTIONS', f'role:{role_key}', f'Section {section_num}: {ROLE_DISPLAY[role_key]}', inputs,
+            functools.partial(generate_role_section, role_key=role_key, role_data=data, section_num=section_num),
+        ))
+
+    inputs = [[role_key, data['total'], accounts.email_for(role_key)] for role_key, data in ordered_roles]
+    sections.append((
+        'QUICK_REFERENCE', 'quick_reference', 'Sección 14: Referencia Rápida', inputs,
+        functools.partial(generate_quick_reference_section, role_data=role_data),
+    ))
+    return sections
+
+
+def generate_dynamic_part(out, slot, role_data):
+    """The content of one TEMPLATE_SLOTS entry"""
+    for section_slot, _key, label, _inputs, generate in dynamic_sections(role_data):
+        if section_slot == slot:
+            run_section(out, label, generate)
+
+
+def render_guide(out, role_data):
+    """Render the whole guide through any renderer (DocxRenderer, HtmlRenderer, MarkdownRenderer)"""
+    out.start('Guía del QA Tester — GENERA')
+    generate_static_parts(out, lambda slot: generate_dynamic_part(out, slot, role_data))
+    out.finish()
@@ -0,0 +1,97 @@
+"""
+Scenarios for the guide: from Supabase through qa_scenarios_client (which
+imports requests only when it opens a session), or from the local snapshot.
+
+These are command-line paths: failures print an ERROR line and exit.
+"""
+
+import os
+import sys
+
+import qa_scenarios_client
+
+from . import REPO_ROOT
+from .profiling import stage
+from .scenarios import group_scenarios_by_role, role_data_from_counts
+
+
+def load_env():
+    """Load environment variables from .env.local"""
+    env_path = os.path.join(REPO_ROOT, '.env.local')
+    env_vars = {}
+
+    if not os.path.exists(env_path):
+        print(f"ERROR: .env.local not found at {env_path}")
+        sys.exit(1)
+
+    with open(env_path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#') and '=' in line:
+                key, value = line.split('=', 1)
+                env_vars[key] = value.strip().strip('"').strip("'")
+
+    return env_vars
+
+
+def load_credentials():
+    """(Supabase URL, service-role key) from .env.local"""
+    env = load_env()
+    supabase_url = env.get('NEXT_PUBLIC_SUPABASE_URL')
+    service_key = env.get('SUPABASE_SERVICE_ROLE_KEY')
+
+    if not supabase_url or not service_key:
+        print('ERROR: Missing Supabase credentials in .env.local')
+        sys.exit(1)
+
+    return supabase_url, service_key
+
+
+def sync_scenarios(supabase_url, service_key, snapshot_path, page_size=qa_scenarios_client.PAGE_SIZE,
+                   concurrency=1, columns=qa_scenarios_client.SCENARIO_COLUMNS):
+    """Refresh the local snapshot from Supabase and return its active, non-automated scenarios"""
+    with stage('fetch'):
+        snapshot = qa_scenarios_client.load_snapshot(snapshot_path)
+        try:
+            snapshot, stats = qa_scenarios_client.refresh_snapshot(
+                supabase_url, service_key, snapshot, page_size=page_size, concurrency=concurrency
+            )
+        except qa_scenarios_client.FetchError as e:
+            print(f"ERROR: Failed to fetch scenarios: {e}")
+            sys.exit(1)
+
+    with stage('save snapshot'):
+        qa_scenarios_client.save_snapshot(snapshot_path, snapshot)
+    deleted = f", {stats['missed']} missed, {stats['deleted']} deleted" if stats['idScan'] else ''
+    print(f"  snapshot {stats['mode']} refresh: {stats['changed']} rows fetched{deleted}")
+    return qa_scenarios_client.snapshot_scenarios(snapshot, columns)
+
+
+def load_offline_scenarios(snapshot_path, columns=qa_scenarios_client.SCENARIO_COLUMNS):
+    """Active, non-automated scenarios from the local snapshot only"""
+    with stage('load snapshot'):
+        snapshot = qa_scenarios_client.load_snapshot(snapshot_path)
+    if snapshot is None:
+        print(f'ERROR: No usable scenario snapshot at {snapshot_path}')
+        print('Run once without --offline (with .env.local credentials) to create it.')
+        sys.exit(1)
+    print(f"  offline: snapshot last synced {snapshot['lastSync']}")
+    return qa_scenarios_client.snapshot_scenarios(snapshot, columns)
+
+
+def fetch_role_data(supabase_url, service_key, aggregate, snapshot_path, page_size, concurrency):
+    """Per-role statistics, from the counts view when asked, else from every scenario row"""
+    if aggregate:
+        try:
+            with stage('fetch'):
+                counts = qa_scenarios_client.fetch_category_counts(supabase_url, service_key)
+            print(f'  {len(counts)} role/category counts fetched')
+            with stage('group'):
+                return role_data_from_counts(counts)
+        except qa_scenarios_client.FetchError as e:
+            print(f'WARNING: counts view unavailable ({e}); falling back to the full scenario fetch')
+
+    scenarios = sync_scenarios(supabase_url, service_key, snapshot_path, page_size, concurrency)
+    print(f'  {len(scenarios)} scenarios')
+    with stage('group'):
+        return group_scenarios_by_role(scenarios)
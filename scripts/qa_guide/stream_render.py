@@ -0,0 +1,160 @@
+"""
+Renderers that stream the guide as text: a standalone HTML page and
+GitHub-flavored Markdown. Neither needs python-docx.
+"""
+
+import html
+
+from .branding import (
+    BRAND_STYLES, COLOR_ACCENT, COLOR_ACCENT_HOVER, COLOR_BORDER, COLOR_GRAY_LIGHT, COLOR_PRIMARY,
+    FONT_NAME, STYLE_BODY, STYLE_COVER_BRAND, STYLE_COVER_FOOTER, STYLE_COVER_NOTE, STYLE_COVER_SUBTITLE,
+    STYLE_COVER_TITLE, STYLE_IMPORTANT, STYLE_LABEL, STYLE_MUTED, STYLE_TABLE_CELL, STYLE_TABLE_HEADER,
+)
+
+
+# Elements the HTML export styles directly; other BRAND_STYLES become classes.
+HTML_SELECTORS = {
+    STYLE_BODY: 'p',
+    'Heading 1': 'h1',
+    'Heading 2': 'h2',
+    'Heading 3': 'h3',
+    STYLE_TABLE_HEADER: 'th',
+    STYLE_TABLE_CELL: 'td',
+}
+
+
+def html_class(style):
+    return style.lower().replace(' ', '-')
+
+
+def brand_css():
+    """The BRAND_STYLES as a stylesheet, so HTML and DOCX share one definition"""
+    rules = [
+        f'body {{ font-family: {FONT_NAME}, Inter, sans-serif; color: #{COLOR_PRIMARY}; '
+        f'max-width: 52rem; margin: 2rem auto; padding: 0 1rem; }}',
+        'p, td, th { white-space: pre-wrap; }',
+        f'hr.accent {{ border: 0; height: 4px; background: #{COLOR_ACCENT}; }}',
+        f'table {{ border-collapse: collapse; width: 100%; margin: 0.5rem 0; }}',
+        f'td, th {{ border: 1px solid #{COLOR_BORDER}; padding: 0.25rem 0.5rem; text-align: left; }}',
+        f'th {{ background: #{COLOR_ACCENT}; }}',
+        f'tbody tr:nth-child(even) {{ background: #{COLOR_GRAY_LIGHT}; }}',
+        f'a {{ color: #{COLOR_ACCENT_HOVER}; }}',
+        '@media print { .page-break { break-after: page; } }',
+    ]
+    for name, (size, bold, color, centered) in BRAND_STYLES.items():
+        selector = HTML_SELECTORS.get(name) or f'p.{html_class(name)}'
+        declarations = f'font-size: {size}pt; font-weight: {"bold" if bold else "normal"}; color: #{color};'
+        if centered:
+            declarations += ' text-align: center;'
+        rules.append(f'{selector} {{ {declarations} }}')
+    return '\n'.join(rules)
+
+
+class HtmlRenderer:
+    """Streams the guide as a standalone HTML page to a text file handle; nothing is kept in memory"""
+
+    def __init__(self, out):
+        self.out = out
+
+    def start(self, title):
+        self.out.write(
+            '<!DOCTYPE html>\n<html lang="es">\n<head>\n<meta charset="utf-8">\n'
+            f'<title>{html.escape(title)}</title>\n<style>\n{brand_css()}\n</style>\n</head>\n<body>\n'
+        )
+
+    def finish(self):
+        self.out.write('</body>\n</html>\n')
+
+    def heading(self, text, level=1):
+        self.out.write(f'<h{level}>{html.escape(text)}</h{level}>\n')
+        if level == 1:
+            self.accent_line()
+
+    def paragraph(self, text='', style=STYLE_BODY):
+        css_class = '' if style in HTML_SELECTORS else f' class="{html_class(style)}"'
+        self.out.write(f'<p{css_class}>{html.escape(text)}</p>\n')
+
+    def link_paragraph(self, text, link_text, target):
+        self.out.write(f'<p>{html.escape(text)}<a href="{html.escape(target)}">{html.escape(link_text)}</a></p>\n')
+
+    def table(self, headers, rows, col_widths=None):
+        self.out.write('<table>\n')
+        if col_widths:
+            total = sum(col_widths)
+            cols = ''.join(f'<col style="width: {100 * w / total:.1f}%">' for w in col_widths)
+            self.out.write(f'<colgroup>{cols}</colgroup>\n')
+        cells = ''.join(f'<th>{html.escape(h)}</th>' for h in headers)
+        self.out.write(f'<thead><tr>{cells}</tr></thead>\n<tbody>\n')
+        for row_data in rows:
+            cells = ''.join(f'<td>{html.escape(str(cell_text))}</td>' for cell_text in row_data)
+            self.out.write(f'<tr>{cells}</tr>\n')
+        self.out.write('</tbody>\n</table>\n')
+
+    def spacer(self):
+        pass  # margins do the spacing
+
+    def page_break(self):
+        self.out.write('<div class="page-break"></div>\n')
+
+    def accent_line(self):
+        self.out.write('<hr class="accent">\n')
+
+
+# Emphasis markers for the paragraph styles Markdown can express
+MARKDOWN_EMPHASIS = {
+    STYLE_LABEL: '**',
+    STYLE_IMPORTANT: '**',
+    STYLE_COVER_BRAND: '**',
+    STYLE_COVER_TITLE: '**',
+    STYLE_MUTED: '*',
+    STYLE_COVER_SUBTITLE: '*',
+    STYLE_COVER_NOTE: '*',
+    STYLE_COVER_FOOTER: '*',
+}
+
+
+def markdown_cell(value):
+    return str(value).replace('|', '\\|').replace('\r\n', '<br>').replace('\n', '<br>')
+
+
+class MarkdownRenderer:
+    """Streams the guide as GitHub-flavored Markdown to a text file handle"""
+
+    def __init__(self, out):
+        self.out = out
+
+    def start(self, title):
+        pass
+
+    def finish(self):
+        pass
+
+    def heading(self, text, level=1):
+        self.out.write(f'{"#" * level} {text}\n\n')
+
+    def paragraph(self, text='', style=STYLE_BODY):
+        if not text.strip():
+            return
+        marker = MARKDOWN_EMPHASIS.get(style, '')
+        if marker:
+            text = f'{marker}{text.strip()}{marker}'
+        self.out.write(text.replace('\n', '  \n') + '\n\n')
+
+    def link_paragraph(self, text, link_text, target):
+        self.out.write(f'{text}[{link_text}]({target})\n\n')
+
+    def table(self, headers, rows, col_widths=None):
+        self.out.write('| ' + ' | '.join(markdown_cell(h) for h in headers) + ' |\n')
+        self.out.write('|' + '---|' * len(headers) + '\n')
+        for row_data in rows:
+            self.out.write('| ' + ' | '.join(markdown_cell(c) for c in row_data) + ' |\n')
+        self.out.write('\n')
+
+    def spacer(self):
+        pass
+
+    def page_break(self):
+        self.out.write('---\n\n')
+
+    def accent_line(self):
+        pass
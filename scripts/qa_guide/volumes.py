@@ -0,0 +1,116 @@
+"""
+Per-role volumes: one printable DOCX per role with every scenario's
+preconditions and steps, plus an index document linking them.
+
+build_role_volume() is module-level and takes everything it needs as
+arguments (account included), so the process pool can run it under any
+start method.
+"""
+
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .accounts import get_accounts
+from .branding import CATEGORY_LABELS, ROLE_DESCRIPTIONS, ROLE_DISPLAY, STYLE_LABEL
+from .docx_render import DocxRenderer
+from .scenarios import extract_category_code, natural_key
+from .sections import generate_cover_page, generate_scenario_detail
+
+VOLUME_INDEX_NAME = 'GUIA_QA_VOLUMENES.docx'
+
+
+def volume_file_name(role_key):
+    """File name of a role's volume, relative to the index document"""
+    return f'GUIA_QA_{role_key.upper()}.docx'
+
+
+def build_role_volume(role_key, scenarios, account_email, password, output_path):
+    """Write one role's detailed volume. Runs in a worker process; returns (role_key, count, seconds)."""
+    started = time.perf_counter()
+    role_display = ROLE_DISPLAY.get(role_key, role_key)
+
+    out = DocxRenderer()
+
+    out.heading(f'{role_display} — {len(scenarios)} Escenarios', level=1)
+    out.paragraph('Cuenta de Prueba:', STYLE_LABEL)
+    out.table(['Email', 'Contraseña'], [[account_email, password]], [3.0, 2.0])
+    out.spacer()
+    out.paragraph(ROLE_DESCRIPTIONS.get(role_key, ''))
+
+    # Scenarios grouped by category, in glossary order, OTHER last
+    by_category = defaultdict(list)
+    for scenario in scenarios:
+        by_category[extract_category_code(scenario['name'])].append(scenario)
+    for code in [*CATEGORY_LABELS, 'OTHER']:
+        if code not in by_category:
+            continue
+        out.page_break()
+        label = CATEGORY_LABELS[code][0] if code in CATEGORY_LABELS else 'Otros'
+        out.heading(f'{code}: {label} ({len(by_category[code])})', level=1)
+        for scenario in sorted(by_category[code], key=lambda s: natural_key(s['name'])):
+            generate_scenario_detail(out, scenario)
+
+    out.doc.save(output_path)
+    return role_key, len(scenarios), time.perf_counter() - started
+
+
+def generate_volume_index(volumes, output_path):
+    """Index document linking every volume; `volumes` is [(role_key, count), ...]"""
+    out = DocxRenderer()
+    generate_cover_page(out)
+
+    out.heading('Volúmenes de Escenarios por Rol', level=1)
+    out.paragraph(
+        'Cada volumen contiene todos los escenarios asignados a un rol, con sus precondiciones '
+        'y pasos. Los archivos deben permanecer en la misma carpeta que este índice.')
+    out.spacer()
+
+    for role_key, count in volumes:
+        out.link_paragraph(f'{ROLE_DISPLAY.get(role_key, role_key)} — {count} escenarios: ',
+                           volume_file_name(role_key), volume_file_name(role_key))
+
+    out.doc.save(output_path)
+
+
+def build_volumes(scenarios, output_dir, jobs):
+    """Build every role volume (in `jobs` processes) and the index; returns [(role_key, count, seconds)]"""
+    os.makedirs(output_dir, exist_ok=True)
+
+    by_role = defaultdict(list)
+    for scenario in scenarios:
+        by_role[scenario['role_required']].append(scenario)
+    ordered_roles = sorted(by_role, key=lambda role_key: len(by_role[role_key]), reverse=True)
+
+    accounts = get_accounts()
+    tasks = [
+        (role_key, by_role[role_key],
+         accounts.email_for(role_key), accounts.password,
+         os.path.join(output_dir, volume_file_name(role_key)))
+        for role_key in ordered_roles
+    ]
+
+    started = time.perf_counter()
+    results = []
+    if jobs > 1 and len(tasks) > 1:
+        # Largest volumes are submitted first so they do not finish last.
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(build_role_volume, *task) for task in tasks]
+            for future in as_completed(futures):
+                results.append(future.result())
+                role_key, count, seconds = results[-1]
+                print(f'  {ROLE_DISPLAY.get(role_key, role_key)}: {count} escenarios, {seconds:.2f}s')
+    else:
+        for task in tasks:
+            results.append(build_role_volume(*task))
+            role_key, count, seconds = results[-1]
+            print(f'  {ROLE_DISPLAY.get(role_key, role_key)}: {count} escenarios, {seconds:.2f}s')
+
+    generate_volume_index([(role_key, len(by_role[role_key])) for role_key in ordered_roles],
+                          os.path.join(output_dir, VOLUME_INDEX_NAME))
+
+    wall = time.perf_counter() - started
+    print(f'  {len(results)} volumes in {wall:.2f}s wall, {sum(r[2] for r in results):.2f}s summed '
+          f'across {min(jobs, len(tasks))} process(es)')
+    return results
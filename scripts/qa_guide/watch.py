@@ -0,0 +1,255 @@
+"""
+generate-qa-guide.py --watch: rebuild the QA artifacts whenever their inputs are saved.
+
+What depends on what:
+- TEST_ACCOUNTS.md and the scenario snapshot -> the guide (incremental DOCX build)
+- a seed-<role>-scenarios.sql listed in qa_seed_sql.SEED_FILES -> that seed,
+  rewritten in place by rewrite-qa-comprehensive.py, then the steps migration
+  (generate-migration-v2.py), written to a preview file rather than
+  supabase/migrations unless --migration-out says otherwise
+The other seed-*-scenarios.sql files feed neither and are only reported.
+
+Files are polled (os.stat every POLL_INTERVAL; no inotify dependency, the
+same on macOS) and debounced: a batch is rebuilt once DEBOUNCE passes with
+no further writes, so an editor's write-then-rename or a multi-file save is
+one rebuild. A changed stat is confirmed by a content hash, so touching a
+file, or the rewriter writing back what was already there, triggers nothing.
+
+Everything stays warm between rebuilds: python-docx and the brand styles
+are loaded once, the snapshot is grouped once, and each seed's parsed
+scenarios are kept by content hash, so a save reparses only that file.
+"""
+
+import contextlib
+import glob
+import hashlib
+import importlib.util
+import io
+import os
+import time
+import traceback
+from datetime import datetime
+from pathlib import Path
+
+import qa_scenarios_client
+from qa_seed_sql import SEED_FILES
+
+from . import (
+    DEFAULT_ACCOUNTS_PATH, DEFAULT_MANIFEST_PATH, DEFAULT_MIGRATION_PREVIEW_PATH, DEFAULT_OUTPUT_PATH,
+    DEFAULT_SNAPSHOT_PATH, DEFAULT_TEMPLATE_PATH, PACKAGE_DIR, QA_DOCS_DIR,
+)
+from . import accounts
+from .build import build_guide_incremental
+from .scenarios import group_scenarios_by_role
+
+POLL_INTERVAL = 0.1  # seconds between stat scans
+DEBOUNCE = 0.25      # seconds without writes before a batch is rebuilt
+SEED_PATTERN = 'seed-*-scenarios.sql'
+
+
+def load_script(file_name):
+    """A script next to the package (hyphenated, so not importable by name) as a module"""
+    path = os.path.join(os.path.dirname(PACKAGE_DIR), file_name)
+    spec = importlib.util.spec_from_file_location(file_name[:-3].replace('-', '_'), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def content_hash(path):
+    """sha256 of the file at `path`, None if it is gone"""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def file_stat(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class Watcher:
+    """The watched files, their last seen state, and the warm state of every artifact"""
+
+    def __init__(self, docs_dir=QA_DOCS_DIR, accounts_path=DEFAULT_ACCOUNTS_PATH,
+                 snapshot_path=DEFAULT_SNAPSHOT_PATH, template_path=DEFAULT_TEMPLATE_PATH,
+                 manifest_path=DEFAULT_MANIFEST_PATH, output_path=DEFAULT_OUTPUT_PATH,
+                 migration_path=DEFAULT_MIGRATION_PREVIEW_PATH):
+        self.docs_dir = docs_dir
+        self.accounts_path = accounts_path
+        self.snapshot_path = snapshot_path
+        self.guide_paths = (template_path, manifest_path, output_path)
+
+        self.rewriter = load_script('rewrite-qa-comprehensive.py')
+        self.migration = load_script('generate-migration-v2.py')
+        self.migration_path = migration_path
+        self.seeds = [os.path.join(docs_dir, name) for name in SEED_FILES]
+
+        self.stats = {}    # path -> (mtime_ns, size) as last polled
+        self.hashes = {}   # path -> content hash as last rebuilt from
+        self.parsed = {}   # seed path -> (content hash, scenarios)
+        self.role_data = None
+
+    def watched(self):
+        return [self.accounts_path, self.snapshot_path,
+                *sorted(glob.glob(os.path.join(glob.escape(self.docs_dir), SEED_PATTERN)))]
+
+    def dependents(self, path):
+        """The artifacts to rebuild when `path` changes, in build order"""
+        if path in (self.accounts_path, self.snapshot_path):
+            return ['guide']
+        if path in self.seeds:
+            return ['seed rewrite', 'migration']
+        return []
+
+    def prime(self):
+        """Record every input's state and load everything a rebuild needs; returns seconds taken"""
+        started = time.perf_counter()
+        for path in self.watched():
+            self.stats[path] = file_stat(path)
+            self.hashes[path] = content_hash(path)
+        for path in self.seeds:
+            self.parse_seed(path)
+        self.load_role_data()
+        with contextlib.suppress(accounts.AccountsError):
+            accounts.use_accounts_file(self.accounts_path)
+            accounts.get_accounts()
+        return time.perf_counter() - started
+
+    def poll(self):
+        """Paths whose stat changed (or that appeared or vanished) since the last poll"""
+        changed = set()
+        watched = self.watched()
+        for path in set(watched) | set(self.stats):
+            stat = file_stat(path)
+            if stat != self.stats.get(path):
+                changed.add(path)
+                self.stats[path] = stat
+        return changed
+
+    def parse_seed(self, path):
+        """The seed's scenarios, reparsed only if its content changed; None if it is missing"""
+        digest = content_hash(path)
+        if digest is None:
+            self.parsed.pop(path, None)
+            return None
+        cached = self.parsed.get(path)
+        if cached is None or cached[0] != digest:
+            self.parsed[path] = (digest, self.migration.parse_seed_file(Path(path)))
+        return self.parsed[path][1]
+
+    def load_role_data(self):
+        snapshot = qa_scenarios_client.load_snapshot(self.snapshot_path)
+        self.role_data = None
+        if snapshot is not None:
+            self.role_data = group_scenarios_by_role(qa_scenarios_client.snapshot_scenarios(snapshot))
+
+    def rewrite_seeds(self, paths):
+        rewritten = []
+        for path in sorted(paths & set(self.seeds)):
+            if not os.path.exists(path):
+                continue
+            with contextlib.redirect_stdout(io.StringIO()):
+                if self.rewriter.process_file(Path(path)):
+                    rewritten.append(os.path.basename(path))
+            # Our own write is not a new save
+            self.stats[path] = file_stat(path)
+            self.hashes[path] = content_hash(path)
+        return f'{len(rewritten)} rewritten' + (f": {', '.join(rewritten)}" if rewritten else '')
+
+    def build_migration(self):
+        reparsed = sum(1 for path in self.seeds
+                       if path not in self.parsed or self.parsed[path][0] != content_hash(path))
+        all_scenarios = []
+        for path in self.seeds:
+            all_scenarios.extend(self.parse_seed(path) or [])
+        sql = self.migration.migration_sql(all_scenarios)
+        name = os.path.basename(self.migration_path)
+        try:
+            with open(self.migration_path, encoding='utf-8') as f:
+                if f.read() == sql:
+                    return f'{reparsed} seed(s) reparsed, {name} unchanged'
+        except OSError:
+            pass
+        with open(self.migration_path, 'w', encoding='utf-8') as f:
+            f.write(sql)
+        return f'{reparsed} seed(s) reparsed, {len(all_scenarios)} scenarios -> {name}'
+
+    def build_guide(self, paths):
+        if self.accounts_path in paths:
+            accounts.use_accounts_file(self.accounts_path)
+        if self.snapshot_path in paths or self.role_data is None:
+            self.load_role_data()
+        if self.role_data is None:
+            return f'skipped: no usable snapshot at {self.snapshot_path}'
+        accounts.get_accounts()  # AccountsError while TEST_ACCOUNTS.md is half-edited
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = build_guide_incremental(self.role_data, *self.guide_paths)
+        if result is None:
+            return 'up to date'
+        rebuilt, reused = result
+        return f'{len(rebuilt)} sections rebuilt, {len(reused)} reused'
+
+    def rebuild(self, paths):
+        """Rebuild what depends on the files in `paths` whose content changed.
+
+        Prints one line per artifact with its time; returns the artifacts rebuilt, in order.
+        """
+        modified = set()
+        for path in paths:
+            digest = content_hash(path)
+            if digest != self.hashes.get(path):
+                modified.add(path)
+                self.hashes[path] = digest
+        if not modified:
+            return []
+
+        print(f"[{datetime.now():%H:%M:%S}] changed: {', '.join(sorted(os.path.basename(p) for p in modified))}")
+        wanted = {artifact for path in modified for artifact in self.dependents(path)}
+        if not wanted:
+            print('  nothing depends on it')
+            return []
+
+        builders = {
+            'seed rewrite': lambda: self.rewrite_seeds(modified),
+            'migration': self.build_migration,
+            'guide': lambda: self.build_guide(modified),
+        }
+        done = []
+        for artifact in ('seed rewrite', 'migration', 'guide'):
+            if artifact not in wanted:
+                continue
+            started = time.perf_counter()
+            try:
+                detail = builders[artifact]()
+            except accounts.AccountsError as e:
+                print(f'  {artifact}: ERROR: {e}')
+                continue
+            except Exception:
+                print(f'  {artifact}: ERROR')
+                traceback.print_exc()
+                continue
+            print(f'  {artifact}: {detail} ({time.perf_counter() - started:.2f}s)')
+            done.append(artifact)
+        return done
+
+    def run(self):
+        """Poll until interrupted, rebuilding each debounced batch of changes"""
+        warmup = self.prime()
+        print(f'Watching {len(self.watched())} files in {self.docs_dir} (ready in {warmup:.2f}s; Ctrl-C to stop)')
+        pending, last_write = set(), None
+        while True:
+            time.sleep(POLL_INTERVAL)
+            changed = self.poll()
+            if changed:
+                pending |= changed
+                last_write = time.perf_counter()
+            elif pending and time.perf_counter() - last_write >= DEBOUNCE:
+                if self.rebuild(pending):
+                    print(f'  ready {time.perf_counter() - last_write:.2f}s after the last write')
+                pending = set()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Supabase (PostgREST) client for the QA scenario tooling.
+
+Used by generate-qa-guide.py; exercised against a local stub server by
+check-qa-guide.py. Importing it has no side effects, and requests is only
+imported once a session is opened: the snapshot functions work without it.
+
+The guide used to issue one bare GET for every scenario, which silently
+truncates at PostgREST's max-rows cap once the table outgrows it. This pages
+with Range headers instead:
+
+- one requests.Session (connection reuse, gzip) with timeouts on every call
+- GETs retried with exponential backoff on connection errors and 429/5xx
+- the first page learns the total from Content-Range; the rest can be fetched
+  concurrently and are reassembled in order
+- a server-side cap smaller than the requested page is detected and followed
+
+fetch_category_counts() reads the qa_scenario_category_counts view instead
+(supabase/migrations/20260814120000_qa_scenario_category_counts.sql): one row
+per role and name prefix, for callers that only need the statistics.
+
+refresh_snapshot() keeps a local JSON copy of the table current without
+refetching it: rows with updated_at at or after the newest one already held
+(the qa_scenarios_updated_at trigger bumps it on every UPDATE), then a row
+count; only if the count disagrees are the ids listed, to drop deletions and
+fetch by id the rows the updated_at filter cannot see: updated_at is the
+transaction's start time, so a long transaction can commit a row older than
+lastSync, and a NULL updated_at never matches.
+snapshot_scenarios() builds the same list fetch_scenarios() returns from it,
+with no network at all; with columns=SCENARIO_DETAIL_COLUMNS it also carries
+the description, preconditions and steps the per-role volumes print.
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+SCENARIO_COLUMNS = 'id,name,role_required,priority,estimated_duration_minutes'
+SCENARIO_DETAIL_COLUMNS = f'{SCENARIO_COLUMNS},description,feature_area,preconditions,steps'
+SCENARIO_FILTERS = {
+    'is_active': 'eq.true',
+    'automated_only': 'eq.false'
+}
+
+# The snapshot holds every row, active or not, so a scenario that is deactivated
+# or switched to automated_only is seen as a change rather than vanishing.
+# Schema 2 added the detail columns; a schema 1 file is simply refetched.
+SNAPSHOT_SCHEMA = 2
+SNAPSHOT_COLUMNS = f'{SCENARIO_DETAIL_COLUMNS},is_active,automated_only,updated_at'
+
+CATEGORY_COUNTS_VIEW = 'qa_scenario_category_counts'
+CATEGORY_COUNTS_COLUMNS = 'role_required,category_prefix,scenario_count'
+
+PAGE_SIZE = 1000
+TIMEOUT = (5, 60)  # seconds: connect, read
+RETRIES = 4
+BACKOFF = 0.5      # seconds; doubles on every retry
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+ID_BATCH = 100     # ids per id=in.(...) request, well under URL length limits
+
+
+class FetchError(Exception):
+    """The scenario fetch failed after retries, or returned an inconsistent result."""
+
+
+def create_session(service_key, pool_size=4, retries=RETRIES, backoff=BACKOFF):
+    """Session with the service-role headers and a retrying connection pool"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers.update({
+        'apikey': service_key,
+        'Authorization': f'Bearer {service_key}',
+        'Accept-Encoding': 'gzip',
+    })
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({'GET'}),
+        raise_on_status=False,  # the last response is reported below, body included
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def parse_content_range(value):
+    """'0-999/1234' -> 1234; None when the server did not count ('0-999/*' or missing)"""
+    if not value or '/' not in value:
+        return None
+    total = value.rsplit('/', 1)[1]
+    return int(total) if total.isdigit() else None
+
+
+def fetch_page(session, url, params, start, end, timeout=TIMEOUT):
+    """One Range request. Returns (rows, total or None)."""
+    import requests
+
+    headers = {
+        'Range-Unit': 'items',
+        'Range': f'{start}-{end}',
+        'Prefer': 'count=exact',
+    }
+    try:
+        response = session.get(url, params=params, headers=headers, timeout=timeout)
+    except requests.RequestException as e:
+        raise FetchError(f'{type(e).__name__}: {e}') from e
+
+    if response.status_code not in (200, 206):
+        raise FetchError(f'HTTP {response.status_code}: {response.text[:500]}')
+
+    return response.json(), parse_content_range(response.headers.get('Content-Range'))
+
+
+def fetch_all(session, url, params, page_size=PAGE_SIZE, concurrency=1, timeout=TIMEOUT):
+    """Every row matching `params`, in `order` order, across as many pages as needed"""
+    rows, total = fetch_page(session, url, params, 0, page_size - 1, timeout)
+
+    if total is None:
+        # No count from the server: walk pages until a short one.
+        start = len(rows)
+        page = rows
+        while page and len(page) == page_size:
+            page, _ = fetch_page(session, url, params, start, start + page_size - 1, timeout)
+            rows.extend(page)
+            start += len(page)
+        return rows
+
+    # A first page shorter than asked (and than the total) means PostgREST's
+    # max-rows is below page_size; page at the server's size instead.
+    step = len(rows) if 0 < len(rows) < min(page_size, total) else page_size
+    starts = range(len(rows), total, step)
+
+    def page_at(start):
+        return fetch_page(session, url, params, start, min(start + step, total) - 1, timeout)[0]
+
+    if concurrency > 1 and len(starts) > 1:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            pages = list(pool.map(page_at, starts))
+    else:
+        pages = [page_at(start) for start in starts]
+
+    for page in pages:
+        rows.extend(page)
+
+    if len(rows) != total:
+        raise FetchError(
+            f'expected {total} rows, got {len(rows)}; the table changed during the fetch, run again'
+        )
+    return rows
+
+
+def fetch_scenarios(supabase_url, service_key, page_size=PAGE_SIZE, concurrency=1, timeout=TIMEOUT):
+    """All active, non-automated scenarios, ordered by id"""
+    url = f'{supabase_url}/rest/v1/qa_scenarios'
+    params = {'select': SCENARIO_COLUMNS, **SCENARIO_FILTERS, 'order': 'id'}
+
+    with create_session(service_key, pool_size=max(concurrency, 1)) as session:
+        return fetch_all(session, url, params, page_size, concurrency, timeout)
+
+
+def fetch_category_counts(supabase_url, service_key, timeout=TIMEOUT):
+    """[{'role_required', 'category_prefix', 'scenario_count'}, ...] from the counts view.
+
+    Raises FetchError when the view is missing (migration not applied) like any
+    other failure; the caller decides whether to fall back to fetch_scenarios.
+    """
+    url = f'{supabase_url}/rest/v1/{CATEGORY_COUNTS_VIEW}'
+    params = {'select': CATEGORY_COUNTS_COLUMNS, 'order': 'role_required,category_prefix'}
+
+    with create_session(service_key, pool_size=1) as session:
+        return fetch_all(session, url, params, timeout=timeout)
+
+
+def load_snapshot(path):
+    """The snapshot at `path`, or None if there is none usable (missing, corrupt, other schema)"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if snapshot.get('schema') != SNAPSHOT_SCHEMA:
+        return None
+    return snapshot
+
+
+def save_snapshot(path, snapshot):
+    """Write atomically, rows sorted by id, so an unchanged table gives a byte-identical file"""
+    snapshot = {**snapshot, 'rows': sorted(snapshot['rows'], key=lambda r: r['id'])}
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(snapshot, f, ensure_ascii=False, indent=1, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+
+def _last_sync(rows):
+    """Newest updated_at among `rows`, by the server's clock (never the local one)"""
+    stamps = [r['updated_at'] for r in rows if r.get('updated_at')]
+    return max(stamps, key=datetime.fromisoformat) if stamps else None
+
+
+def refresh_snapshot(supabase_url, service_key, snapshot, page_size=PAGE_SIZE, concurrency=1,
+                     timeout=TIMEOUT):
+    """Bring `snapshot` (or None) up to date. Returns (snapshot, stats).
+
+    stats: {'mode': 'full' | 'incremental', 'changed': n, 'missed': n, 'deleted': n, 'idScan': bool}
+    """
+    url = f'{supabase_url}/rest/v1/qa_scenarios'
+
+    with create_session(service_key, pool_size=max(concurrency, 1)) as session:
+        if snapshot is None or not snapshot.get('lastSync'):
+            params = {'select': SNAPSHOT_COLUMNS, 'order': 'id'}
+            rows = fetch_all(session, url, params, page_size, concurrency, timeout)
+            stats = {'mode': 'full', 'changed': len(rows), 'missed': 0, 'deleted': 0, 'idScan': False}
+            return {'schema': SNAPSHOT_SCHEMA, 'lastSync': _last_sync(rows), 'rows': rows}, stats
+
+        # gte, not gt: rows written in the same microsecond as lastSync but
+        # committed after the previous refresh must not be skipped. Re-reading
+        # the boundary rows is harmless, they replace themselves by id.
+        params = {
+            'select': SNAPSHOT_COLUMNS,
+            'updated_at': f'gte.{snapshot["lastSync"]}',
+            'order': 'updated_at,id',
+        }
+        changed = fetch_all(session, url, params, page_size, concurrency, timeout)
+        rows_by_id = {r['id']: r for r in snapshot['rows']}
+        for row in changed:
+            rows_by_id[row['id']] = row
+
+        # A count that differs from ours means deletions, or rows written with
+        # an updated_at the filter above cannot see (see the module docstring).
+        _rows, total = fetch_page(session, url, {'select': 'id'}, 0, 0, timeout)
+        missed = deleted = 0
+        id_scan = total != len(rows_by_id)
+        if id_scan:
+            ids = fetch_all(session, url, {'select': 'id', 'order': 'id'}, page_size, concurrency, timeout)
+            live = {r['id'] for r in ids}
+            for stale in rows_by_id.keys() - live:
+                del rows_by_id[stale]
+                deleted += 1
+            missing = sorted(live - rows_by_id.keys())
+            for start in range(0, len(missing), ID_BATCH):
+                params = {'select': SNAPSHOT_COLUMNS, 'id': f'in.({",".join(missing[start:start + ID_BATCH])})',
+                          'order': 'id'}
+                for row in fetch_all(session, url, params, page_size, 1, timeout):
+                    rows_by_id[row['id']] = row
+                    missed += 1
+
+    rows = list(rows_by_id.values())
+    stats = {'mode': 'incremental', 'changed': len(changed), 'missed': missed, 'deleted': deleted,
+             'idScan': id_scan}
+    return {'schema': SNAPSHOT_SCHEMA, 'lastSync': _last_sync(rows) or snapshot['lastSync'], 'rows': rows}, stats
+
+
+def snapshot_scenarios(snapshot, columns=SCENARIO_COLUMNS):
+    """What fetch_scenarios() would return, from the snapshot alone"""
+    columns = columns.split(',')
+    rows = [
+        r for r in snapshot['rows']
+        if r.get('is_active') is True and r.get('automated_only') is False
+    ]
+    rows.sort(key=lambda r: r['id'])
+    return [{c: r.get(c) for c in columns} for r in rows]
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Reader for the docs/qa-system/seed-*-scenarios.sql files, shared by the
+migration generators.
+
+tokenize() scans the SQL once, left to right, with a single compiled
+pattern: string literals with '' escapes, ::type casts (multi-word ones
+like ::character varying and ::timestamp with time zone too, with (n) or
+(p,s) modifiers and [] suffixes), parentheses, commas, semicolons, -- and
+/* */ comments, words and numbers. Quotes, parentheses or commas inside a
+literal or a comment are never mistaken for structure. E'...' and $$...$$
+literals are rejected rather than misread: the seeds do not use them.
+
+iter_rows() follows INSERT INTO <table> (<columns>) VALUES (...), (...);
+and yields each row as a dict keyed by the INSERT's own column list, so
+neither the column order nor the scenario name prefixes (CA, PB, SV, ...)
+matter.
+
+A field that is one string literal (cast or not) is returned unescaped;
+anything else (numbers, true/false, now(), ARRAY[...]) as its SQL text;
+NULL as None.
+
+SEED_FILES lists the per-role seeds that rewrite-qa-comprehensive.py
+rewrites and the migration generators read.
+"""
+
+import re
+from collections import namedtuple
+
+# The seeds for qa_scenarios steps, in docs/qa-system
+SEED_FILES = [
+    'seed-admin-scenarios.sql',
+    'seed-community_manager-scenarios.sql',
+    'seed-consultor-scenarios.sql',
+    'seed-equipo_directivo-scenarios.sql',
+    'seed-lider_comunidad-scenarios.sql',
+    'seed-lider_generacion-scenarios.sql',
+    'seed-supervisor_de_red-scenarios.sql',
+]
+
+Token = namedtuple('Token', 'kind value start end')
+
+# Whitespace and comments are consumed as the prefix of the next token, so
+# each match is one token.
+TOKEN_PATTERN = re.compile(r"""
+    (?:\s+|--[^\n]*|/\*.*?\*/)*
+    (?:
+    (?P<string>'[^']*(?:''[^']*)*')
+  | (?P<cast>::\s*[A-Za-z_][\w.]*
+        (?:\s*\(\s*\d+(?:\s*,\s*\d+)?\s*\))?
+        (?:\s+(?i:varying|precision|with|without|time|zone)\b(?:\s*\(\s*\d+(?:\s*,\s*\d+)?\s*\))?)*
+        (?:\s*\[\])*)
+  | (?P<punct>[(),;])
+  | (?P<number>\d+(?:\.\d+)?)
+  | (?P<unsupported>[Ee]'|\$(?:[A-Za-z_]\w*)?\$)
+  | (?P<word>[A-Za-z_][\w.]*|"[^"]*(?:""[^"]*)*")
+  | (?P<unterminated>['"]|/\*)
+  | (?P<op>.)
+    )?
+""", re.VERBOSE | re.DOTALL)
+
+
+class SeedSyntaxError(ValueError):
+    """The seed SQL cannot be read; the message gives the line."""
+
+
+def line_of(text, pos):
+    return text.count('\n', 0, pos) + 1
+
+
+def tokenize(text):
+    """Tokens of `text` in order, without whitespace and comments. Raises SeedSyntaxError."""
+    for match in TOKEN_PATTERN.finditer(text):
+        kind = match.lastgroup
+        if kind is None:
+            continue  # trailing whitespace or comments
+        if kind == 'unterminated':
+            raise SeedSyntaxError(f'line {line_of(text, match.start(kind))}: unterminated {match.group(kind)}')
+        if kind == 'unsupported':
+            literal = "E'...'" if match.group(kind)[0] in 'Ee' else f'{match.group(kind)}...{match.group(kind)}'
+            raise SeedSyntaxError(f'line {line_of(text, match.start(kind))}: {literal} literals are not supported')
+        yield Token(kind, match.group(kind), match.start(kind), match.end())
+
+
+def unquote(literal):
+    """The text of a '...' literal, with '' unescaped"""
+    return literal[1:-1].replace("''", "'")
+
+
+def field_value(text, tokens):
+    if len(tokens) == 1 and tokens[0].kind == 'word' and tokens[0].value.upper() == 'NULL':
+        return None
+    if tokens[0].kind == 'string' and (len(tokens) == 1 or (len(tokens) == 2 and tokens[1].kind == 'cast')):
+        return unquote(tokens[0].value)
+    return text[tokens[0].start:tokens[-1].end]
+
+
+def read_row(text, tokens, opening):
+    """The fields of the parenthesised tuple opened by `opening`, as value lists"""
+    fields, current, depth = [], [], 1
+    for token in tokens:
+        if token.kind == 'punct':
+            if token.value == '(':
+                depth += 1
+            elif token.value == ')':
+                depth -= 1
+                if depth == 0:
+                    if current:
+                        fields.append(field_value(text, current))
+                    elif fields:
+                        raise SeedSyntaxError(f'line {line_of(text, token.start)}: empty field')
+                    return fields
+            elif token.value == ',' and depth == 1:
+                if not current:
+                    raise SeedSyntaxError(f'line {line_of(text, token.start)}: empty field')
+                fields.append(field_value(text, current))
+                current = []
+                continue
+            elif token.value == ';':
+                break
+        current.append(token)
+    raise SeedSyntaxError(f'line {line_of(text, opening.start)}: unclosed (')
+
+
+def iter_rows(text, table='qa_scenarios'):
+    """Each row of every INSERT INTO `table` in `text`, as {column: value}, in file order"""
+    tokens = tokenize(text)
+    previous = None
+    for token in tokens:
+        is_insert = (token.kind == 'word' and token.value.upper() == 'INTO'
+                     and previous is not None and previous.value.upper() == 'INSERT')
+        previous = token
+        if not is_insert:
+            continue
+
+        target = next(tokens, None)
+        if target is None or target.kind != 'word' or target.value.split('.')[-1].strip('"') != table:
+            continue
+        opening = next(tokens, None)
+        if opening is None or opening.value != '(':
+            raise SeedSyntaxError(f'line {line_of(text, target.start)}: INSERT INTO {table} needs a column list')
+        columns = [value.strip('"') for value in read_row(text, tokens, opening)]
+        keyword = next(tokens, None)
+        if keyword is None or keyword.value.upper() != 'VALUES':
+            raise SeedSyntaxError(f'line {line_of(text, opening.start)}: expected VALUES after the column list')
+
+        separator = ','
+        while separator == ',':
+            opening = next(tokens, None)
+            if opening is None or opening.value != '(':
+                raise SeedSyntaxError(f'line {line_of(text, keyword.start)}: expected a ( row after VALUES')
+            fields = read_row(text, tokens, opening)
+            if len(fields) != len(columns):
+                raise SeedSyntaxError(f'line {line_of(text, opening.start)}: {len(fields)} values '
+                                      f'for {len(columns)} columns')
+            yield dict(zip(columns, fields))
+            separator_token = next(tokens, None)
+            separator = separator_token.value if separator_token else None
+            previous = separator_token
+
+
+def read_scenarios(path):
+    """Role, name and steps of every qa_scenarios row in the seed file at `path`"""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    return [{'role': row['role_required'], 'name': row['name'], 'steps': row['steps']}
+            for row in iter_rows(text)]
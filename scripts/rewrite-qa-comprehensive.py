@@ -8,6 +8,10 @@ import re
 from pathlib import Path
 import sys
 
+from qa_seed_sql import SEED_FILES
+
+QA_DOCS_DIR = Path(__file__).resolve().parent.parent / 'docs' / 'qa-system'
+
 def rewrite_instruction(text):
     """Rewrite instruction field to remove developer jargon."""
 
@@ -315,11 +319,10 @@ def process_file(filepath):
     # Count changes
     changes = content != new_content
 
-    # Write back
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(new_content)
-
+    # Write back only when something changed, so editors and watchers see no spurious save
     if changes:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(new_content)
         print(f"  ✓ File rewritten")
     else:
         print(f"  - No changes needed")
@@ -327,24 +330,13 @@ def process_file(filepath):
     return changes
 
 def main():
-    base_path = Path('/Users/brentcurtis76/Documents/fne-lms-working/docs/qa-system')
-    seed_files = [
-        'seed-admin-scenarios.sql',
-        'seed-community_manager-scenarios.sql',
-        'seed-consultor-scenarios.sql',
-        'seed-equipo_directivo-scenarios.sql',
-        'seed-lider_comunidad-scenarios.sql',
-        'seed-lider_generacion-scenarios.sql',
-        'seed-supervisor_de_red-scenarios.sql',
-    ]
-
     print("=" * 70)
     print("QA Scenario Step Rewriter - Developer Jargon Removal")
     print("=" * 70)
 
     files_changed = 0
-    for filename in seed_files:
-        filepath = base_path / filename
+    for filename in SEED_FILES:
+        filepath = QA_DOCS_DIR / filename
         if filepath.exists():
             if process_file(filepath):
                 files_changed += 1
@@ -352,7 +344,7 @@ def main():
             print(f"❌ WARNING: {filename} not found!")
 
     print("\n" + "=" * 70)
-    print(f"Summary: {files_changed}/{len(seed_files)} files modified")
+    print(f"Summary: {files_changed}/{len(SEED_FILES)} files modified")
     print("=" * 70)
 
     print("\nNext steps:")
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Z0B NER spike — offline batch re-scoring of archived transcripts.
+
+The only way to run the NER layer today is one HTTP request per transcript.
+When the model or the caller's filters change, hundreds of archived sessions
+need re-scoring; this does it in bulk:
+
+  - reads a JSONL file (one {"id", "text", ...} per line) or a directory of
+    *.json / *.txt transcripts, as a stream
+  - runs `nlp.pipe` over chunks of records on a process pool, one model load
+    per worker, with a bounded window of chunks in flight
+  - writes one response body per record to a JSONL file, in input order, built
+    with index.py's own `serialize_entities`, so each line is exactly what the
+    endpoint would have returned for that transcript
+  - checkpoints after every flushed chunk; rerunning the same command after a
+    crash truncates any half-written tail and resumes at the next record
+
+Raw transcript text is read here and never logged, same rule as the endpoint.
+
+Usage:
+    ./venv/bin/python scripts/spikes/ner/batch_sanitize.py archive.jsonl out.jsonl --jobs 4
+    ./venv/bin/python scripts/spikes/ner/batch_sanitize.py transcripts/ out.jsonl --chunk 8
+"""
+from __future__ import annotations
+
+import argparse
+import collections
+import itertools
+import json
+import os
+import pathlib
+import sys
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Iterator
+
+import index
+
+_worker_nlp = None
+
+
+def read_records(source: pathlib.Path) -> Iterator[dict]:
+    """Yields {"id", "text"} in a stable order: file order for JSONL, sorted names for a directory."""
+    if source.is_dir():
+        for path in sorted(p for p in source.rglob("*") if p.suffix in (".json", ".txt")):
+            record_id = str(path.relative_to(source))
+            if path.suffix == ".txt":
+                yield {"id": record_id, "text": path.read_text(encoding="utf-8")}
+            else:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+                yield {"id": str(payload.get("requestId") or payload.get("id") or record_id), "text": payload.get("text")}
+        return
+    with source.open(encoding="utf-8") as fh:
+        for line_number, line in enumerate(fh, start=1):
+            if not line.strip():
+                continue
+            payload = json.loads(line)
+            record_id = payload.get("requestId") or payload.get("id") or f"line-{line_number}"
+            yield {"id": str(record_id), "text": payload.get("text")}
+
+
+def _init_worker() -> None:
+    global _worker_nlp
+    _worker_nlp = index._get_nlp()
+
+
+def _unavailable(reason: str, request_id: str) -> dict:
+    return {"status": "unavailable", "sanitizationStatus": "flagged", "reason": reason, "requestId": request_id}
+
+
+def score_chunk(records: list[dict], batch_size: int) -> list[str]:
+    """Worker: one serialized response body per record, in order."""
+    if _worker_nlp is None:
+        return [json.dumps(_unavailable(index._load_error or "model unavailable", r["id"])) for r in records]
+
+    valid = [i for i, r in enumerate(records) if isinstance(r["text"], str) and r["text"]]
+    docs: dict[int, object] = {}
+    failure = "inference failed"
+    try:
+        texts = (records[i]["text"] for i in valid)
+        docs = dict(zip(valid, _worker_nlp.pipe(texts, batch_size=batch_size)))
+    except Exception as exc:  # noqa: BLE001 - mirrors the endpoint's 500
+        failure = f"inference failed: {type(exc).__name__}"
+
+    version = index._model_version()
+    lines = []
+    for i, record in enumerate(records):
+        if not isinstance(record["text"], str) or not record["text"]:
+            body = _unavailable("missing text", record["id"])
+        elif i not in docs:
+            body = _unavailable(failure, record["id"])
+        else:
+            body = {
+                "status": "ok",
+                "entities": index.serialize_entities(docs[i]),
+                "model": index.MODEL_NAME,
+                "modelVersion": version,
+                "requestId": record["id"],
+            }
+        lines.append(json.dumps(body))
+    return lines
+
+
+def load_checkpoint(path: pathlib.Path, source: pathlib.Path) -> tuple[int, int]:
+    """(records done, output bytes known good). Starts over if the checkpoint is for another input."""
+    if not path.exists():
+        return 0, 0
+    state = json.loads(path.read_text(encoding="utf-8"))
+    if state.get("source") != str(source.resolve()):
+        return 0, 0
+    return int(state["done"]), int(state["outputBytes"])
+
+
+def save_checkpoint(path: pathlib.Path, source: pathlib.Path, done: int, output_bytes: int) -> None:
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(
+        json.dumps({"source": str(source.resolve()), "done": done, "outputBytes": output_bytes}), encoding="utf-8"
+    )
+    os.replace(tmp, path)  # atomic: a crash mid-write leaves the previous checkpoint
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Batch NER re-scoring over transcript archives.")
+    parser.add_argument("source", type=pathlib.Path, help="JSONL file or directory of transcripts")
+    parser.add_argument("output", type=pathlib.Path, help="JSONL of endpoint-identical response bodies")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk", type=int, default=16, help="records per worker task")
+    parser.add_argument("--batch-size", type=int, default=4, help="nlp.pipe batch size inside a chunk")
+    parser.add_argument("--checkpoint", type=pathlib.Path, help="default: <output>.checkpoint")
+    parser.add_argument("--restart", action="store_true", help="ignore an existing checkpoint")
+    args = parser.parse_args()
+
+    checkpoint = args.checkpoint or args.output.with_name(args.output.name + ".checkpoint")
+    done, good_bytes = (0, 0) if args.restart else load_checkpoint(checkpoint, args.source)
+    if done and not args.output.exists():
+        done, good_bytes = 0, 0
+    if done:
+        print(f"resuming after {done} records", file=sys.stderr)
+
+    records = itertools.islice(read_records(args.source), done, None)
+    chunks = iter(lambda: list(itertools.islice(records, args.chunk)), [])
+
+    started = time.perf_counter()
+    scored = words = 0
+    with args.output.open("r+b" if done else "wb") as out:
+        out.truncate(good_bytes)
+        out.seek(good_bytes)
+        with ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_worker) as pool:
+            window: collections.deque[tuple[Future, int]] = collections.deque()
+
+            def drain_one() -> None:
+                nonlocal done, scored
+                future, size = window.popleft()
+                for line in future.result():
+                    out.write(line.encode("utf-8") + b"\n")
+                out.flush()
+                os.fsync(out.fileno())
+                done += size
+                scored += size
+                save_checkpoint(checkpoint, args.source, done, out.tell())
+
+            for chunk in chunks:
+                words += sum(len(r["text"].split()) for r in chunk if isinstance(r["text"], str))
+                window.append((pool.submit(score_chunk, chunk, args.batch_size), len(chunk)))
+                if len(window) >= args.jobs * 2:
+                    drain_one()
+            while window:
+                drain_one()
+
+    elapsed = time.perf_counter() - started
+    rate = scored / elapsed if elapsed else 0.0
+    print(
+        f"scored {scored} records ({words:,} words) in {elapsed:.1f} s with {args.jobs} workers: "
+        f"{rate:.2f} records/s, {words/elapsed if elapsed else 0:,.0f} words/s",
+        file=sys.stderr,
+    )
+    print(f"total done: {done} -> {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Z0B NER spike — cold-start decomposition in fresh interpreters.
+
+measure_ner.py's "model load" is `spacy.load` inside an interpreter that has
+already imported spaCy, so it misses most of what a cold function instance
+pays: interpreter start, `import spacy` (including the click import chain that
+requirements.txt pins), and the allocations of the first inference. This
+launches N fresh interpreters and has each stamp five moments, measured from
+the parent's spawn:
+
+  interpreter ready -> import spacy -> model loaded -> first nlp() -> second nlp()
+
+and then runs one more interpreter under `-X importtime` to rank the modules
+that make `import spacy` slow.
+
+Run 1 is the only one that can see a cold OS page cache; later runs show the
+cost with the files already in memory, which is closer to a warm Vercel host.
+
+Usage:
+    ./venv/bin/python scripts/spikes/ner/cold_start.py --runs 10
+"""
+from __future__ import annotations
+
+import time
+
+_READY_NS = time.time_ns()  # first thing the interpreter executes in a probe
+
+import argparse  # noqa: E402 - the stamp above must precede every other import
+import json  # noqa: E402
+import pathlib  # noqa: E402
+import statistics  # noqa: E402
+import subprocess  # noqa: E402
+import sys  # noqa: E402
+
+HERE = pathlib.Path(__file__).resolve().parent
+FIXTURE_DIR = HERE.parents[2] / "__tests__" / "lib" / "zoom" / "fixtures"
+
+PHASES = ("interpreter ready", "import spacy", "model loaded", "first nlp()", "second nlp()")
+
+
+def probe(spawned_ns: int) -> dict[str, float]:
+    """Child process: seconds from spawn to each phase boundary."""
+    stamps = [_READY_NS]
+    precision = json.loads((FIXTURE_DIR / "precision.json").read_text(encoding="utf-8"))
+    text = "\n\n".join(precision["paragraphs"])
+
+    import spacy  # noqa: F401 - timed on its own, before the loader below re-imports it
+
+    stamps.append(time.time_ns())
+    import index
+
+    nlp = index._get_nlp()
+    stamps.append(time.time_ns())
+    nlp(text)
+    stamps.append(time.time_ns())
+    nlp(text)
+    stamps.append(time.time_ns())
+    return {phase: (stamp - spawned_ns) / 1e9 for phase, stamp in zip(PHASES, stamps)}
+
+
+def import_breakdown() -> list[tuple[int, int, str]]:
+    """(self µs, cumulative µs, module) for `import spacy`, slowest self time first."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import spacy"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = (part.strip() for part in line[len("import time:") :].split("|"))
+        rows.append((int(self_us), int(cumulative_us), module))
+    rows.sort(reverse=True)
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Cold-start decomposition for the NER function.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="modules listed in the import breakdown")
+    parser.add_argument("--probe", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.probe is not None:
+        print(json.dumps(probe(args.probe)))
+        return 0
+
+    runs = []
+    for _ in range(args.runs):
+        spawned = time.time_ns()
+        completed = subprocess.run(
+            [sys.executable, __file__, "--probe", str(spawned)],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        runs.append(json.loads(completed.stdout))
+
+    print(f"## Cold start ({args.runs} fresh interpreters; seconds since spawn)")
+    print("| Run | " + " | ".join(PHASES) + " |")
+    print("|---" * (len(PHASES) + 1) + "|")
+    for number, run in enumerate(runs, start=1):
+        print(f"| {number} | " + " | ".join(f"{run[phase]:.3f}" for phase in PHASES) + " |")
+    print()
+
+    print("## Phase cost (delta from the previous phase)")
+    print("| Phase | Median | Min | Max |")
+    print("|---|---|---|---|")
+    previous = None
+    for phase in PHASES:
+        deltas = [run[phase] - (run[previous] if previous else 0.0) for run in runs]
+        print(f"| {phase} | {statistics.median(deltas):.3f} s | {min(deltas):.3f} s | {max(deltas):.3f} s |")
+        previous = phase
+    print()
+
+    print(f"## `import spacy` — top {args.top} modules by self time (-X importtime)")
+    print("| Module | Self | Cumulative |")
+    print("|---|---|---|")
+    rows = import_breakdown()
+    for self_us, cumulative_us, module in rows[: args.top]:
+        print(f"| `{module}` | {self_us/1000:.1f} ms | {cumulative_us/1000:.1f} ms |")
+    print()
+    # The chain requirements.txt pins `click` for: only there because spacy.cli
+    # is imported at package import time.
+    for package in ("click", "spacy.cli", "typer"):
+        cumulative = next((c for _s, c, m in rows if m == package), None)
+        if cumulative is not None:
+            print(f"{package}: {cumulative/1000:.1f} ms cumulative")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -68,6 +68,30 @@ def _get_nlp():
     return _nlp
 
 
+def serialize_entities(doc) -> list[dict]:
+    """
+    The `entities` array of a 200 response. Shared with batch_sanitize.py so an
+    offline re-score is byte-identical to what this endpoint would have returned.
+
+    Every label is returned, not just PER. The Z0B spike measured that Spanish
+    NER routinely tags an ambiguous given name LOC/ORG/MISC (Florencia -> LOC,
+    Rosa -> MISC), so filtering to PER here would throw away most of the recall
+    this layer exists to add. The caller applies its own non-person lexicon and
+    shape filter.
+    """
+    return [
+        {
+            "surface": ent.text,
+            "start": ent.start_char,
+            "end": ent.end_char,
+            "label": ent.label_,
+            "tokens": len(ent),
+            "hasVerb": any(t.pos_ in ("VERB", "AUX") for t in ent),
+        }
+        for ent in doc.ents
+    ]
+
+
 def _authorized(header_value: str | None) -> bool:
     secret = os.environ.get("NER_SHARED_SECRET", "")
     if not secret:
@@ -154,28 +178,11 @@ class handler(BaseHTTPRequestHandler):
             self._unavailable(500, f"inference failed: {type(exc).__name__}", request_id)
             return
 
-        # Every label is returned, not just PER. The Z0B spike measured that
-        # Spanish NER routinely tags an ambiguous given name LOC/ORG/MISC
-        # (Florencia -> LOC, Rosa -> MISC), so filtering to PER here would throw
-        # away most of the recall this layer exists to add. The caller applies
-        # its own non-person lexicon and shape filter.
-        entities = [
-            {
-                "surface": ent.text,
-                "start": ent.start_char,
-                "end": ent.end_char,
-                "label": ent.label_,
-                "tokens": len(ent),
-                "hasVerb": any(t.pos_ in ("VERB", "AUX") for t in ent),
-            }
-            for ent in doc.ents
-        ]
-
         self._respond(
             200,
             {
                 "status": "ok",
-                "entities": entities,
+                "entities": serialize_entities(doc),
                 "model": MODEL_NAME,
                 "modelVersion": _model_version(),
                 "requestId": request_id,
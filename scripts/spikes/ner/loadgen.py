@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Z0B NER spike — end-to-end HTTP load generator for index.py.
+
+measure_ner.py times `nlp()` in-process. What the caller actually waits for also
+includes the socket, the auth check, JSON decode of a ~110 KB body, entity
+serialization and JSON encode of the response. This serves the real `handler`
+from index.py in a separate process (so client threads do not share its GIL),
+with a throwaway NER_SHARED_SECRET, and replays fixture and synthetic
+transcripts against it.
+
+Two arrival models:
+  - closed loop (default): `--concurrency` workers send back-to-back
+  - open loop (`--rate R`): seeded Poisson arrivals at R req/s, dispatched to
+    `--concurrency` workers. Latency is measured from the SCHEDULED send time,
+    so a saturated server shows up as queueing instead of hiding it.
+
+Reported: throughput, latency percentiles, the error/flagged rate (any non-200
+or non-"ok" body obliges the caller to flag), and server-side overhead — request
+latency minus the raw `nlp()` time of the same text, measured in this process
+before the run.
+
+Usage:
+    ./venv/bin/python scripts/spikes/ner/loadgen.py --requests 200 --concurrency 4
+    ./venv/bin/python scripts/spikes/ner/loadgen.py --rate 2 --synthetic-words 8910,17820
+"""
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import os
+import pathlib
+import random
+import secrets
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import synth_transcripts
+
+HERE = pathlib.Path(__file__).resolve().parent
+FIXTURE_DIR = HERE.parents[2] / "__tests__" / "lib" / "zoom" / "fixtures"
+
+
+def serve(port: int) -> None:
+    """Child process: the real handler behind a threading server. Prints the bound port."""
+    from http.server import ThreadingHTTPServer
+
+    import index
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), index.handler)
+    print(server.server_address[1], flush=True)
+    server.serve_forever()
+
+
+def load_payloads(synthetic_words: tuple[int, ...], seed: int) -> list[dict]:
+    payloads = []
+    for name in ("must-catch.json", "adversarial.json"):
+        suite = json.loads((FIXTURE_DIR / name).read_text(encoding="utf-8"))
+        for case in suite["cases"]:
+            payloads.append({"text": case["text"], "attendees": case["attendees"], "requestId": case["id"]})
+    for words in synthetic_words:
+        transcript = synth_transcripts.generate(words, seed=seed)
+        payloads.append(
+            {"text": transcript["text"], "attendees": transcript["attendees"], "requestId": transcript["id"]}
+        )
+    return payloads
+
+
+def raw_nlp_seconds(payloads: list[dict], repeat: int = 3) -> dict[str, float]:
+    """Best-of-`repeat` in-process inference per payload: the floor the service cannot beat."""
+    import index
+
+    # The handler's own loader, so the floor uses exactly the service's pipeline.
+    nlp = index._get_nlp()
+    nlp(payloads[0]["text"])  # warm-up
+    floors = {}
+    for payload in payloads:
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            nlp(payload["text"])
+            best = min(best, time.perf_counter() - started)
+        floors[payload["requestId"]] = best
+    return floors
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return float("nan")
+    index = min(len(sorted_values) - 1, max(0, round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def post(port: int, secret: str, body: bytes) -> tuple[int, dict | None]:
+    # A fresh connection per request, like the Vercel caller; BaseHTTPRequestHandler
+    # speaks HTTP/1.0 and closes it anyway.
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=120)
+    try:
+        conn.request(
+            "POST",
+            "/",
+            body=body,
+            headers={
+                "Authorization": f"Bearer {secret}",
+                "Content-Type": "application/json",
+                "Content-Length": str(len(body)),
+            },
+        )
+        response = conn.getresponse()
+        raw = response.read()
+    finally:
+        conn.close()
+    try:
+        return response.status, json.loads(raw)
+    except json.JSONDecodeError:
+        return response.status, None
+
+
+def wait_ready(port: int, timeout: float = 120.0) -> None:
+    """The health probe loads the model, so the run starts warm."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=timeout)
+            conn.request("GET", "/")
+            status = conn.getresponse().status
+            conn.close()
+            if status == 200:
+                return
+            raise RuntimeError(f"health probe returned {status}")
+        except ConnectionError:
+            time.sleep(0.1)
+    raise TimeoutError("NER handler did not become ready")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="HTTP load generator for the NER handler.")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--rate", type=float, help="open-loop arrivals per second (default: closed loop)")
+    parser.add_argument(
+        "--synthetic-words",
+        default="8910",
+        help="comma-separated synth_transcripts.py lengths added to the fixture cases",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--serve", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve is not None:
+        serve(args.serve)
+        return 0
+
+    synthetic_words = tuple(int(w) for w in args.synthetic_words.split(",") if w.strip())
+    payloads = load_payloads(synthetic_words, args.seed)
+    bodies = {p["requestId"]: json.dumps(p).encode("utf-8") for p in payloads}
+    print(f"payloads: {len(payloads)} ({len(payloads) - len(synthetic_words)} fixture, {len(synthetic_words)} synthetic)")
+    floors = raw_nlp_seconds(payloads)
+
+    secret = secrets.token_urlsafe(32)
+    server = subprocess.Popen(
+        [sys.executable, __file__, "--serve", "0"],
+        env={**os.environ, "NER_SHARED_SECRET": secret},
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        line = server.stdout.readline()
+        if not line.strip().isdigit():
+            # The child's stderr is ours, so its traceback is already printed.
+            reason = f"exited with code {server.wait()}" if not line else f"printed {line.strip()!r}"
+            print(f"NER server {reason} instead of its port", file=sys.stderr)
+            return 1
+        port = int(line)
+        wait_ready(port)
+
+        rng = random.Random(args.seed)
+        schedule = [payloads[i % len(payloads)]["requestId"] for i in range(args.requests)]
+        rng.shuffle(schedule)
+        lock = threading.Lock()
+        samples: list[tuple[str, float, int, str]] = []
+
+        def fire(request_id: str, scheduled: float) -> None:
+            try:
+                status, payload = post(port, secret, bodies[request_id])
+            except (OSError, http.client.HTTPException) as e:
+                # Refused, reset, timed out or cut off: a failed request, not a missing one.
+                status, verdict = 0, type(e).__name__
+            else:
+                verdict = payload.get("status", "malformed") if payload else "malformed"
+            elapsed = time.perf_counter() - scheduled
+            with lock:
+                samples.append((request_id, elapsed, status, verdict))
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            if args.rate:
+                at = started
+                for request_id in schedule:
+                    at += rng.expovariate(args.rate)
+                    delay = at - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                    pool.submit(fire, request_id, at)
+            else:
+                for request_id in schedule:
+                    pool.submit(lambda rid=request_id: fire(rid, time.perf_counter()))
+        wall = time.perf_counter() - started
+    finally:
+        server.terminate()
+        server.wait()
+
+    if not samples:
+        print("no requests sent", file=sys.stderr)
+        return 1
+
+    latencies = sorted(elapsed for _, elapsed, _, _ in samples)
+    failures = [s for s in samples if s[2] != 200 or s[3] != "ok"]
+    overheads = sorted(elapsed - floors[rid] for rid, elapsed, status, _ in samples if status == 200)
+    mode = f"open loop, {args.rate:g} req/s" if args.rate else "closed loop"
+
+    print(f"## HTTP load ({mode}, concurrency {args.concurrency})")
+    print("| Metric | Value |")
+    print("|---|---|")
+    print(f"| Requests | {len(samples)} in {wall:.2f} s |")
+    print(f"| Throughput | {len(samples)/wall:.2f} req/s |")
+    for label, fraction in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99)):
+        print(f"| Latency {label} | {percentile(latencies, fraction)*1000:,.1f} ms |")
+    print(f"| Latency max | {latencies[-1]*1000:,.1f} ms |")
+    print(f"| Error/flagged | {len(failures)}/{len(samples)} ({len(failures)/len(samples):.1%}) |")
+    print(f"| Overhead over raw nlp() p50 | {percentile(overheads, 0.5)*1000:,.1f} ms |")
+    print(f"| Overhead over raw nlp() p90 | {percentile(overheads, 0.9)*1000:,.1f} ms |")
+    print()
+    if args.concurrency > 1 or args.rate:
+        print("Overhead includes queueing at this load; run --concurrency 1 without --rate for the pure per-request cost.")
+    for request_id, _elapsed, status, verdict in failures[:5]:
+        print(f"  failed: {request_id} -> {status} {verdict}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,8 +4,11 @@ Z0B NER spike — local feasibility measurement for the OPTIONAL recall layer.
 
 Answers the questions plan §15 asks of this spike:
   - installed footprint (MB) against the Vercel Python bundle limit
+  - memory: RSS around model load, peak RSS per input size, the top Python
+    allocation sites, and the largest transcript a memory setting can take
   - model load time (the cold-import proxy)
-  - per-transcript latency at realistic session lengths
+  - per-transcript latency at realistic session lengths, and (--components)
+    how that time splits across the pipeline's components
   - recall on the SAME fixtures the Node layer is scored on, so Node-only,
     NER-only and Node+NER land in one table
 
@@ -15,37 +18,63 @@ only measures.
 Usage:
     npx tsx scripts/spikes/ner/measure-node.ts > node-results.json
     ./venv/bin/python scripts/spikes/ner/measure_ner.py node-results.json
+    ./venv/bin/python scripts/spikes/ner/measure_ner.py node-results.json --memory --memory-mb 2048,4096
+    ./venv/bin/python scripts/spikes/ner/measure_ner.py --components
+    ./venv/bin/python scripts/spikes/ner/measure_ner.py node-results.json --json run.json \
+        --compare scripts/spikes/ner/baseline.json
+
+--memory adds the memory section after the latency table: one fresh
+interpreter per input size, then a traced ~1 h inference. It is off by
+default because it costs several model loads and inferences of its own.
+
+--json writes everything the tables show as one JSON document. --compare diffs
+this run against a committed one and exits 1 when latency, recall or false
+redactions regress past the tolerances, so a model or spaCy bump cannot make
+the layer quietly slower or leakier.
 """
 from __future__ import annotations
 
+import argparse
+import bisect
 import json
 import os
 import pathlib
+import resource
+import subprocess
 import sys
 import time
-import unicodedata
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import synth_transcripts
+from name_normalize import CONNECTORS, attendee_tokens, normalize
 
 REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
 FIXTURE_DIR = REPO_ROOT / "__tests__" / "lib" / "zoom" / "fixtures"
 MODEL = "es_core_news_md"
 
-# Mirrors the Node layer: connectors and two-letter fragments match too much to
-# be safe evidence that a detected entity is an attendee.
-CONNECTORS = {"de", "del", "la", "las", "los", "y", "da", "do"}
+# The latency rows, as multipliers of the precision corpus. With --synthetic the
+# same word counts are generated by synth_transcripts.py instead of repeated.
+LATENCY_SIZES = (("fixture corpus", 1), ("~1h session", 15), ("~2h session", 30))
 
+# Spoken Spanish in a consulting session, as recorded in zoom-spike-results.md
+# §4.2 (~1 h transcript = 8,910 words). Only used to turn words into hours.
+WORDS_PER_HOUR = 8_910
 
-def normalize(value: str) -> str:
-    stripped = unicodedata.normalize("NFD", value)
-    return "".join(c for c in stripped if unicodedata.category(c) != "Mn").lower()
+# Vercel function memory settings worth answering for, and the share of each we
+# are willing to plan against. The rest is left for the runtime, response
+# encoding and allocator fragmentation we do not model.
+DEFAULT_MEMORY_MB = (2048, 4096)
+MEMORY_HEADROOM = 0.8
 
+# Bumped whenever a key in the --json document changes meaning.
+RESULTS_SCHEMA = 1
 
-def attendee_tokens(names: list[str]) -> set[str]:
-    tokens: set[str] = set()
-    for name in names:
-        for part in normalize(name).split():
-            if len(part) >= 3 and part not in CONNECTORS:
-                tokens.add(part)
-    return tokens
+# Latency differences below this are scheduler noise on the fixture-corpus row,
+# whatever the relative tolerance says.
+LATENCY_NOISE_SECONDS = 0.05
 
 
 def directory_size_mb(path: pathlib.Path) -> float:
@@ -59,18 +88,284 @@ def directory_size_mb(path: pathlib.Path) -> float:
     return total / 1_000_000
 
 
-def ner_sanitize(
-    nlp,
-    text: str,
+def peak_rss_bytes() -> int:
+    """High-water RSS of this process. ru_maxrss is KiB on Linux, bytes on macOS."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def load_corpus() -> tuple[dict, str]:
+    precision = json.loads((FIXTURE_DIR / "precision.json").read_text(encoding="utf-8"))
+    return precision, "\n\n".join(precision["paragraphs"])
+
+
+def latency_input(corpus: str, multiplier: int, synthetic_seed: int | None) -> str:
+    """One latency row's text: the corpus repeated, or a seeded transcript of the same length."""
+    if synthetic_seed is None:
+        return "\n\n".join([corpus] * multiplier)
+    return synth_transcripts.generate(len(corpus.split()) * multiplier, seed=synthetic_seed)["text"]
+
+
+def model_path(model: str) -> pathlib.Path:
+    """On-disk location of a model given as an installed package name or a directory."""
+    import spacy
+
+    if pathlib.Path(model).is_dir():
+        return pathlib.Path(model)
+    return pathlib.Path(spacy.util.get_package_path(model))
+
+
+def memory_probe(model: str, multiplier: int, synthetic_seed: int | None) -> dict[str, int]:
+    """
+    Runs in a FRESH interpreter (see measure_memory). ru_maxrss is a high-water
+    mark that cannot be reset, so the only way to attribute a peak to one input
+    size is to give every size its own process.
+    """
+    _precision, corpus = load_corpus()
+    text = latency_input(corpus, multiplier, synthetic_seed)
+
+    import spacy
+
+    before_load = peak_rss_bytes()
+    nlp = spacy.load(model, disable=["lemmatizer", "textcat"])
+    after_load = peak_rss_bytes()
+    nlp(text)
+    return {
+        "words": len(text.split()),
+        "beforeLoad": before_load,
+        "afterLoad": after_load,
+        "inferencePeak": peak_rss_bytes(),
+    }
+
+
+def fit_bytes_per_word(points: list[tuple[int, int]]) -> tuple[float, float]:
+    """Least-squares (slope, intercept) of inference bytes above the loaded model vs words."""
+    n = len(points)
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    var = sum((x - mean_x) ** 2 for x, _ in points)
+    if not var:
+        return 0.0, mean_y
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / var
+    return slope, mean_y - slope * mean_x
+
+
+def measure_memory(model: str, memory_mb: tuple[int, ...], synthetic_seed: int | None) -> dict:
+    print("## Memory (fresh interpreter per input size)")
+    print("| Input | Words | RSS before load | RSS after load | Peak RSS in inference | Inference delta |")
+    print("|---|---|---|---|---|---|")
+    probes = []
+    for label, multiplier in LATENCY_SIZES:
+        command = [sys.executable, __file__, "--model", model, "--memory-probe", str(multiplier)]
+        if synthetic_seed is not None:
+            command += ["--synthetic", str(synthetic_seed)]
+        completed = subprocess.run(
+            command,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        probe = json.loads(completed.stdout)
+        probe["label"] = label
+        probes.append(probe)
+        delta = probe["inferencePeak"] - probe["afterLoad"]
+        print(
+            f"| {label} | {probe['words']:,} | {probe['beforeLoad']/1e6:.0f} MB | "
+            f"{probe['afterLoad']/1e6:.0f} MB | {probe['inferencePeak']/1e6:.0f} MB | "
+            f"{delta/1e6:+.0f} MB |"
+        )
+    print()
+
+    slope, intercept = fit_bytes_per_word(
+        [(p["words"], p["inferencePeak"] - p["afterLoad"]) for p in probes]
+    )
+    loaded = max(p["afterLoad"] for p in probes)
+    print(
+        f"fit: peak ≈ {loaded/1e6:.0f} MB loaded {intercept/1e6:+.1f} MB "
+        f"+ {slope:,.0f} B/word"
+    )
+    print(f"| Memory setting | Planning budget ({MEMORY_HEADROOM:.0%}) | Largest safe transcript |")
+    print("|---|---|---|")
+    for mb in memory_mb:
+        budget = mb * 1_000_000 * MEMORY_HEADROOM
+        if slope <= 0:
+            verdict = "not bounded by this fit (no growth measured)"
+        else:
+            words = int((budget - loaded - intercept) / slope)
+            verdict = (
+                f"{words:,} words (≈{words/WORDS_PER_HOUR:.1f} h)" if words > 0 else "model does not fit"
+            )
+        print(f"| {mb:,} MB | {budget/1e6:,.0f} MB | {verdict} |")
+    print()
+    return {"probes": probes, "loadedBytes": loaded, "interceptBytes": intercept, "bytesPerWord": slope}
+
+
+def top_allocations(nlp, text: str, limit: int = 10) -> None:
+    """Python-level allocation sites still live after one inference, by size."""
+    tracemalloc.start()
+    doc = nlp(text)
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del doc
+
+    print(f"## Top {limit} allocation sites (tracemalloc, one ~1h inference)")
+    print("| Site | Size | Blocks |")
+    print("|---|---|---|")
+    for stat in snapshot.statistics("lineno")[:limit]:
+        frame = stat.traceback[0]
+        site = f"{pathlib.Path(frame.filename).name}:{frame.lineno}"
+        print(f"| `{site}` | {stat.size/1e6:.2f} MB | {stat.count:,} |")
+    print()
+
+
+def profile_components(nlp, corpus: str, synthetic_seed: int | None, repeat: int = 3) -> None:
+    """
+    Times the tokenizer and each pipe's __call__ separately, the same sequence
+    Language.__call__ runs, on the latency inputs. Best of `repeat` per cell so
+    one GC pause does not decide what gets excluded.
+
+    Read the table against what the service consumes before excluding anything:
+    index.py returns `hasVerb`, which needs POS from the morphologizer (and the
+    attribute_ruler's mappings), and components that listen to a shared tok2vec
+    stop working without it.
+    """
+    names = ["tokenizer", *nlp.pipe_names]
+    timings: dict[str, list[float]] = {name: [] for name in names}
+    nlp(corpus)  # warm-up: first-call allocations are a cold-start cost, not a component cost
+
+    for _label, multiplier in LATENCY_SIZES:
+        text = latency_input(corpus, multiplier, synthetic_seed)
+        best = {name: float("inf") for name in names}
+        for _ in range(repeat):
+            started = time.perf_counter()
+            doc = nlp.make_doc(text)
+            best["tokenizer"] = min(best["tokenizer"], time.perf_counter() - started)
+            for name, proc in nlp.pipeline:
+                started = time.perf_counter()
+                doc = proc(doc)
+                best[name] = min(best[name], time.perf_counter() - started)
+        for name in names:
+            timings[name].append(best[name])
+
+    totals = [sum(timings[name][i] for name in names) for i in range(len(LATENCY_SIZES))]
+    print(f"## Component latency (best of {repeat}; share of pipeline total)")
+    print("| Component | " + " | ".join(label for label, _ in LATENCY_SIZES) + " |")
+    print("|---" * (len(LATENCY_SIZES) + 1) + "|")
+    for name in names:
+        cells = [
+            f"{seconds:.3f} s ({seconds/total:.1%})" if total else f"{seconds:.3f} s"
+            for seconds, total in zip(timings[name], totals)
+        ]
+        print(f"| {name} | " + " | ".join(cells) + " |")
+    print("| **total** | " + " | ".join(f"**{t:.3f} s**" for t in totals) + " |")
+    print()
+
+
+def synthetic_recall(nlp, seed: int, non_person: frozenset[str], max_tokens: int) -> dict[str, dict]:
+    """
+    NER recall on a generated ~1h transcript. There is no Node column: the
+    Node verdicts come from measure-node.ts, which only sees the fixture files.
+    """
+    transcript = synth_transcripts.generate(WORDS_PER_HOUR, seed=seed)
+    text, attendees = transcript["text"], transcript["attendees"]
+    doc = nlp(text)
+    configurations = ner_configurations(non_person, max_tokens)
+    outputs = [ner_spans(doc, attendees, **config["kwargs"]) for config in configurations]
+    # Ground-truth offsets per surface: a surface counts as caught when every
+    # injected occurrence of it was redacted.
+    targets: dict[str, list[tuple[int, int]]] = {}
+    for m in transcript["mentions"]:
+        targets.setdefault(m["surface"], []).append((m["start"], m["end"]))
+    surfaces = transcript["mustRedact"]
+    caught_matrix = np.array(
+        [[caught(spans, targets[surface]) for spans in outputs] for surface in surfaces], dtype=bool
+    ).reshape(len(surfaces), len(outputs))
+    ambiguous_by_surface = {m["surface"]: m["ambiguous"] for m in transcript["mentions"]}
+    ambiguous = np.array([ambiguous_by_surface[surface] for surface in surfaces], dtype=bool)
+    labels = ("all injected names", "  ↳ ambiguous given name", "  ↳ unambiguous")
+    counts, recall = slice_recall(caught_matrix, np.vstack([np.ones_like(ambiguous), ambiguous, ~ambiguous]))
+    columns = [config["column"] for config in configurations]
+
+    print(f"## Recall — synthetic ~1h transcript (seed {seed}, {len(text.split()):,} words)")
+    print("| Slice | Mentions | " + " | ".join(columns) + " |")
+    print("|---" * (len(columns) + 2) + "|")
+    slices: dict[str, dict] = {}
+    for label, n, values in zip(labels, counts, recall):
+        if not n:
+            continue
+        slices[label.strip(" ↳")] = {"mentions": int(n), "recall": dict(zip(columns, map(float, values)))}
+        print(f"| {label} | {n} | " + " | ".join(f"{value:.1%}" for value in values) + " |")
+    print()
+    return slices
+
+
+def ner_configurations(non_person: frozenset[str], max_tokens: int) -> tuple[dict, ...]:
+    """
+    The NER columns of every recall table. Adding one here adds it everywhere:
+
+      label  -> false-redaction line and --json key
+      column -> recall table header and --json key
+      union  -> header of its "Node or this" column, or None for no such column
+      kwargs -> `ner_spans` keyword arguments
+
+    Ordered weakest first; the LAST one is the candidate configuration, the one
+    the "missed by both" line is reported against.
+    """
+    return (
+        {"label": "PER-only", "column": "NER PER", "union": "Node+PER", "kwargs": {}},
+        {
+            "label": "any-label",
+            "column": "NER any",
+            "union": None,
+            "kwargs": {"any_label": True, "non_person_terms": non_person},
+        },
+        {
+            "label": "any-label + shape filter",
+            "column": "NER any+shape",
+            "union": "Node+any+shape",
+            "kwargs": {
+                "any_label": True,
+                "shape_filter": True,
+                "non_person_terms": non_person,
+                "max_tokens": max_tokens,
+            },
+        },
+    )
+
+
+def recall_columns(configurations: tuple[dict, ...]) -> list[str]:
+    """Column order of the fixture recall table, also the keys of `recall` in --json output."""
+    return [
+        "Node-only",
+        *(config["column"] for config in configurations),
+        *(config["union"] for config in configurations if config["union"]),
+    ]
+
+
+def slice_recall(caught_matrix: np.ndarray, masks: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Mentions and recall for every slice × column at once.
+
+    caught_matrix -> bool, mentions × columns
+    masks         -> bool, slices × mentions (a mention may sit in several slices)
+    """
+    weights = masks.astype(np.int64)
+    counts = weights.sum(axis=1)
+    hits = weights @ caught_matrix.astype(np.int64)
+    return counts, hits / np.maximum(counts, 1)[:, None]
+
+
+def ner_spans(
+    doc,
     attendees: list[str],
     *,
     any_label: bool = False,
     shape_filter: bool = False,
     non_person_terms: frozenset[str] = frozenset(),
     max_tokens: int = 4,
-) -> str:
+) -> list[tuple[int, int, str]]:
     """
-    Redacts entities that are not attendees, newest offsets first.
+    (start, end, token) for every entity that is not an attendee, in text order.
 
     any_label=False -> PER entities only (the naive reading of "use NER").
     any_label=True  -> entities of ANY label, minus anything the Node layer's
@@ -80,9 +375,10 @@ def ner_sanitize(
     shape_filter    -> additionally drop spans that cannot be a name: longer
                        than max_tokens, or containing a verb. Both use
                        information the model already computed, so they are free.
+
+    Takes a parsed doc so every configuration shares one `nlp()` call.
     """
     allow = attendee_tokens(attendees)
-    doc = nlp(text)
     numbers: dict[str, int] = {}
     spans = []
 
@@ -108,19 +404,257 @@ def ner_sanitize(
         for t in tokens:
             numbers[t] = assigned
         spans.append((ent.start_char, ent.end_char, f"[persona {assigned}]"))
+    return spans
+
+
+def splice(text: str, spans: list[tuple[int, int, str]]) -> str:
+    """One pass over non-overlapping spans in text order; each byte of `text` is copied once."""
+    parts = []
+    cursor = 0
+    for start, end, token in spans:
+        parts.append(text[cursor:start])
+        parts.append(token)
+        cursor = end
+    parts.append(text[cursor:])
+    return "".join(parts)
 
-    out = text
-    for start, end, token in sorted(spans, key=lambda s: -s[0]):
-        out = out[:start] + token + out[end:]
-    return out
+
+def ner_sanitize(nlp, text: str, attendees: list[str], **kwargs) -> str:
+    """Redacted text, for eyeballing a configuration; scoring works on `ner_spans` directly."""
+    return splice(text, ner_spans(nlp(text), attendees, **kwargs))
+
+
+def occurrences(text: str, mention: str) -> list[tuple[int, int]]:
+    """Every (start, end) of `mention` in `text`, overlapping ones included."""
+    found = []
+    start = text.find(mention)
+    while start != -1:
+        found.append((start, start + len(mention)))
+        start = text.find(mention, start + 1)
+    return found
+
+
+def caught(spans: list[tuple[int, int, str]], targets: list[tuple[int, int]]) -> bool:
+    """
+    True when every target range overlaps a redacted span, i.e. no copy of the
+    mention survives intact. `spans` is in text order and non-overlapping (spaCy
+    entities never overlap), so one bisect per target finds the only candidate.
+    """
+    starts = [s for s, _e, _t in spans]
+    for start, end in targets:
+        i = bisect.bisect_left(starts, end) - 1
+        if i < 0 or spans[i][1] <= start:
+            return False
+    return True
+
+
+def evaluate_case(nlp, configurations, suite_name: str, case: dict, verdicts: dict[str, bool]) -> list[tuple]:
+    """
+    (suite, category, node, *one caught flag per configuration) for each
+    must-redact mention of one fixture case.
+    """
+    doc = nlp(case["text"])
+    outputs = [ner_spans(doc, case["attendees"], **config["kwargs"]) for config in configurations]
+    rows = []
+    for mention in case["mustRedact"]:
+        targets = occurrences(case["text"], mention)
+        rows.append(
+            (
+                suite_name,
+                case.get("category", "explicit-reference"),
+                verdicts.get(mention, False),
+                *(caught(spans, targets) for spans in outputs),
+            )
+        )
+    return rows
+
+
+_worker_nlp = None
+_worker_configurations: tuple = ()
+
+
+def _init_recall_worker(model: str, configurations) -> None:
+    global _worker_nlp, _worker_configurations
+    import spacy
+
+    _worker_nlp = spacy.load(model, disable=["lemmatizer", "textcat"])
+    _worker_configurations = configurations
+
+
+def _evaluate_case_in_worker(task: tuple[str, dict, dict[str, bool]]) -> list[tuple]:
+    return evaluate_case(_worker_nlp, _worker_configurations, *task)
+
+
+def recall_rows(nlp, model: str, configurations, node_verdicts: dict, jobs: int) -> list[tuple]:
+    """
+    Every fixture mention's row, in fixture order. With jobs > 1 the cases are
+    sharded across worker processes, each loading the model once; `map` hands
+    results back in submission order, so the rows (and every table built from
+    them) are identical to a serial run.
+    """
+    tasks = []
+    for name in ("must-catch.json", "adversarial.json"):
+        suite = json.loads((FIXTURE_DIR / name).read_text(encoding="utf-8"))
+        for case in suite["cases"]:
+            tasks.append((suite["suite"], case, node_verdicts.get(case["id"], {})))
+
+    if jobs <= 1:
+        per_case = [evaluate_case(nlp, configurations, *task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_recall_worker,
+            initargs=(model, configurations),
+        ) as pool:
+            per_case = list(pool.map(_evaluate_case_in_worker, tasks, chunksize=max(1, len(tasks) // (jobs * 4))))
+    return [row for rows in per_case for row in rows]
+
+
+def compare_results(
+    baseline: dict,
+    current: dict,
+    *,
+    latency_tolerance: float,
+    recall_tolerance: float,
+    false_redaction_tolerance: int,
+) -> list[str]:
+    """
+    Prints a baseline-vs-current table and returns the regressions. Latency may
+    grow by `latency_tolerance` (a fraction) before it counts; recall may drop
+    by `recall_tolerance` (a fraction, so 0.01 is one point); false redactions
+    may grow by `false_redaction_tolerance` spans. A metric the baseline has and
+    the current run lacks is a regression, and runs of a different schema or on
+    different inputs are not compared at all: the mismatch is the one failure.
+    """
+    regressions: list[str] = []
+    print("## Comparison against baseline")
+    for key in ("schema", "inputs"):
+        if baseline.get(key) != current.get(key):
+            print(f"{key} mismatch: baseline {baseline.get(key)} vs current {current.get(key)}; not comparable")
+            return [f"{key} mismatch"]
+    print("| Metric | Baseline | Current | Change | Verdict |")
+    print("|---|---|---|---|---|")
+
+    def row(metric: str, before: float, after: float, change: str, regressed: bool) -> None:
+        print(f"| {metric} | {before} | {after} | {change} | {'REGRESSED' if regressed else 'ok'} |")
+        if regressed:
+            regressions.append(metric)
+
+    def missing(metric: str, before: object, after: object) -> bool:
+        if before is not None and after is not None:
+            return False
+        row(metric, "missing" if before is None else "present", "missing" if after is None else "present", "—", True)
+        return True
+
+    # Footprint is reported, never gated: a smaller model is the point of slimming.
+    for key, label in (("modelMb", "model on disk"), ("sitePackagesMb", "site-packages")):
+        before, after = baseline.get("footprint", {}).get(key), current.get("footprint", {}).get(key)
+        if missing(label, before, after):
+            continue
+        change = (after - before) / before if before else 0.0
+        row(label, f"{before:.1f} MB", f"{after:.1f} MB", f"{change:+.1%}", False)
+
+    timings = [("model load", baseline.get("loadSeconds"), current.get("loadSeconds"))]
+    current_latency = {r["label"]: r["seconds"] for r in current.get("latency", [])}
+    for entry in baseline.get("latency", []):
+        timings.append((f"latency {entry['label']}", entry["seconds"], current_latency.get(entry["label"])))
+    for metric, before, after in timings:
+        if missing(metric, before, after):
+            continue
+        change = (after - before) / before if before else 0.0
+        regressed = change > latency_tolerance and after - before > LATENCY_NOISE_SECONDS
+        row(metric, f"{before:.2f} s", f"{after:.2f} s", f"{change:+.1%}", regressed)
+
+    for slice_key, before_slice in baseline.get("recall", {}).items():
+        after_slice = current.get("recall", {}).get(slice_key)
+        if missing(f"recall {slice_key}", before_slice, after_slice):
+            continue
+        for column, before in before_slice["recall"].items():
+            after = after_slice["recall"].get(column)
+            if missing(f"recall {slice_key} / {column}", before, after):
+                continue
+            row(
+                f"recall {slice_key} / {column}",
+                f"{before:.1%}",
+                f"{after:.1%}",
+                f"{(after - before) * 100:+.1f} pts",
+                before - after > recall_tolerance,
+            )
+
+    for label, before in baseline.get("falseRedactions", {}).items():
+        after = current.get("falseRedactions", {}).get(label)
+        if missing(f"false redactions {label}", before, after):
+            continue
+        row(f"false redactions {label}", before, after, f"{after - before:+d}", after - before > false_redaction_tolerance)
+    print()
+    return regressions
+
+
+def parse_memory_mb(value: str) -> tuple[int, ...]:
+    try:
+        return tuple(int(part) for part in value.split(",") if part.strip())
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma-separated MB values, got {value!r}")
 
 
 def main() -> int:
-    if len(sys.argv) < 2:
-        print("usage: measure_ner.py <node-results.json>", file=sys.stderr)
+    parser = argparse.ArgumentParser(description="Z0B NER spike measurements.")
+    parser.add_argument("node_results", nargs="?", help="output of measure-node.ts")
+    parser.add_argument(
+        "--model",
+        default=MODEL,
+        help=f"installed package name or model directory (default {MODEL}), e.g. slim_model.py output",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="also measure memory (fresh interpreter per input size, allocation sites), after latency",
+    )
+    parser.add_argument(
+        "--memory-mb",
+        type=parse_memory_mb,
+        default=DEFAULT_MEMORY_MB,
+        help="with --memory: comma-separated function memory settings to size transcripts against",
+    )
+    parser.add_argument(
+        "--components",
+        action="store_true",
+        help="only profile per-component latency; node results are not needed",
+    )
+    parser.add_argument(
+        "--synthetic",
+        type=int,
+        metavar="SEED",
+        help="drive latency/memory/recall with seeded synth_transcripts.py sessions",
+    )
+    parser.add_argument("--json", type=pathlib.Path, metavar="PATH", help="write the results document here")
+    parser.add_argument("--compare", type=pathlib.Path, metavar="BASELINE", help="fail on regression against this results document")
+    parser.add_argument("--latency-tolerance", type=float, default=0.25, help="allowed latency growth, as a fraction (default 0.25)")
+    parser.add_argument("--recall-tolerance", type=float, default=0.0, help="allowed recall drop, as a fraction (default 0)")
+    parser.add_argument("--false-redaction-tolerance", type=int, default=0, help="allowed extra false redactions (default 0)")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="worker processes for the fixture recall loop, each loading the model once (default 1)",
+    )
+    parser.add_argument("--memory-probe", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.memory_probe is not None:
+        print(json.dumps(memory_probe(args.model, args.memory_probe, args.synthetic)))
+        return 0
+    if args.components:
+        import spacy
+
+        nlp = spacy.load(args.model, disable=["lemmatizer", "textcat"])
+        profile_components(nlp, load_corpus()[1], args.synthetic)
+        return 0
+    if not args.node_results:
+        parser.print_usage(sys.stderr)
         return 2
 
-    node_results = json.loads(pathlib.Path(sys.argv[1]).read_text(encoding="utf-8"))
+    node_results = json.loads(pathlib.Path(args.node_results).read_text(encoding="utf-8"))
     node_verdicts = {
         case["id"]: {m["mention"]: m["caughtByNode"] for m in case["mentions"]}
         for suite in node_results["suites"]
@@ -131,123 +665,129 @@ def main() -> int:
     site_packages = pathlib.Path(sys.prefix) / "lib" / f"python{sys.version_info.major}.{sys.version_info.minor}" / "site-packages"
     print("## Footprint")
     print(f"python:                    {sys.version.split()[0]}")
-    print(f"site-packages:             {directory_size_mb(site_packages):.1f} MB")
+    site_packages_mb = directory_size_mb(site_packages)
+    print(f"site-packages:             {site_packages_mb:.1f} MB")
 
     # ---- load time -------------------------------------------------------
     import spacy  # imported here so the timing below excludes nothing
 
     started = time.perf_counter()
-    nlp = spacy.load(MODEL, disable=["lemmatizer", "textcat"])
+    nlp = spacy.load(args.model, disable=["lemmatizer", "textcat"])
     load_seconds = time.perf_counter() - started
-    model_dir = pathlib.Path(spacy.util.get_package_path(MODEL))
+    model_mb = directory_size_mb(model_path(args.model))
     print(f"spaCy:                     {spacy.__version__}")
-    print(f"model:                     {MODEL} ({directory_size_mb(model_dir):.1f} MB on disk)")
+    print(f"model:                     {args.model} ({model_mb:.1f} MB on disk)")
     print(f"model load (cold-import proxy): {load_seconds:.2f} s")
     print()
 
-    # ---- latency ---------------------------------------------------------
-    precision = json.loads((FIXTURE_DIR / "precision.json").read_text(encoding="utf-8"))
-    corpus = "\n\n".join(precision["paragraphs"])
-    corpus_words = len(corpus.split())
+    results: dict = {
+        "schema": RESULTS_SCHEMA,
+        "environment": {"python": sys.version.split()[0], "spacy": spacy.__version__, "model": args.model},
+        "inputs": {"synthetic": args.synthetic},
+        "footprint": {"sitePackagesMb": site_packages_mb, "modelMb": model_mb},
+        "loadSeconds": load_seconds,
+        "latency": [],
+        "recall": {},
+        "falseRedactions": {},
+    }
 
+    # ---- latency ---------------------------------------------------------
+    precision, corpus = load_corpus()
     print("## Latency (after load; single process, no batching)")
     print("| Input | Words | Wall time | Words/s |")
     print("|---|---|---|---|")
-    for label, multiplier in (("fixture corpus", 1), ("~1h session", 15), ("~2h session", 30)):
-        text = "\n\n".join([corpus] * multiplier)
-        words = corpus_words * multiplier
+    for label, multiplier in LATENCY_SIZES:
+        text = latency_input(corpus, multiplier, args.synthetic)
+        words = len(text.split())
         started = time.perf_counter()
         nlp(text)
         elapsed = time.perf_counter() - started
         print(f"| {label} | {words:,} | {elapsed:.2f} s | {words/elapsed:,.0f} |")
+        results["latency"].append({"label": label, "words": words, "seconds": elapsed})
     print()
 
+    # ---- memory ----------------------------------------------------------
+    # After the latency rows, so the traced inference cannot warm or skew them.
+    if args.memory:
+        results["memory"] = measure_memory(args.model, args.memory_mb, args.synthetic)
+        top_allocations(nlp, latency_input(corpus, 15, args.synthetic))
+
     # ---- recall ----------------------------------------------------------
     non_person = frozenset(node_results.get("nonPersonTerms", []))
 
-    # (suite, category, node, ner_per, ner_any) per mention
     max_tokens = int(node_results.get("maxNameTokens", 4))
-    rows: list[tuple[str, str, bool, bool, bool, bool]] = []
-    for name in ("must-catch.json", "adversarial.json"):
-        suite = json.loads((FIXTURE_DIR / name).read_text(encoding="utf-8"))
-        for case in suite["cases"]:
-            per_only = ner_sanitize(nlp, case["text"], case["attendees"])
-            any_label = ner_sanitize(
-                nlp,
-                case["text"],
-                case["attendees"],
-                any_label=True,
-                non_person_terms=non_person,
-            )
-            filtered = ner_sanitize(
-                nlp,
-                case["text"],
-                case["attendees"],
-                any_label=True,
-                shape_filter=True,
-                non_person_terms=non_person,
-                max_tokens=max_tokens,
-            )
-            for mention in case["mustRedact"]:
-                rows.append(
-                    (
-                        suite["suite"],
-                        case.get("category", "explicit-reference"),
-                        node_verdicts.get(case["id"], {}).get(mention, False),
-                        mention not in per_only,
-                        mention not in any_label,
-                        mention not in filtered,
-                    )
-                )
-
-    def summarize(label: str, subset: list[tuple[str, str, bool, bool, bool, bool]]) -> None:
-        if not subset:
-            return
-        n = len(subset)
-        pct = lambda i: f"{sum(1 for r in subset if r[i])/n:.1%}"
-        union = lambda i: f"{sum(1 for r in subset if r[2] or r[i])/n:.1%}"
-        print(
-            f"| {label} | {n} | {pct(2)} | {pct(3)} | {pct(4)} | {pct(5)} | "
-            f"{union(3)} | {union(5)} |"
-        )
-
-    print("## Recall — identical fixtures, six configurations")
-    print(
-        "| Slice | Mentions | Node-only | NER PER | NER any | NER any+shape | "
-        "Node+PER | Node+any+shape |"
-    )
-    print("|---|---|---|---|---|---|---|---|")
-    summarize("must-catch (blocking)", [r for r in rows if r[0] == "must-catch"])
-    adversarial = [r for r in rows if r[0] == "adversarial"]
-    summarize("adversarial (monitoring)", adversarial)
-    for category in sorted({r[1] for r in adversarial}):
-        summarize(f"  ↳ {category}", [r for r in adversarial if r[1] == category])
+    configurations = ner_configurations(non_person, max_tokens)
+    rows = recall_rows(nlp, args.model, configurations, node_verdicts, args.jobs)
+
+    # mentions × (Node, one column per configuration); True = caught. Suite and
+    # category are integer codes into the sorted unique names.
+    caught_matrix = np.array([row[2:] for row in rows], dtype=bool).reshape(len(rows), 1 + len(configurations))
+    suites, suite_codes = np.unique([row[0] for row in rows], return_inverse=True)
+    categories, category_codes = np.unique([row[1] for row in rows], return_inverse=True)
+    unions = [i for i, config in enumerate(configurations, start=1) if config["union"]]
+    table = np.hstack([caught_matrix, caught_matrix[:, :1] | caught_matrix[:, unions]])
+    columns = recall_columns(configurations)
+
+    def suite_mask(name: str) -> np.ndarray:
+        matches = np.flatnonzero(suites == name)
+        return suite_codes == matches[0] if matches.size else np.zeros(len(rows), dtype=bool)
+
+    adversarial = suite_mask("adversarial")
+    slices = [
+        ("must-catch (blocking)", "must-catch", suite_mask("must-catch")),
+        ("adversarial (monitoring)", "adversarial", adversarial),
+    ]
+    for code in np.unique(category_codes[adversarial]):
+        category = str(categories[code])
+        slices.append((f"  ↳ {category}", f"adversarial/{category}", adversarial & (category_codes == code)))
+    counts, recall = slice_recall(table, np.vstack([mask for _label, _key, mask in slices]))
+
+    print(f"## Recall — identical fixtures, {len(columns)} configurations")
+    print("| Slice | Mentions | " + " | ".join(columns) + " |")
+    print("|---" * (len(columns) + 2) + "|")
+    for (label, key, _mask), n, values in zip(slices, counts, recall):
+        if not n:
+            continue
+        results["recall"][key] = {"mentions": int(n), "recall": dict(zip(columns, map(float, values)))}
+        print(f"| {label} | {n} | " + " | ".join(f"{value:.1%}" for value in values) + " |")
     print()
 
-    both_missed = [r for r in adversarial if not r[2] and not r[5]]
+    both_missed = int((adversarial & ~caught_matrix[:, 0] & ~caught_matrix[:, -1]).sum())
     print(
-        f"adversarial mentions missed by Node AND any+shape NER: "
-        f"{len(both_missed)}/{len(adversarial)}"
+        f"adversarial mentions missed by Node AND {configurations[-1]['column']}: "
+        f"{both_missed}/{int(adversarial.sum())}"
     )
+    results["missedByBoth"] = {"count": both_missed, "of": int(adversarial.sum())}
 
     # Precision counter-check: the any-label variant is only worth recommending
     # if it does not start shredding ordinary session speech.
-    precision_text = "\n\n".join(precision["paragraphs"])
-    for label, kwargs in (
-        ("PER-only", {}),
-        ("any-label", {"any_label": True, "non_person_terms": non_person}),
-        (
-            "any-label + shape filter",
-            {
-                "any_label": True,
-                "shape_filter": True,
-                "non_person_terms": non_person,
-                "max_tokens": max_tokens,
-            },
-        ),
-    ):
-        out = ner_sanitize(nlp, precision_text, precision["attendees"], **kwargs)
-        print(f"false redactions on name-free corpus ({label}): {out.count('[persona')}")
+    precision_doc = nlp("\n\n".join(precision["paragraphs"]))
+    for config in configurations:
+        label = config["label"]
+        redactions = len(ner_spans(precision_doc, precision["attendees"], **config["kwargs"]))
+        print(f"false redactions on name-free corpus ({label}): {redactions}")
+        results["falseRedactions"][label] = redactions
+
+    if args.synthetic is not None:
+        print()
+        for key, value in synthetic_recall(nlp, args.synthetic, non_person, max_tokens).items():
+            results["recall"][f"synthetic/{key}"] = value
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    if args.compare:
+        print()
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare_results(
+            baseline,
+            results,
+            latency_tolerance=args.latency_tolerance,
+            recall_tolerance=args.recall_tolerance,
+            false_redaction_tolerance=args.false_redaction_tolerance,
+        )
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {args.compare}", file=sys.stderr)
+            return 1
     return 0
 
 
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Z0B NER spike — shared Spanish name normalization.
+
+Every comparison between an attendee and a detected entity goes through
+`normalize`: NFD, drop combining marks (Unicode category Mn), lowercase. The
+original version in measure_ner.py called `unicodedata.category` once per
+character of every attendee and every entity; this one does the mark removal
+with a single `str.translate` over a table built once, skips the Unicode work
+entirely for ASCII input (most Whisper output), and memoizes the per-attendee
+token split, since the same few names are checked against every entity of
+every transcript.
+
+measure_ner.py imports it, and index.py will once attendee filtering moves
+behind the endpoint in Z5. The Node layer keeps its own `normalize` in
+lib/zoom/sanitizer.ts, which strips only U+0300-U+036F; the two agree on every
+name in the fixtures and in normalize_parity.json, and differ only for marks
+outside that block (Hebrew points, Devanagari signs) that no es-CL name uses.
+
+normalize_parity.json holds inputs with the output the per-character version
+produced. `--check` fails if any of them changes; `--bench` times both.
+
+Usage:
+    python scripts/spikes/ner/name_normalize.py --check
+    python scripts/spikes/ner/name_normalize.py --bench
+"""
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import pathlib
+import sys
+import timeit
+import unicodedata
+
+PARITY_CORPUS = pathlib.Path(__file__).resolve().parent / "normalize_parity.json"
+
+# Mirrors the Node layer: connectors and two-letter fragments match too much to
+# be safe evidence that a detected entity is an attendee.
+CONNECTORS = frozenset({"de", "del", "la", "las", "los", "y", "da", "do"})
+
+# Distinct attendee names kept tokenized. A session has a handful; a batch
+# re-score over an archive sees a few thousand.
+ATTENDEE_CACHE_SIZE = 4096
+
+
+@functools.cache
+def _strip_marks() -> dict[int, None]:
+    # Built on first use rather than at import: walking every code point costs
+    # ~0.2 s, which a cold start that never compares a name should not pay.
+    return {cp: None for cp in range(sys.maxunicode + 1) if unicodedata.category(chr(cp)) == "Mn"}
+
+
+def normalize(value: str) -> str:
+    """Lowercase + strip diacritics. Whisper drops accents constantly, so every comparison goes through this."""
+    if value.isascii():
+        return value.lower()
+    return unicodedata.normalize("NFD", value).translate(_strip_marks()).lower()
+
+
+@functools.lru_cache(maxsize=ATTENDEE_CACHE_SIZE)
+def name_tokens(name: str) -> frozenset[str]:
+    """The tokens of one attendee name that count as evidence an entity is that attendee."""
+    return frozenset(part for part in normalize(name).split() if len(part) >= 3 and part not in CONNECTORS)
+
+
+def attendee_tokens(names: list[str]) -> set[str]:
+    tokens: set[str] = set()
+    for name in names:
+        tokens |= name_tokens(name)
+    return tokens
+
+
+def _reference_normalize(value: str) -> str:
+    """The original per-character implementation, kept only for --bench."""
+    stripped = unicodedata.normalize("NFD", value)
+    return "".join(c for c in stripped if unicodedata.category(c) != "Mn").lower()
+
+
+def check() -> int:
+    corpus = json.loads(PARITY_CORPUS.read_text(encoding="utf-8"))
+    failures = []
+    for source, expected in corpus["cases"]:
+        got = normalize(source)
+        if got != expected:
+            failures.append((source, expected, got))
+    for source, expected, got in failures:
+        print(f"MISMATCH {source!r}: expected {expected!r}, got {got!r}")
+    print(f"{len(corpus['cases']) - len(failures)}/{len(corpus['cases'])} parity cases match")
+    return 1 if failures else 0
+
+
+def bench(number: int) -> int:
+    corpus = json.loads(PARITY_CORPUS.read_text(encoding="utf-8"))
+    inputs = [source for source, _expected in corpus["cases"]]
+    _strip_marks()  # table build is a one-off; reported separately below
+    print(f"| Implementation | {len(inputs)} inputs x {number} |")
+    print("|---|---|")
+    for label, fn in (("per-character category", _reference_normalize), ("translate table", normalize)):
+        seconds = min(timeit.repeat(lambda: [fn(s) for s in inputs], number=number, repeat=5))
+        print(f"| {label} | {seconds*1000:.1f} ms |")
+    _strip_marks.cache_clear()
+    build = timeit.timeit(_strip_marks, number=1)
+    print(f"| table build (once per process) | {build*1000:.1f} ms |")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Shared name normalization: parity check and micro-benchmark.")
+    parser.add_argument("--check", action="store_true", help="verify normalize_parity.json")
+    parser.add_argument("--bench", action="store_true", help="time against the per-character version")
+    parser.add_argument("--number", type=int, default=1000)
+    args = parser.parse_args()
+
+    status = 0
+    if args.check or not args.bench:
+        status = check()
+    if args.bench:
+        status = bench(args.number) or status
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Z0B NER spike — export a pruned es_core_news_md and score it against the original.
+
+The service loads the full model and then ignores part of it: index.py
+excludes the lemmatizer and textcat at load time, but they still ship in the
+bundle, and so do the static vectors and the vocab lookups that only exist to
+support them. Smaller bundles and faster cold starts are only worth having with
+a PROVEN recall cost, so this tool does both halves:
+
+  1. writes a pruned model directory:
+       --exclude           components dropped from the saved pipeline
+       --vectors keep      static vectors untouched
+       --vectors prune:N   keep N rows, remap every other word to its nearest
+                           kept row (Vocab.prune_vectors)
+       --vectors drop      no static vectors at all
+       --strip-vocab       drop vocab lookup tables the runtime never reads and,
+                           with --vectors drop, the strings that were vector keys
+                           and that nothing else in the saved pipeline references
+  2. reruns measure_ner.py on the original and on the pruned model, then diffs
+     the two with its --compare gate: footprint, load time, latency, and the full
+     recall / false-redaction table.
+
+The md model's tok2vec may read static vectors as features; `--vectors drop`
+on such a pipeline shows up as a recall drop (or a load failure) in step 2,
+which is the point of running it.
+
+Usage:
+    ./venv/bin/python scripts/spikes/ner/slim_model.py /tmp/es-slim --vectors prune:20000 \\
+        --node-results /tmp/node-results.json
+    ./venv/bin/python -m spacy package /tmp/es-slim /tmp/dist   # deployable wheel
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import subprocess
+import sys
+import tempfile
+
+from measure_ner import MODEL, directory_size_mb, model_path
+
+HERE = pathlib.Path(__file__).resolve().parent
+
+# What index.py already excludes at load time: pure bundle weight.
+DEFAULT_EXCLUDE = ("lemmatizer", "textcat")
+
+# Vocab lookup tables nothing in an inference-only pipeline reads.
+UNUSED_LOOKUPS = ("lexeme_prob", "lexeme_cluster", "lexeme_settings")
+
+
+def saved_references(out: pathlib.Path, *, skip: set[pathlib.Path]) -> tuple[set[str], set[int]]:
+    """Every string and integer (a possible string hash) in the files of a saved pipeline.
+
+    Components, the tokenizer and the lookups serialize as msgpack or JSON; files
+    that are neither (config.cfg, raw weights) are skipped.
+    """
+    import srsly
+
+    strings: set[str] = set()
+    hashes: set[int] = set()
+
+    def walk(value) -> None:
+        stack = [value]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                strings.add(item)
+            elif isinstance(item, bool):
+                continue
+            elif isinstance(item, int):
+                hashes.add(item)
+            elif isinstance(item, dict):
+                stack.extend(item.keys())
+                stack.extend(item.values())
+            elif isinstance(item, (list, tuple)):
+                stack.extend(item)
+            elif isinstance(item, bytes):
+                try:
+                    stack.append(srsly.msgpack_loads(item))
+                except Exception:
+                    pass
+
+    for path in sorted(out.rglob("*")):
+        if not path.is_file() or path in skip:
+            continue
+        data = path.read_bytes()
+        try:
+            if path.suffix == ".json":
+                walk(json.loads(data))
+            elif path.suffix == ".jsonl":
+                walk([json.loads(line) for line in data.splitlines() if line.strip()])
+            elif path.suffix != ".cfg":
+                walk(srsly.msgpack_loads(data))
+        except Exception:
+            continue  # not a serialized structure
+    return strings, hashes
+
+
+def slim(model: str, out: pathlib.Path, *, exclude: tuple[str, ...], vectors: str, strip_vocab: bool) -> None:
+    import spacy
+
+    nlp = spacy.load(model, exclude=list(exclude))
+    vector_keys = set(nlp.vocab.vectors.keys())
+    print(f"components kept:  {', '.join(nlp.pipe_names)}")
+    print(f"vectors before:   {nlp.vocab.vectors.shape[0]:,} rows x {nlp.vocab.vectors.shape[1]}, {len(vector_keys):,} keys")
+
+    if vectors == "drop":
+        nlp.vocab.reset_vectors(width=0)
+    elif vectors.startswith("prune:"):
+        nlp.vocab.prune_vectors(int(vectors.split(":", 1)[1]))
+    elif vectors != "keep":
+        raise SystemExit(f"--vectors must be keep, drop or prune:N, got {vectors!r}")
+    print(f"vectors after:    {nlp.vocab.vectors.shape[0]:,} rows x {nlp.vocab.vectors.shape[1]}")
+
+    if strip_vocab:
+        for table in UNUSED_LOOKUPS:
+            if nlp.vocab.lookups.has_table(table):
+                nlp.vocab.lookups.remove_table(table)
+                print(f"lookup removed:   {table}")
+
+    nlp.meta["name"] = f"{nlp.meta.get('name', 'model')}_slim"
+    nlp.meta["description"] = (
+        f"{model} pruned by scripts/spikes/ner/slim_model.py "
+        f"(exclude={','.join(exclude) or 'none'}, vectors={vectors}, strip_vocab={strip_vocab})"
+    )
+    nlp.to_disk(out)
+
+    if strip_vocab and vectors == "drop":
+        # StringStore has no removal API, so this edits the serialized store. A
+        # vector key's string is dropped only if nothing else in the saved
+        # pipeline names it: not a component's labels or patterns, not the
+        # tokenizer exceptions, not a lookup table key or value.
+        strings_path = out / "vocab" / "strings.json"
+        strings = json.loads(strings_path.read_text(encoding="utf-8"))
+        referenced, referenced_hashes = saved_references(out, skip={strings_path})
+        hash_string = spacy.strings.hash_string
+        kept = [
+            s for s in strings
+            if s in referenced or hash_string(s) not in vector_keys or hash_string(s) in referenced_hashes
+        ]
+        strings_path.write_text(json.dumps(kept, ensure_ascii=False), encoding="utf-8")
+        print(f"strings removed:  {len(strings) - len(kept):,} of {len(strings):,}")
+
+    # Fail here, not in step 2, if the pruned pipeline cannot even run.
+    spacy.load(out)("La estudiante Martina Rojas conversó con don Ignacio.")
+
+
+def measure(model: str, node_results: str, json_path: pathlib.Path, extra: list[str]) -> int:
+    sys.stdout.flush()  # keep our headings ahead of the child's output
+    command = [sys.executable, str(HERE / "measure_ner.py"), node_results, "--model", model, "--json", str(json_path)]
+    return subprocess.run(command + extra, check=False).returncode
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Export a pruned NER model and score it.")
+    parser.add_argument("out", type=pathlib.Path, help="directory to write the pruned model to")
+    parser.add_argument("--model", default=MODEL, help=f"source model (default {MODEL})")
+    parser.add_argument("--exclude", default=",".join(DEFAULT_EXCLUDE), help="comma-separated components to drop")
+    parser.add_argument("--vectors", default="keep", help="keep | drop | prune:N")
+    parser.add_argument("--strip-vocab", action="store_true")
+    parser.add_argument("--node-results", help="measure-node.ts output; enables the before/after scoring")
+    parser.add_argument("--recall-tolerance", default="0.0", help="passed to measure_ner.py --compare")
+    parser.add_argument("--latency-tolerance", default="0.25", help="passed to measure_ner.py --compare")
+    args = parser.parse_args()
+
+    exclude = tuple(c.strip() for c in args.exclude.split(",") if c.strip())
+    slim(args.model, args.out, exclude=exclude, vectors=args.vectors, strip_vocab=args.strip_vocab)
+    before_mb = directory_size_mb(model_path(args.model))
+    after_mb = directory_size_mb(args.out)
+    print(f"on disk:          {before_mb:.1f} MB -> {after_mb:.1f} MB ({after_mb/before_mb - 1:+.1%})")
+    print()
+
+    if not args.node_results:
+        print("no --node-results: skipping the recall/latency comparison")
+        return 0
+
+    with tempfile.TemporaryDirectory() as scratch:
+        baseline = pathlib.Path(scratch) / "original.json"
+        print(f"# Original: {args.model}")
+        if measure(args.model, args.node_results, baseline, []) != 0:
+            return 1
+        print()
+        print(f"# Pruned: {args.out}")
+        return measure(
+            str(args.out),
+            args.node_results,
+            pathlib.Path(scratch) / "pruned.json",
+            [
+                "--compare",
+                str(baseline),
+                "--recall-tolerance",
+                args.recall_tolerance,
+                "--latency-tolerance",
+                args.latency_tolerance,
+            ],
+        )
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
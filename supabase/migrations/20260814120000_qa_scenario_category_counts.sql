@@ -0,0 +1,44 @@
+-- =============================================================================
+-- 20260814120000_qa_scenario_category_counts.sql — QA guide statistics
+--
+-- scripts/generate-qa-guide.py only needs, per role, how many active manual
+-- scenarios exist under each category prefix (the `CA` of `CA-01: ...`). It used
+-- to download every qa_scenarios row and count them client-side. This view does
+-- the counting in Postgres, so `generate-qa-guide.py --aggregate` transfers
+-- roles × prefixes rows instead of one row per scenario.
+--
+-- PREFIX RULE: identical to extract_category_code() in the generator — the text
+-- before the FIRST '-', trimmed of whitespace (Python's str.strip(), so tabs and
+-- newlines too, not just btrim's spaces), or NULL when the name has no '-'.
+-- Mapping prefixes the guide does not label to 'OTHER' stays client-side, next
+-- to the label table, so adding a category never needs a migration.
+--
+-- FILTER: is_active AND NOT automated_only, the same as the full fetch. NULLs in
+-- either column are excluded, as `eq.true` / `eq.false` exclude them there.
+--
+-- SECURITY: security_invoker, so qa_scenarios' RLS applies to whoever reads the
+-- view exactly as it applies to the table (qa_scenarios_read: authenticated).
+-- The service-role key the generator uses bypasses RLS either way. anon gets no
+-- SELECT; it cannot read the table through RLS and has no use for the view.
+--
+-- ADDITIVE ONLY: a new view; no table, policy or existing grant is touched.
+-- =============================================================================
+
+CREATE OR REPLACE VIEW public.qa_scenario_category_counts
+WITH (security_invoker = true) AS
+SELECT
+    s.role_required,
+    CASE
+        WHEN position('-' IN s.name) > 0 THEN regexp_replace(split_part(s.name, '-', 1), '^\s+|\s+$', '', 'g')
+    END AS category_prefix,
+    count(*)::integer AS scenario_count
+FROM public.qa_scenarios s
+WHERE s.is_active = true
+  AND s.automated_only = false
+GROUP BY 1, 2;
+
+COMMENT ON VIEW public.qa_scenario_category_counts IS
+'Active manual QA scenarios per role and name prefix. Read by scripts/generate-qa-guide.py --aggregate.';
+
+REVOKE ALL ON public.qa_scenario_category_counts FROM anon;
+GRANT SELECT ON public.qa_scenario_category_counts TO authenticated, service_role;